@@ -3,20 +3,44 @@ from __future__ import annotations
 import inspect
 import importlib.util
 import logging
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+# Home Assistant is imported once the integration is set up, so the client, API
+# and parser can be used without it (see cli.py)
+from .core.client import CudyClient
+from .const import CONF_METRICS, CONF_USE_UBUS, CUDY_DEVICES, DOMAIN, PLATFORMS as DEFAULT_PLATFORMS
+from .model_detect import detect_model, fetch_system
 
-from . import registry
-from .client import CudyClient
-from .const import DOMAIN, PLATFORMS as DEFAULT_PLATFORMS
-from .model_detect import detect_model
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    # CONFIG_SCHEMA needs Home Assistant's config validation, built on first access
+    if name == "CONFIG_SCHEMA":
+        from homeassistant.helpers import config_validation as cv
+
+        schema = globals()["CONFIG_SCHEMA"] = cv.config_entry_only_config_schema(DOMAIN)
+        return schema
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    from .profiling import async_register_services
+
+    async_register_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    from . import registry
+    from .coordinator import async_load_snapshot
+    from .metrics import async_register_view
+
     protocol = entry.data.get("protocol", "http")
     use_https = protocol.lower() in ("https", "ssl", "tls")
 
@@ -25,13 +49,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data.get("username"),
         password=entry.data.get("password"),
         use_https=use_https,
+        use_ubus=bool(entry.options.get(CONF_USE_UBUS, False)),
     )
 
-    try:
-        model = await detect_model(client)
-    except Exception:
-        _LOGGER.debug("Model detection failed, falling back to Generic", exc_info=True)
-        model = "Generic"
+    # a snapshot from the previous run makes entities available without the router
+    snapshot = await async_load_snapshot(hass, entry)
+    if snapshot is not None and snapshot.get("model") not in CUDY_DEVICES:
+        snapshot = None
+
+    # the system page read for model detection also seeds the coordinator
+    system: dict[str, Any] | None = None
+    if snapshot is not None:
+        model = snapshot["model"]
+    else:
+        try:
+            system = await fetch_system(client)
+        except Exception:
+            _LOGGER.debug("Fetching system page failed", exc_info=True)
+
+        try:
+            model = await detect_model(client, system)
+        except Exception:
+            _LOGGER.debug("Model detection failed, falling back to Generic", exc_info=True)
+            model = "Generic"
 
     integration = await registry.create_model_integration(model, hass, entry, client)
 
@@ -53,21 +93,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.debug("Skipping missing platform module: %s.%s", __package__, platform)
     platforms = filtered
 
-    if hasattr(integration, "async_setup"):
+    if snapshot is not None and hasattr(integration, "async_restore"):
+        integration.async_restore(snapshot)
+    elif hasattr(integration, "async_setup"):
         try:
-            maybe_coro = integration.async_setup()
+            maybe_coro = integration.async_setup(system)
             if inspect.isawaitable(maybe_coro):
                 await maybe_coro
         except Exception:
             _LOGGER.exception("Error while running integration.async_setup()")
 
-    coordinator = getattr(integration, "coordinator", None)
-    if coordinator is not None and hasattr(coordinator, "async_config_entry_first_refresh"):
-        try:
-            await coordinator.async_config_entry_first_refresh()
-        except Exception:
-            _LOGGER.debug("Coordinator first refresh failed (continuing setup)", exc_info=True)
-
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "client": client,
         "integration": integration,
@@ -80,9 +115,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception:
         _LOGGER.exception("Failed to forward platforms for hass_cudy_router")
 
+    # entities for the remaining modules are added once this refresh lands
+    if hasattr(integration, "async_start"):
+        integration.async_start()
+
+    if entry.options.get(CONF_METRICS):
+        async_register_view(hass)
+
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply new options to the running coordinator instead of reloading the entry."""
+    if entry.options.get(CONF_METRICS):
+        from .metrics import async_register_view
+
+        async_register_view(hass)
+    data: dict[str, Any] | None = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    coordinator = (data or {}).get("coordinator")
+    if coordinator is None or not hasattr(coordinator, "async_apply_options"):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.async_apply_options(dict(entry.options))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     data: dict[str, Any] | None = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
     if not data:
@@ -106,4 +164,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             except Exception:
                 _LOGGER.debug("Error closing CudyClient", exc_info=True)
 
-    return True
\ No newline at end of file
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    from .coordinator import async_remove_snapshot
+
+    try:
+        await async_remove_snapshot(hass, entry)
+    except Exception:
+        _LOGGER.debug("Error removing Cudy snapshot", exc_info=True)
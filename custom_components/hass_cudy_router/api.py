@@ -1,17 +1,141 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import parse_qsl, urlsplit
 
 from aiohttp import ClientResponseError
 
-from .client import CudyClient
+from .capture import KIND_LIGHT, KIND_PAGE, KIND_XHR, ResponseCapture
+from .core.client import AuthenticationFailed, CudyClient, ResponseTooLarge, UnexpectedContent
 from .const import *
-from .parser import parse_html
+from .core.parser import (
+    XHR_ENDPOINTS,
+    extract_xhr_endpoints,
+    parse_html,
+    parse_module_by_sensors,
+    parse_xhr_fragments,
+)
+from .scheduler import AimdLimiter, CostModel, ErrorBudget
+from .core.tracing import PollTracer
+from .ubus import UBUS_MODULES, agrees_with_html, map_ubus_results, ubus_calls
+from .watchdog import LoopWatchdog
+
+_LOGGER = logging.getLogger(__name__)
+
+# Largest page read for a module; the device list grows with the number of clients
+MAX_BODY_BYTES = 512 * 1024
+MODULE_MAX_BODY_BYTES = {MODULE_DEVICE_LIST: 2 * 1024 * 1024}
+# failure recorded for a page without values, usually one the model does not have
+NO_DATA = "no data"
+
+
+def _max_bytes(module: str) -> int:
+    return MODULE_MAX_BODY_BYTES.get(module, MAX_BODY_BYTES)
+
+
+@dataclass
+class LightEndpoint:
+    """Lightweight poll endpoint serving the same values as a module's detail page."""
+
+    path: str
+    params: dict[str, str]
+    full_bytes: int = 0
+    light_bytes: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(self.full_bytes - self.light_bytes, 0)
+
+
+def _endpoint_key(path: str, params: dict[str, str]) -> tuple[str, frozenset]:
+    """Identify a status endpoint regardless of the detail flag."""
+    return path.rstrip("/"), frozenset((k, v) for k, v in params.items() if k != "detail")
+
+
+def _has_values(data: Any) -> bool:
+    if isinstance(data, list):
+        return len(data) > 0
+    if isinstance(data, dict):
+        return any(v is not None for v in data.values())
+    return False
+
+
+def _covers(full: Any, light: Any) -> bool:
+    """True if the light payload carries every value found on the full page."""
+    if isinstance(full, list) and isinstance(light, list):
+        return len(light) >= len(full)
+    if isinstance(full, dict) and isinstance(light, dict):
+        found = {k for k, v in full.items() if v is not None}
+        return found <= {k for k, v in light.items() if v is not None}
+    return False
 
 
 class CudyApi:
-    def __init__(self, client: CudyClient) -> None:
+    def __init__(
+        self,
+        client: CudyClient,
+        model: str | None = None,
+        tracer: PollTracer | None = None,
+        watchdog: LoopWatchdog | None = None,
+        capture: ResponseCapture | None = None,
+    ) -> None:
         self._client = client
+        self._model = model
+        self.tracer = tracer or PollTracer()
+        self.watchdog = watchdog or LoopWatchdog(model)
+        self.capture = capture or ResponseCapture()
+        # module -> {endpoint: {"args": ..., "mode": ...}} discovered from XHR shell pages
+        self._xhr_endpoints: dict[str, dict[str, dict[str, str]]] = {}
+        # module -> light poll endpoint; None until the overview page was inspected
+        self._light_candidates: dict[str, LightEndpoint] | None = None
+        self._light_endpoints: dict[str, LightEndpoint] = {}
+        self.bytes_saved = 0
+        # modules served through ubus; None until compared against the HTML pages
+        self._ubus_modules: set[str] | None = None
+        self.costs = CostModel()
+        self.limiter = AimdLimiter()
+        self.errors = ErrorBudget()
+        # module payloads fetched elsewhere (e.g. model detection), used by the next poll
+        self._prefetched: dict[str, Any] = {}
+        # modules left out of every poll (all of their entities are disabled)
+        self.skipped_modules: set[str] = set()
+        # last poll: response bytes read and CPU seconds spent parsing
+        self.poll_bytes: int | None = None
+        self.parse_time = 0.0
+
+    @property
+    def client(self) -> CudyClient:
+        return self._client
+
+    @property
+    def failed_modules(self) -> list[str]:
+        """Modules whose last fetch failed with an error (not just an empty page)."""
+        return sorted(
+            module for module, state in self.errors.modules.items() if state.last_error != NO_DATA
+        )
+
+    @property
+    def ubus_modules(self) -> set[str]:
+        return set(self._ubus_modules or ())
+
+    @property
+    def light_endpoints(self) -> dict[str, LightEndpoint]:
+        return dict(self._light_endpoints)
+
+    def set_use_ubus(self, enabled: bool) -> None:
+        """Switch ubus on or off; modules are matched again on the next poll."""
+        if bool(enabled) == bool(getattr(self._client, "use_ubus", False)):
+            return
+        self._client.use_ubus = enabled
+        self._ubus_modules = None
+
+    def prefetched(self, module: str, data: Any) -> None:
+        """Hand over an already parsed module so the next poll does not fetch it again."""
+        self._prefetched[module] = data
 
     @staticmethod
     def luci(path: str) -> str:
@@ -19,20 +143,322 @@ class CudyApi:
             path = "/" + path
         return "/cgi-bin/luci" + path
 
+    @classmethod
+    def xhr_path(cls, url: str) -> str:
+        """Normalize a cbi_xhr_load URL (possibly prefixed, e.g. by the emulator)."""
+        index = url.find("/cgi-bin/luci")
+        if index >= 0:
+            return url[index:]
+        return cls.luci(url)
+
     async def get_data(self) -> dict[str, Any]:
         out: dict[str, Any] = {}
 
+        if self._light_candidates is None:
+            await self._discover_light_endpoints()
+        self.bytes_saved = 0
+        self.parse_time = 0.0
+        received = getattr(self._client, "bytes_received", None)
+        self.capture.begin_poll()
+        ubus_data = await self._fetch_ubus_modules()
+
+        prefetched, self._prefetched = self._prefetched, {}
+        modules = [
+            m for m in CAPABILITY_URLS.keys()
+            if m not in ubus_data and m not in prefetched and m not in self.skipped_modules
+            and self.errors.allowed(m)
+        ]
+        results = await self._fetch_modules(self.costs.order(modules))
+        results.update(prefetched)
+
         for module in CAPABILITY_URLS.keys():
-            url = CAPABILITY_URLS[module][0]
-            try:
-                html = await self._client.get(self.luci(url))
-                if html is not None:
-                    data = parse_html(module, html)
-                    if len(data) > 0:
-                        out[module] = data
-            except ClientResponseError as err:
-                """No module detected"""
+            data = ubus_data[module] if module in ubus_data else results.get(module)
+            if data is not None and len(data) > 0:
+                out[module] = data
+
+        if self._ubus_modules is None and getattr(self._client, "use_ubus", False):
+            await self._detect_ubus_modules(out)
+
+        if received is not None:
+            self.poll_bytes = self._client.bytes_received - received
+        if self.bytes_saved:
+            _LOGGER.debug("Light poll endpoints saved %d bytes (%s)", self.bytes_saved, self._model)
         return out
 
+    async def _fetch_modules(self, modules: list[str]) -> dict[str, Any]:
+        """Fetch modules in the given order, at most ``limiter.limit`` at a time."""
+        semaphore = asyncio.Semaphore(self.limiter.limit)
+        results: dict[str, Any] = {}
+        ratios: list[float] = []
+
+        async def fetch(module: str) -> None:
+            timing: dict[str, float] = {}
+            async with semaphore:
+                started = time.monotonic()
+                try:
+                    with self.tracer.module(module):
+                        data = await self._fetch_module(module, timing)
+                except ClientResponseError as err:
+                    self._module_failed(module, f"HTTP {err.status}")
+                except ResponseTooLarge as err:
+                    _LOGGER.debug("Module %s (%s) response too large: %s", module, self._model, err)
+                    self._module_failed(module, "response too large")
+                except UnexpectedContent as err:
+                    _LOGGER.debug("Module %s (%s) is not a page: %s", module, self._model, err)
+                    self._module_failed(module, "unexpected content type")
+                except AuthenticationFailed:
+                    raise
+                except Exception as err:
+                    # timeouts, dropped connections and parser errors fail the module, not the poll
+                    _LOGGER.debug("Module %s (%s) failed: %r", module, self._model, err)
+                    self._module_failed(module, repr(err))
+                else:
+                    results[module] = data
+                    if data is None or (isinstance(data, dict) and not _has_values(data)):
+                        self._module_failed(module, NO_DATA)
+                    else:
+                        self.errors.on_success(module)
+                finally:
+                    if self.capture.enabled:
+                        self.capture.finish(
+                            module, time.monotonic() - started, timing.get("server_time")
+                        )
+            if "server_time" in timing:
+                ratios.append(self.costs.observe(module, timing["server_time"]))
+
+        tasks = [asyncio.create_task(fetch(module)) for module in modules]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # a failed or cancelled poll must not leave fetches running into the next one
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        limit = self.limiter.limit
+        if self.limiter.on_poll(ratios) != limit:
+            _LOGGER.debug(
+                "Concurrent requests for %s: %d -> %d", self._model, limit, self.limiter.limit
+            )
+        return results
+
+    def _module_failed(self, module: str, error: str) -> None:
+        delay = self.errors.on_failure(module, error)
+        if delay:
+            _LOGGER.debug(
+                "Module %s (%s) failed %d times (%s), retrying in %.0fs",
+                module,
+                self._model,
+                self.errors.modules[module].failures,
+                error,
+                delay,
+            )
+
+    async def _detect_ubus_modules(self, html_data: dict[str, Any]) -> None:
+        """Serve a module through ubus only if it reproduces the scraped values."""
+        self._ubus_modules = set()
+        candidates = [m for m in UBUS_MODULES if m in html_data]
+        if not candidates:
+            return
+        try:
+            results = await self._client.ubus_batch(ubus_calls(candidates))
+        except Exception as err:
+            _LOGGER.debug("ubus not available (%s): %s", self._model, err)
+            return
+
+        for module, data in map_ubus_results(candidates, results).items():
+            if agrees_with_html(html_data[module], data):
+                self._ubus_modules.add(module)
+        _LOGGER.debug("Modules read through ubus for %s: %s", self._model, sorted(self._ubus_modules))
+
+    async def _fetch_ubus_modules(self) -> dict[str, Any]:
+        modules = sorted(self._ubus_modules - self.skipped_modules) if self._ubus_modules else []
+        if not modules:
+            return {}
+        try:
+            results = await self._client.ubus_batch(ubus_calls(modules))
+        except Exception as err:
+            _LOGGER.debug("ubus batch failed, using HTML pages: %s", err)
+            return {}
+
+        out: dict[str, Any] = {}
+        for module, data in map_ubus_results(modules, results).items():
+            if not _has_values(data):
+                _LOGGER.debug("ubus returned no data for %s, using HTML page", module)
+                self._ubus_modules.discard(module)
+                continue
+            # keep the module's key set identical to the HTML parser output
+            payload = parse_module_by_sensors(module, "")
+            payload.update({k: v for k, v in data.items() if k in payload})
+            out[module] = payload
+        return out
+
+    async def _discover_light_endpoints(self) -> None:
+        """Map the overview's poll-mode cbi_xhr_load endpoints to modules."""
+        self._light_candidates = {}
+        try:
+            html = await self._client.get(self.luci(OVERVIEW_URL))
+        except Exception as err:
+            _LOGGER.debug("Overview page not available (%s): %s", self._model, err)
+            return
+        if not isinstance(html, str) or not html:
+            return
+
+        by_key: dict[tuple[str, frozenset], str] = {}
+        for module, urls in CAPABILITY_URLS.items():
+            for url in urls:
+                parts = urlsplit(url)
+                params = dict(parse_qsl(parts.query, keep_blank_values=True))
+                by_key.setdefault(_endpoint_key(self.luci(parts.path), params), module)
+
+        for url, spec in extract_xhr_endpoints(html).items():
+            if spec.get("mode") != "poll":
+                continue
+            path = self.xhr_path(url)
+            params = dict(parse_qsl(spec.get("args", ""), keep_blank_values=True))
+            module = by_key.get(_endpoint_key(path, params))
+            if module is not None and module not in self._light_candidates:
+                self._light_candidates[module] = LightEndpoint(path=path, params=params)
+
+        _LOGGER.debug(
+            "Light poll endpoint candidates for %s: %s",
+            self._model,
+            sorted(self._light_candidates),
+        )
+
+    async def _fetch_module(self, module: str, timing: dict[str, float]) -> Any:
+        light = self._light_endpoints.get(module)
+        if light is not None:
+            try:
+                html = await self._get(
+                    module,
+                    KIND_LIGHT,
+                    light.path,
+                    params=light.params,
+                    timing=timing,
+                    max_bytes=_max_bytes(module),
+                )
+            except AuthenticationFailed:
+                raise
+            except Exception as err:
+                # e.g. removed by a firmware update; the detail page still works
+                _LOGGER.debug("Light endpoint for %s failed (%s), using HTML page", module, err)
+                timing.clear()
+            else:
+                data = self._parse(
+                    parse_xhr_fragments, module, [html if isinstance(html, str) else ""]
+                )
+                if _has_values(data):
+                    self.bytes_saved += light.bytes_saved
+                    return data
+                _LOGGER.debug("Light endpoint for %s returned no data, using HTML page", module)
+            self._light_endpoints.pop(module, None)
+
+        endpoints = self._xhr_endpoints.get(module)
+        if endpoints is None:
+            url = CAPABILITY_URLS[module][0]
+            html = await self._get(
+                module, KIND_PAGE, self.luci(url), timing=timing, max_bytes=_max_bytes(module)
+            )
+            if html is None:
+                return None
+            data = self._parse(parse_html, module, html)
+            if not isinstance(data, dict) or XHR_ENDPOINTS not in data:
+                await self._probe_light_endpoint(module, html, data)
+                return data
+            endpoints = data[XHR_ENDPOINTS]
+            self._xhr_endpoints[module] = endpoints
+            _LOGGER.debug(
+                "Module %s (%s) is an XHR shell, caching %d endpoint(s)",
+                module,
+                self._model,
+                len(endpoints),
+            )
+
+        return await self._fetch_xhr_fragments(module, endpoints, timing)
+
+    async def _get(self, module: str, kind: str, path: str, **kwargs: Any) -> Any:
+        """GET a page of ``module``, keeping the response when capturing."""
+        body = await self._client.get(path, expect_html=True, **kwargs)
+        if self.capture.enabled:
+            self.capture.response(module, kind, path, kwargs.get("params"), body)
+        return body
+
+    def _parse(self, parser: Callable[[str, Any], Any], module: str, content: Any) -> Any:
+        """Run a parser, counting its CPU time towards the poll."""
+        started = time.thread_time()
+        try:
+            with self.tracer.span("parse"), self.watchdog.section("parse", module):
+                return parser(module, content)
+        finally:
+            self.parse_time += time.thread_time() - started
+
+    async def _probe_light_endpoint(self, module: str, html: str, data: Any) -> None:
+        """Adopt a candidate light endpoint once it proved to carry the same values."""
+        candidate = (self._light_candidates or {}).pop(module, None)
+        if candidate is None or not _has_values(data):
+            return
+        try:
+            light_html = await self._get(
+                module, KIND_LIGHT, candidate.path, params=candidate.params, max_bytes=_max_bytes(module)
+            )
+        except Exception as err:
+            _LOGGER.debug("Light endpoint for %s failed: %s", module, err)
+            return
+        if not isinstance(light_html, str) or not light_html:
+            return
+        if not _covers(data, parse_xhr_fragments(module, [light_html])):
+            _LOGGER.debug("Light endpoint for %s lacks values, keeping HTML page", module)
+            return
+
+        candidate.full_bytes = len(html.encode())
+        candidate.light_bytes = len(light_html.encode())
+        self._light_endpoints[module] = candidate
+        _LOGGER.debug(
+            "Polling %s via %s (%d -> %d bytes)",
+            module,
+            candidate.path,
+            candidate.full_bytes,
+            candidate.light_bytes,
+        )
+
+    async def _fetch_xhr_fragments(
+        self,
+        module: str,
+        endpoints: dict[str, dict[str, str]],
+        timing: dict[str, float] | None = None,
+    ) -> Any:
+        timings: list[dict[str, float]] = [{} for _ in endpoints]
+        results = await asyncio.gather(
+            *(
+                self._get(
+                    module,
+                    KIND_XHR,
+                    self.xhr_path(url),
+                    params=dict(parse_qsl(spec.get("args", ""), keep_blank_values=True)),
+                    timing=fragment_timing,
+                    max_bytes=_max_bytes(module),
+                )
+                for (url, spec), fragment_timing in zip(endpoints.items(), timings)
+            ),
+            return_exceptions=True,
+        )
+        server_times = [t["server_time"] for t in timings if "server_time" in t]
+        if timing is not None and server_times:
+            timing["server_time"] = max(server_times)
+
+        fragments: list[str] = []
+        for url, result in zip(endpoints, results):
+            if isinstance(result, AuthenticationFailed):
+                raise result
+            if isinstance(result, BaseException):
+                _LOGGER.debug("XHR fragment %s for %s failed: %s", url, module, result)
+                continue
+            if isinstance(result, str):
+                fragments.append(result)
+
+        return self._parse(parse_xhr_fragments, module, fragments)
+
     async def reboot(self) -> None:
-        await self._client.post(self.luci("/admin/system/reboot"), data={"reboot": "1"})
\ No newline at end of file
+        await self._client.post(self.luci("/admin/system/reboot"), data={"reboot": "1"})
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import base64
+import re
+import zlib
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+# module fetches kept per module
+MAX_CAPTURES = 5
+REDACTED = "**REDACTED**"
+
+# how a response was requested; decides the parser used on replay
+KIND_PAGE = "page"
+KIND_LIGHT = "light"
+KIND_XHR = "xhr"
+
+# session tokens in cookies, URLs, scripts and JSON
+_TOKEN_RE = re.compile(
+    r"((?:sysauth|stok|token|csrf_token|ubus_rpc_session)[\"']?\s*[=:]\s*[\"']?)([^\"'&;,\s<>]+)",
+    re.IGNORECASE,
+)
+# values of password and key inputs (wifi keys, PPPoE/VPN passwords)
+_SECRET_INPUT_RE = re.compile(
+    r"(<input\b[^>]*?\b(?:type=[\"']?password|name=[\"'][^\"']*(?:pass|psk|key|secret|token)[^\"']*[\"'])"
+    r"[^>]*?\bvalue=)([\"'])(.*?)\2",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def redact(text: str, secrets: tuple[str, ...] = ()) -> str:
+    """Remove session tokens, password inputs and the given secrets from a response."""
+    for secret in secrets:
+        if secret and len(secret) >= 4:
+            text = text.replace(secret, REDACTED)
+    text = _TOKEN_RE.sub(lambda m: m.group(1) + REDACTED, text)
+    return _SECRET_INPUT_RE.sub(lambda m: f"{m.group(1)}{m.group(2)}{REDACTED}{m.group(2)}", text)
+
+
+def decode_body(data: str) -> str:
+    """Body of an exported response (base64 of zlib-compressed UTF-8)."""
+    return zlib.decompress(base64.b64decode(data)).decode("utf-8")
+
+
+class ResponseCapture:
+    """Redacted, compressed raw responses of the last fetches of each module.
+
+    Meant for reproducing parser breakage after a firmware update offline (see
+    ``tests/cudy_router/replay.py``). Disabling the capture drops what was kept.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_captures: int = MAX_CAPTURES,
+        secrets: tuple[str, ...] = (),
+    ) -> None:
+        self._enabled = enabled
+        self.max_captures = max_captures
+        # credentials replaced wherever a router echoes them back
+        self.secrets = secrets
+        self.poll = 0
+        self.captures: dict[str, deque[dict[str, Any]]] = {}
+        # module -> responses of the fetch in progress
+        self._pending: dict[str, list[dict[str, Any]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+        if not enabled:
+            self.captures.clear()
+            self._pending.clear()
+
+    def begin_poll(self) -> None:
+        self.poll += 1
+
+    def response(
+        self, module: str, kind: str, path: str, params: dict[str, str] | None, body: Any
+    ) -> None:
+        """Keep one response of ``module``'s current fetch."""
+        if not self._enabled or not isinstance(body, str):
+            return
+        text = redact(body, self.secrets)
+        self._pending.setdefault(module, []).append(
+            {
+                "kind": kind,
+                "path": path,
+                "params": dict(params or {}),
+                "bytes": len(body.encode()),
+                "body": zlib.compress(text.encode(), 6),
+            }
+        )
+
+    def finish(self, module: str, elapsed: float, server_time: float | None = None) -> None:
+        """Close ``module``'s fetch, keeping it with its timing in the ring buffer."""
+        responses = self._pending.pop(module, None)
+        if not self._enabled or not responses:
+            return
+        self.captures.setdefault(module, deque(maxlen=self.max_captures)).append(
+            {
+                "poll": self.poll,
+                "fetched": datetime.now(timezone.utc).isoformat(),
+                "elapsed_ms": round(elapsed * 1000, 2),
+                "server_ms": round(server_time * 1000, 2) if server_time is not None else None,
+                "responses": responses,
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enabled": self._enabled,
+            "max_captures": self.max_captures,
+            "modules": {
+                module: [
+                    {
+                        **fetch,
+                        "responses": [
+                            {**r, "body": base64.b64encode(r["body"]).decode("ascii")}
+                            for r in fetch["responses"]
+                        ],
+                    }
+                    for fetch in fetches
+                ]
+                for module, fetches in self.captures.items()
+            },
+        }
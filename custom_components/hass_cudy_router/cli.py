@@ -0,0 +1,284 @@
+"""Poll Cudy routers without Home Assistant, streaming NDJSON.
+
+    python -m custom_components.hass_cudy_router.cli routers.json [--output polls.ndjson]
+
+``routers.json``::
+
+    {
+      "scan_interval": 30,
+      "routers": [
+        {"name": "office", "host": "192.168.10.1", "username": "admin", "password": "..."},
+        {"name": "home", "host": "192.168.1.1", "password": "...", "protocol": "https", "model": "WR3000"}
+      ]
+    }
+
+Every poll writes one record per module: ``ts``, ``router``, ``model``,
+``poll``, ``module`` and either ``data`` or ``error``. Records go to stdout, or
+to ``--output`` which rotates at ``--max-bytes``. Writers that fall behind
+slow the pollers down instead of growing memory.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, TextIO
+
+from .api import NO_DATA, CudyApi
+from .core.client import CudyClient
+from .const import CUDY_DEVICES, DEFAULT_SCAN_INTERVAL, MODULE_SYSTEM
+from .model_detect import detect_model, fetch_system
+
+_LOGGER = logging.getLogger(__name__)
+
+# records buffered between the pollers and the writer
+QUEUE_SIZE = 1000
+# records written per write call
+WRITE_BATCH = 200
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+
+@dataclass
+class RouterConfig:
+    name: str
+    host: str
+    password: str
+    username: str = "admin"
+    protocol: str = "http"
+    model: str | None = None
+    scan_interval: float = DEFAULT_SCAN_INTERVAL
+    use_ubus: bool = False
+
+
+@dataclass
+class Config:
+    routers: list[RouterConfig] = field(default_factory=list)
+
+
+def load_config(path: str | Path) -> Config:
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    interval = float(raw.get("scan_interval", DEFAULT_SCAN_INTERVAL))
+    routers = []
+    for index, router in enumerate(raw.get("routers") or []):
+        if not router.get("host") or router.get("password") is None:
+            raise ValueError(f"Router {index} needs a host and a password")
+        routers.append(
+            RouterConfig(
+                name=str(router.get("name") or router["host"]),
+                host=router["host"],
+                password=router["password"],
+                username=router.get("username", "admin"),
+                protocol=router.get("protocol", "http"),
+                model=router.get("model"),
+                scan_interval=float(router.get("scan_interval", interval)),
+                use_ubus=bool(router.get("use_ubus", False)),
+            )
+        )
+    if not routers:
+        raise ValueError("No routers configured")
+    return Config(routers=routers)
+
+
+class NdjsonSink:
+    """Line-oriented output: stdout, or a file rotated like logging's RotatingFileHandler."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._stream: TextIO = self._open() if self.path else sys.stdout
+
+    def _open(self) -> TextIO:
+        return open(self.path, "a", encoding="utf-8")
+
+    def write(self, lines: list[str]) -> None:
+        """Write and flush lines; blocking, run it in an executor."""
+        self._stream.write("".join(f"{line}\n" for line in lines))
+        self._stream.flush()
+        if self.path and self.max_bytes and self._stream.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._stream.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = Path(f"{self.path}.{index}")
+            if older.exists():
+                os.replace(older, f"{self.path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            self.path.unlink()
+        self._stream = self._open()
+
+    def close(self) -> None:
+        if self.path:
+            self._stream.close()
+
+
+def _record(router: str, model: str | None, poll: int, module: str | None, **values: Any) -> str:
+    return json.dumps(
+        {
+            "ts": datetime.now(timezone.utc).isoformat(),
+            "router": router,
+            "model": model,
+            "poll": poll,
+            "module": module,
+            **values,
+        },
+        default=str,
+        ensure_ascii=False,
+    )
+
+
+class Poller:
+    """Polls one router on its interval, queueing one record per module."""
+
+    def __init__(self, config: RouterConfig, queue: asyncio.Queue[str]) -> None:
+        self.config = config
+        self.queue = queue
+        self.client = CudyClient(
+            host=config.host,
+            username=config.username,
+            password=config.password,
+            use_https=config.protocol.lower() in ("https", "ssl", "tls"),
+            use_ubus=config.use_ubus,
+        )
+        self.model = config.model
+        self.api: CudyApi | None = None
+        self.polls = 0
+
+    async def _setup(self) -> CudyApi:
+        system = None
+        if self.model is None:
+            system = await fetch_system(self.client)
+            self.model = await detect_model(self.client, system)
+        if self.model not in CUDY_DEVICES:
+            raise ValueError(f"Unsupported Cudy model: {self.model}")
+        api = CudyApi(self.client, self.model)
+        if system:
+            api.prefetched(MODULE_SYSTEM, system)
+        return api
+
+    async def poll(self) -> None:
+        self.polls += 1
+        name = self.config.name
+        started = time.monotonic()
+        try:
+            if self.api is None:
+                self.api = await self._setup()
+            data = await self.api.get_data()
+        except Exception as err:
+            _LOGGER.debug("Polling %s failed", name, exc_info=True)
+            await self.queue.put(_record(name, self.model, self.polls, None, error=repr(err)))
+            return
+
+        model = self.model
+        duration_ms = round((time.monotonic() - started) * 1000, 1)
+        for module, values in data.items():
+            await self.queue.put(
+                _record(name, model, self.polls, module, duration_ms=duration_ms, data=values)
+            )
+        for module, state in self.api.errors.modules.items():
+            if module not in data and state.last_error not in (None, NO_DATA):
+                await self.queue.put(
+                    _record(name, model, self.polls, module, error=state.last_error)
+                )
+
+    async def run(self, once: bool = False) -> None:
+        try:
+            while True:
+                started = time.monotonic()
+                await self.poll()
+                if once:
+                    return
+                await asyncio.sleep(max(self.config.scan_interval - (time.monotonic() - started), 0))
+        finally:
+            await self.client.async_close()
+
+
+async def _write(queue: asyncio.Queue[str | None], sink: NdjsonSink) -> None:
+    """Drain the queue in batches, writing off the event loop."""
+    loop = asyncio.get_running_loop()
+    done = False
+    while not done:
+        batch = [await queue.get()]
+        while len(batch) < WRITE_BATCH and not queue.empty():
+            batch.append(queue.get_nowait())
+        if batch[-1] is None:
+            done = True
+        lines = [line for line in batch if line is not None]
+        if lines:
+            await loop.run_in_executor(None, sink.write, lines)
+
+
+async def run(config: Config, sink: NdjsonSink, once: bool = False) -> None:
+    queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    writer = asyncio.create_task(_write(queue, sink))
+    pollers = [asyncio.create_task(Poller(router, queue).run(once)) for router in config.routers]
+
+    def stop(*_args: Any) -> None:
+        for task in pollers:
+            task.cancel()
+
+    # a failed writer (e.g. closed pipe) stops the pollers instead of blocking them
+    writer.add_done_callback(stop)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop)
+        except (NotImplementedError, RuntimeError):
+            pass
+    try:
+        await asyncio.gather(*pollers, return_exceptions=True)
+    finally:
+        # whatever was queued is still written
+        if not writer.done():
+            await queue.put(None)
+        try:
+            await writer
+        finally:
+            sink.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("config", type=Path, help="JSON file listing the routers")
+    parser.add_argument("--output", type=Path, help="NDJSON file instead of stdout")
+    parser.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help="rotate the output at this size")
+    parser.add_argument("--backups", type=int, default=DEFAULT_BACKUPS, help="rotated files kept")
+    parser.add_argument("--once", action="store_true", help="poll every router once and exit")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    try:
+        config = load_config(args.config)
+    except (OSError, ValueError) as err:
+        print(f"Invalid config {args.config}: {err}", file=sys.stderr)
+        return 2
+
+    sink = NdjsonSink(args.output, args.max_bytes, args.backups)
+    asyncio.run(run(config, sink, once=args.once))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,8 +16,17 @@ from homeassistant.const import (
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-from .client import CudyClient
-from .const import DOMAIN, MODULE_DEVICE_LIST
+from .core.client import CudyClient
+from .const import (
+    CONF_CAPTURE,
+    CONF_METRICS,
+    CONF_TRACK_ALL,
+    CONF_TRACING,
+    CONF_USE_UBUS,
+    CONF_WATCHDOG,
+    DOMAIN,
+    MODULE_DEVICE_LIST,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -138,6 +147,30 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         MODULE_DEVICE_LIST,
                         default=self._config_entry.options.get(MODULE_DEVICE_LIST, ""),
                     ): str,
+                    vol.Optional(
+                        CONF_TRACK_ALL,
+                        default=self._config_entry.options.get(CONF_TRACK_ALL, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_USE_UBUS,
+                        default=self._config_entry.options.get(CONF_USE_UBUS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRACING,
+                        default=self._config_entry.options.get(CONF_TRACING, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_METRICS,
+                        default=self._config_entry.options.get(CONF_METRICS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_WATCHDOG,
+                        default=self._config_entry.options.get(CONF_WATCHDOG, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_CAPTURE,
+                        default=self._config_entry.options.get(CONF_CAPTURE, False),
+                    ): bool,
                 }
             ),
         )
\ No newline at end of file
@@ -1,18 +1,75 @@
 from __future__ import annotations
 
 import logging
+import math
+import re
+import time
+from collections import deque
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import *
+from .core.tracing import PollTracer
+from .watchdog import LoopWatchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+SNAPSHOT_STORAGE_VERSION = 1
+# the snapshot is written at most this often (and once more when HA stops)
+SNAPSHOT_SAVE_DELAY = 300
+# polls the duration percentile is computed over
+POLL_STATS_WINDOW = 20
+
+
+def normalize_mac(mac: Any) -> str:
+    """Lowercase MAC without separators, so AA:BB.., aa-bb.. and aabb.. compare equal."""
+    return re.sub(r"[^0-9a-f]", "", str(mac or "").lower())
+
+
+def parse_tracked_macs(value: Any) -> set[str]:
+    """Parse the tracked-MAC option; an empty value tracks nothing."""
+    if isinstance(value, (list, tuple, set)):
+        items = list(value)
+    else:
+        items = re.split(r"[\s,;]+", str(value or ""))
+    macs = {normalize_mac(item) for item in items}
+    macs.discard("")
+    return macs
+
+
+def tracked_macs_option(options: dict[str, Any]) -> set[str] | None:
+    """MACs to track, or None when every device is tracked (explicit opt-in)."""
+    if options.get(CONF_TRACK_ALL, False):
+        return None
+    return parse_tracked_macs(options.get(MODULE_DEVICE_LIST))
+
+
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+async def async_load_snapshot(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any] | None:
+    """Return the last persisted coordinator snapshot ({model, saved, data}), if any."""
+    try:
+        snapshot = await _snapshot_store(hass, entry).async_load()
+    except Exception:
+        _LOGGER.debug("Could not load Cudy snapshot", exc_info=True)
+        return None
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("data"), dict):
+        return None
+    return snapshot
+
+
+async def async_remove_snapshot(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await _snapshot_store(hass, entry).async_remove()
+
 
 def _discover_available_sensor_keys(parsed: dict) -> tuple[set[str], set[str]]:
     available_sensors: set[str] = set()
@@ -43,6 +100,9 @@ class CudyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         entry: ConfigEntry,
         api: Any,
         host: str | None = None,
+        model: str | None = None,
+        tracer: PollTracer | None = None,
+        watchdog: LoopWatchdog | None = None,
     ) -> None:
         options = getattr(entry, "options", None) or {}
         scan_seconds = int(options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
@@ -56,23 +116,133 @@ class CudyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
 
         self.api = api
+        self.model = model
         self.data: dict[str, Any] = {}
+        # True while serving a restored snapshot that no refresh has confirmed yet
+        self.stale = False
+        # normalized MACs of the devices to track; None tracks every device
+        self.tracked_macs = tracked_macs_option(options if isinstance(options, dict) else {})
+        # a poll is traced from the request to the listeners' state writes
+        self.tracer = tracer or PollTracer()
+        # times the listeners' state writes; entities time their own attribute builds
+        self.watchdog = watchdog or LoopWatchdog(model)
+        # wall time of the recent polls, failed ones included
+        self.poll_durations: deque[float] = deque(maxlen=POLL_STATS_WINDOW)
+        self.poll_count = 0
+
+        self._store = _snapshot_store(hass, entry)
+        self._snapshot_scheduled = False
+
+    @callback
+    def async_restore_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Serve persisted data (marked stale) until the first refresh succeeds."""
+        self.stale = True
+        self.async_set_updated_data(snapshot["data"])
+
+    @callback
+    def async_apply_options(self, options: dict[str, Any]) -> None:
+        """Apply changed options to the running coordinator without a reload.
+
+        Entities are re-synced through the listeners from the data already held,
+        so nothing is requested from the router here.
+        """
+        scan_seconds = int(options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+        interval = timedelta(seconds=scan_seconds)
+        if interval != self.update_interval:
+            self.update_interval = interval
+            # replace the pending refresh scheduled with the old interval
+            if self._listeners:
+                self._schedule_refresh()
+
+        set_use_ubus = getattr(self.api, "set_use_ubus", None)
+        if callable(set_use_ubus):
+            set_use_ubus(bool(options.get(CONF_USE_UBUS, False)))
+
+        self.tracked_macs = tracked_macs_option(options)
+        self.tracer.enabled = bool(options.get(CONF_TRACING, False))
+        self.watchdog.enabled = bool(options.get(CONF_WATCHDOG, False))
+        capture = getattr(self.api, "capture", None)
+        if capture is not None:
+            capture.enabled = bool(options.get(CONF_CAPTURE, False))
+        self.async_update_listeners()
+
+    def performance(self) -> dict[str, Any]:
+        """Health of the recent polls, read by the diagnostic sensors."""
+        api = self.api
+        client = getattr(api, "client", None)
+        failed = getattr(api, "failed_modules", None)
+        durations = sorted(self.poll_durations)
+        p95 = durations[max(math.ceil(0.95 * len(durations)), 1) - 1] if durations else None
+        return {
+            PERF_POLL_DURATION: _ms(self.poll_durations[-1]) if durations else None,
+            PERF_POLL_DURATION_P95: _ms(p95),
+            PERF_POLL_BYTES: getattr(api, "poll_bytes", None),
+            PERF_PARSE_TIME: _ms(getattr(api, "parse_time", None)),
+            PERF_LOGINS: (getattr(client, "session_stats", None) or {}).get("logins"),
+            PERF_FAILED_MODULES: len(failed) if failed is not None else None,
+            PERF_SCAN_INTERVAL: (
+                self.update_interval.total_seconds() if self.update_interval else None
+            ),
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the entities, timed as the dispatch stage of a traced poll."""
+        with self.watchdog.section("dispatch"):
+            if not self.tracer.active:
+                super().async_update_listeners()
+                return
+            with self.tracer.span("dispatch", listeners=len(self._listeners)):
+                super().async_update_listeners()
+        self.tracer.finish()
+
+    @callback
+    def _async_schedule_snapshot(self) -> None:
+        if self._snapshot_scheduled:
+            return
+        self._snapshot_scheduled = True
+        self._store.async_delay_save(self._snapshot_data, SNAPSHOT_SAVE_DELAY)
+
+    def _snapshot_data(self) -> dict[str, Any]:
+        self._snapshot_scheduled = False
+        return {
+            "model": self.model,
+            "saved": dt_util.utcnow().isoformat(),
+            "data": self.data,
+        }
 
     async def _async_update_data(self) -> dict[str, Any]:
         if not self.api:
             raise UpdateFailed("No API client set on coordinator")
 
+        self.tracer.begin()
+        started = time.monotonic()
         try:
             result = await self.api.get_data()
             if result is None:
                 result = {}
             if not isinstance(result, dict):
                 raise UpdateFailed("API.get_data returned non-dict result")
+            if not result and self.data:
+                # keep serving the last data instead of wiping every entity
+                raise UpdateFailed("Router returned no module data")
 
             self.data = result
+            self.stale = False
+            if result:
+                self._async_schedule_snapshot()
             return result
-        except UpdateFailed:
+        except UpdateFailed as err:
+            self.tracer.finish(error=str(err))
             raise
         except Exception as err:
+            self.tracer.finish(error=repr(err))
             _LOGGER.debug("Error updating Cudy data: %s", err, exc_info=True)
-            raise UpdateFailed(err) from err
\ No newline at end of file
+            raise UpdateFailed(err) from err
+        finally:
+            self.poll_count += 1
+            self.poll_durations.append(time.monotonic() - started)
+
+
+def _ms(seconds: float | None) -> float | None:
+    return round(seconds * 1000, 1) if seconds is not None else None
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""Client, parser and router tables, usable without Home Assistant.
+
+Nothing here imports ``homeassistant``; bs4 is imported on the first parse.
+"""
@@ -0,0 +1,130 @@
+"""Supported models and the LuCI pages each module is read from."""
+from .const import *
+
+CUDY_DEVICES = [
+    "AP11000",
+    "AP1200",
+    "AP1200-Outdoor",
+    "AP1300",
+    "AP1300-Outdoor",
+    "AP1300D",
+    "AP1300Wall",
+    "AP3000",
+    "AP3000-Outdoor",
+    "AP3000D",
+    "AP3000Wall",
+    "AP3600",
+    "C200P",
+    "IR02",
+    "IR04",
+    "LT15E",
+    "LT18",
+    "LT300",
+    "LT300V3",
+    "LT400",
+    "LT400-Outdoor",
+    "LT400E",
+    "LT400V",
+    "LT500",
+    "LT500-Outdoor",
+    "LT500E",
+    "LT700-Outdoor",
+    "LT700E",
+    "LT700V",
+    "M11000",
+    "M1200",
+    "M1300",
+    "M1500",
+    "M1800",
+    "M3000",
+    "M3600",
+    "P2",
+    "P4",
+    "P5",
+    "R700",
+    "RE1200",
+    "RE1200-Outdoor",
+    "RE1500",
+    "RE1800",
+    "RE3000",
+    "RE3600",
+    "TR1200",
+    "TR3000",
+    "WR11000",
+    "WR1200",
+    "WR1200E",
+    "WR1300",
+    "WR1300E",
+    "WR1300EV2",
+    "WR1300S",
+    "WR1300V4.0",
+    "WR1500",
+    "WR300",
+    "WR3000",
+    "WR3000E",
+    "WR3000P",
+    "WR3000S",
+    "WR300S",
+    "WR3600",
+    "WR3600E",
+    "WR3600H",
+    "WR6500",
+    "WR6500H",
+    "X6",
+]
+
+# LuCI landing page; lists the light cbi_xhr_load poll endpoints of the status panels
+OVERVIEW_URL = "/"
+
+CAPABILITY_URLS = {
+    MODULE_SYSTEM: [
+        "/admin/system/status?detail=1",
+        "/admin/system/status/detail/1",
+    ],
+    MODULE_LAN: [
+        "/admin/network/lan/status?detail=1",
+    ],
+    MODULE_DHCP: [
+        "/admin/services/dhcp/status?detail=1",
+    ],
+    MODULE_DEVICES: [
+        "/admin/network/devices/status?detail=1",
+    ],
+    MODULE_WAN: [
+        "/admin/network/wan/iface/wan/status?detail=1",
+        "/admin/network/wan/status?detail=1",
+    ],
+    MODULE_WAN_SECONDARY: [
+        "/admin/network/wan/iface/wand/status?detail=1",
+    ],
+    MODULE_MULTI_WAN: [
+        "/admin/network/mwan3/status?detail=1",
+    ],
+    MODULE_MESH: [
+        "/admin/network/mesh/status?detail=1",
+    ],
+    MODULE_VPN: [
+        "/admin/network/vpn/status?detail=1",
+    ],
+    MODULE_WIRELESS_5G: [
+        "/admin/network/wireless/status?detail=1&iface=wlan10",
+    ],
+    MODULE_WIRELESS_24G: [
+        "/admin/network/wireless/status?detail=1&iface=wlan00",
+    ],
+    MODULE_WIRELESS_6G: [
+        "/admin/network/wireless/status?detail=1&iface=wlan20",
+    ],
+    MODULE_GSM: [
+        "/admin/network/gcom/iface/4g/status?detail=1",
+    ],
+    MODULE_SMS: [
+        "/admin/network/gcom/sms/iface/4g/status?detail=1",
+    ],
+    MODULE_USB: [
+        "/admin/services/usb/status?detail=1",
+    ],
+    MODULE_DEVICE_LIST: [
+        "/admin/network/devices/devlist?detail=1",
+    ],
+}
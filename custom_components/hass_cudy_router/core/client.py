@@ -0,0 +1,748 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json as json_module
+import logging
+import time
+from http.cookies import SimpleCookie
+from types import SimpleNamespace
+from typing import Any, Optional
+from urllib.parse import quote_plus
+
+import aiohttp
+from aiohttp import ClientSession, TCPConnector
+
+from .tracing import PollTracer
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+# Largest response body read by default; module pages are far below this
+DEFAULT_MAX_BODY_BYTES = 4 * 1024 * 1024
+READ_CHUNK_SIZE = 16 * 1024
+# A login form within the first bytes means the session was dropped
+LOGIN_SNIFF_BYTES = 16 * 1024
+_LOGIN_MARKER = b'name="luci_password"'
+# Content types a LuCI page or fragment is served with
+HTML_CONTENT_TYPES = ("text/", "application/xhtml+xml")
+# Seconds a GET response may be handed to identical GETs issued right after it
+DEFAULT_REUSE_WINDOW = 2.0
+
+UBUS_PATH = "/ubus"
+# rpcd "Access denied" - the ubus session (== LuCI sysauth) is not valid
+UBUS_ACCESS_DENIED = -32002
+
+# Refresh a session once this share of its learned lifetime has passed
+SESSION_REFRESH_FACTOR = 0.9
+# Expiries observed on younger sessions are not taken as the router's lifetime
+MIN_SESSION_LIFETIME = 10.0
+# Number of observed expiries the lifetime estimate is based on
+SESSION_LIFETIME_SAMPLES = 5
+
+
+class ResponseTooLarge(Exception):
+    """The response body exceeded the allowed size."""
+
+
+class UnexpectedContent(Exception):
+    """A page was expected but the response declared another content type."""
+
+
+class AuthenticationFailed(RuntimeError):
+    """The router rejected the credentials."""
+
+
+class _LoginPageReturned(Exception):
+    """The router answered with its login form instead of the requested page."""
+
+
+def _timing_trace_config() -> aiohttp.TraceConfig:
+    """Trace hooks accumulating connection setup time (DNS + TCP + TLS) per request.
+
+    DNS resolution, which happens within connection setup, is also kept apart.
+    """
+
+    async def on_connection_create_start(session, ctx, params) -> None:
+        request_ctx = ctx.trace_request_ctx
+        if isinstance(request_ctx, SimpleNamespace):
+            request_ctx.connect_start = time.monotonic()
+
+    async def on_connection_create_end(session, ctx, params) -> None:
+        request_ctx = ctx.trace_request_ctx
+        start = getattr(request_ctx, "connect_start", None)
+        if start is not None:
+            request_ctx.connect += time.monotonic() - start
+
+    async def on_dns_resolvehost_start(session, ctx, params) -> None:
+        request_ctx = ctx.trace_request_ctx
+        if isinstance(request_ctx, SimpleNamespace):
+            request_ctx.dns_start = time.monotonic()
+
+    async def on_dns_resolvehost_end(session, ctx, params) -> None:
+        request_ctx = ctx.trace_request_ctx
+        start = getattr(request_ctx, "dns_start", None)
+        if start is not None:
+            request_ctx.dns += time.monotonic() - start
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    return trace_config
+
+
+class CudyClient:
+
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        *,
+        use_https: bool = False,
+        verify_ssl: bool = True,
+        request_timeout: int = DEFAULT_TIMEOUT,
+        session: ClientSession | None = None,
+        use_ubus: bool = False,
+        reuse_window: float = DEFAULT_REUSE_WINDOW,
+        max_body_bytes: int | None = DEFAULT_MAX_BODY_BYTES,
+    ) -> None:
+        self._host = host.rstrip("/")
+        self._username = username
+        self._password = password
+        self._use_https = use_https
+        self._verify_ssl = verify_ssl
+
+        self._external_session = session is not None
+        self._session: Optional[ClientSession] = session
+        self._timeout = aiohttp.ClientTimeout(total=request_timeout)
+        self.max_body_bytes = max_body_bytes
+        self._closed = False
+
+        self._sysauth: str | None = None
+        self._auth_lock = asyncio.Lock()
+        self._use_ubus = use_ubus
+
+        # monotonic times the current sysauth was obtained and last accepted by the router
+        self._session_started: float | None = None
+        self._session_confirmed: float | None = None
+        self._session_lifetimes: list[float] = []
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self.session_stats = {"logins": 0, "proactive_refreshes": 0, "expired_replays": 0}
+
+        # identical GETs share one request while in flight, and its body for reuse_window seconds
+        self.reuse_window = reuse_window
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._recent: dict[tuple, tuple[float, Any]] = {}
+        self.request_stats = {"requests": 0, "coalesced": 0, "reused": 0}
+        # response body bytes read, for per-poll transfer sizes
+        self.bytes_received = 0
+        # per-poll timing spans; replaced by the entry's shared tracer
+        self.tracer = PollTracer()
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self._use_https else "http"
+        return f"{scheme}://{self._host}"
+
+    @property
+    def is_authenticated(self) -> bool:
+        return bool(self._sysauth)
+
+    @property
+    def sysauth(self) -> str | None:
+        return self._sysauth
+
+    @property
+    def use_ubus(self) -> bool:
+        return self._use_ubus
+
+    @use_ubus.setter
+    def use_ubus(self, value: bool) -> None:
+        self._use_ubus = bool(value)
+
+    @property
+    def session_lifetime(self) -> float | None:
+        """Shortest session age recently confirmed before an expiry, in seconds."""
+        if not self._session_lifetimes:
+            return None
+        return min(self._session_lifetimes)
+
+    # ------------------------------------------------------------------
+    # Session handling
+    # ------------------------------------------------------------------
+    async def _ensure_session(self) -> ClientSession:
+        if self._closed:
+            # a request still in flight at unload must not open a session nobody closes
+            raise RuntimeError("CudyClient is closed")
+        if self._session is None or self._session.closed:
+            connector = None
+            # allow self-signed certs when verify_ssl=False
+            if self._use_https and not self._verify_ssl:
+                connector = TCPConnector(ssl=False)
+            self._session = aiohttp.ClientSession(
+                timeout=self._timeout,
+                connector=connector,
+                trace_configs=[_timing_trace_config()],
+            )
+        return self._session
+
+    async def async_close(self) -> None:
+        """Close the aiohttp session (called on HA unload)."""
+        self._closed = True
+        self._cancel_session_refresh()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session and not self._session.closed and not self._external_session:
+            await self._session.close()
+        self._session = None
+
+    # backwards compat alias
+    async def close(self) -> None:
+        await self.async_close()
+
+    # ------------------------------------------------------------------
+    # Authentication (LuCI)
+    # ------------------------------------------------------------------
+    async def authenticate(self) -> bool:
+        """Authenticate using the LuCI login form and set sysauth cookie."""
+        with self.tracer.span("login"):
+            return await self._authenticate()
+
+    async def _authenticate(self) -> bool:
+        session = await self._ensure_session()
+
+        # try preferred scheme first, then fallback
+        schemes = ["https", "http"] if self._use_https else ["http", "https"]
+
+        for scheme in schemes:
+            base = f"{scheme}://{self._host}"
+            login_url = f"{base}/cgi-bin/luci"
+
+            headers_get = {
+                "User-Agent": "hass-cudy-router",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            }
+            headers_post = {
+                "User-Agent": "hass-cudy-router",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Referer": login_url,
+                "Origin": base,
+            }
+
+            # 1) GET login page
+            try:
+                async with session.get(login_url, headers=headers_get, allow_redirects=True) as resp:
+                    html = await resp.text()
+            except Exception as e:
+                _LOGGER.error("GET login page failed (%s): %s", scheme, e)
+                continue
+
+            if not html:
+                _LOGGER.error("GET login page failed (%s): empty response", scheme)
+                continue
+
+            from bs4 import BeautifulSoup
+
+            soup = BeautifulSoup(html, "html.parser")
+
+            def extract(name: str) -> str:
+                tag = soup.find("input", {"name": name})
+                if tag and tag.has_attr("value"):
+                    return str(tag["value"])
+                # some firmwares put them in <meta>
+                meta = soup.find("meta", {"name": name})
+                if meta and meta.has_attr("content"):
+                    return str(meta["content"])
+                return ""
+
+            _csrf = extract("_csrf")
+            token = extract("token")
+            salt = extract("salt")
+
+            # 2) compute password
+            luci_password = self._password
+            if salt:
+                hashed = hashlib.sha256((self._password + salt).encode()).hexdigest()
+                if token:
+                    hashed = hashlib.sha256((hashed + token).encode()).hexdigest()
+                luci_password = hashed
+
+            # 3) POST credentials
+            body: dict[str, Any] = {
+                "_csrf": _csrf,
+                "token": token,
+                "salt": salt,
+                "zonename": "UTC",
+                "timeclock": str(int(time.time())),
+                "luci_language": "en",
+                "luci_username": self._username,
+                "luci_password": luci_password,
+                "submit": "1",
+            }
+            body = {k: v for k, v in body.items() if v}
+
+            encoded = "&".join(f"{quote_plus(k)}={quote_plus(str(v))}" for k, v in body.items())
+
+            try:
+                async with session.post(
+                    login_url,
+                    headers=headers_post,
+                    data=encoded,
+                    allow_redirects=False,
+                ) as resp:
+                    # try Set-Cookie header first
+                    set_cookie = resp.headers.getall("Set-Cookie", [])
+                    sysauth = self._parse_sysauth_from_headers(set_cookie)
+                    if sysauth:
+                        self._session_established(sysauth)
+                        return True
+
+                    # fallback to cookie jar
+                    jar = session.cookie_jar.filter_cookies(base)
+                    for key, cookie in jar.items():
+                        if key.lower().startswith("sysauth") and cookie.value:
+                            self._session_established(cookie.value)
+                            return True
+            except Exception as e:
+                _LOGGER.error("POST login failed (%s): %s", scheme, e)
+                continue
+
+        _LOGGER.debug("Authentication failed: no sysauth cookie obtained")
+        return False
+
+    @staticmethod
+    def _parse_sysauth_from_headers(set_cookie_headers: list[str]) -> str | None:
+        for hdr in set_cookie_headers:
+            cookie = SimpleCookie()
+            cookie.load(hdr)
+            for key in ("sysauth", "sysauth_http", "sysauth_https"):
+                morsel = cookie.get(key)
+                if morsel and morsel.value:
+                    return morsel.value
+        return None
+
+    # ------------------------------------------------------------------
+    # Session lifetime
+    # ------------------------------------------------------------------
+    def _session_established(self, sysauth: str) -> None:
+        self._sysauth = sysauth
+        self._session_started = time.monotonic()
+        self._session_confirmed = None
+        self.session_stats["logins"] += 1
+        self._schedule_session_refresh()
+
+    def _session_expired(self) -> None:
+        """Learn the router's session lifetime from a rejected sysauth.
+
+        The last age at which the session was still accepted is a lower bound of
+        the lifetime, so refreshing before it never races the expiry.
+        """
+        if self._session_started is None or self._session_confirmed is None:
+            return
+        age = self._session_confirmed - self._session_started
+        if age < MIN_SESSION_LIFETIME:
+            return
+        self._session_lifetimes = (self._session_lifetimes + [age])[-SESSION_LIFETIME_SAMPLES:]
+        _LOGGER.debug("Session expired after >%.0fs (learned lifetime %.0fs)", age, self.session_lifetime)
+
+    def _schedule_session_refresh(self) -> None:
+        """Log in again in the background shortly before the session is expected to expire."""
+        self._cancel_session_refresh()
+        lifetime = self.session_lifetime
+        if lifetime is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh_handle = loop.call_later(
+            lifetime * SESSION_REFRESH_FACTOR, self._start_session_refresh
+        )
+
+    def _cancel_session_refresh(self) -> None:
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
+    def _start_session_refresh(self) -> None:
+        self._refresh_handle = None
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_session())
+
+    async def _refresh_session(self) -> None:
+        try:
+            async with self._auth_lock:
+                if await self.authenticate():
+                    self.session_stats["proactive_refreshes"] += 1
+        except Exception as err:
+            _LOGGER.debug("Proactive session refresh failed: %s", err)
+
+    async def ensure_authenticated(self) -> None:
+        if self.is_authenticated:
+            return
+        async with self._auth_lock:
+            if not self.is_authenticated:
+                ok = await self.authenticate()
+                if not ok:
+                    raise AuthenticationFailed("Authentication failed")
+
+    async def _reauthenticate(self, rejected: str | None) -> None:
+        """Log in again after the router rejected ``rejected``, once for concurrent callers."""
+        async with self._auth_lock:
+            if self._sysauth == rejected:
+                self._session_expired()
+                await self.authenticate()
+
+    # ------------------------------------------------------------------
+    # Generic request helpers
+    # ------------------------------------------------------------------
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        data: Any = None,
+        require_auth: bool = True,
+        timing: dict[str, float] | None = None,
+        max_bytes: int | None = None,
+        raw: bool = False,
+        expect_html: bool = False,
+    ) -> Any:
+        """Low-level request helper used by get/post and APIs.
+
+        When ``timing`` is given it receives ``server_time``: time to first byte
+        minus connection setup, i.e. the time the router spent on the request.
+
+        The body is streamed and may not exceed ``max_bytes`` (``max_body_bytes``
+        by default), otherwise ``ResponseTooLarge`` is raised. ``raw`` returns
+        the body as bytes instead of decoding it with the declared charset.
+        A login page served instead of the requested page counts as an expired
+        session, like a 403.
+
+        Error statuses are answered with "" before the body is read. With
+        ``expect_html`` a response declaring a non-text Content-Type (an image,
+        a download, JSON) raises ``UnexpectedContent`` before the body is read.
+        """
+
+        if not path.startswith("/"):
+            path = "/" + path
+
+        if require_auth:
+            await self.ensure_authenticated()
+
+        session = await self._ensure_session()
+        url = f"{self.base_url}{path}"
+        limit = self.max_body_bytes if max_bytes is None else max_bytes
+
+        headers: dict[str, str] = {
+            "User-Agent": "hass-cudy-router",
+            "Accept": "*/*",
+        }
+        sysauth = self.sysauth
+        if sysauth:
+            headers["Cookie"] = f"sysauth={sysauth}"
+
+        for replay in (False, True):
+            trace_ctx = SimpleNamespace(connect=0.0, dns=0.0)
+            started = time.monotonic()
+            async with session.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                trace_request_ctx=trace_ctx,
+            ) as resp:
+                headers_at = time.monotonic()
+                try:
+                    expired = require_auth and not replay and resp.status == 403
+                    if not expired:
+                        self._record_timing(timing, started, trace_ctx)
+                        if replay:
+                            resp.raise_for_status()
+                        elif resp.status >= 400:
+                            return ""
+                        if expect_html:
+                            self._check_content_type(resp)
+                        try:
+                            body = await self._read_body(resp, limit, detect_login=require_auth)
+                            self.bytes_received += len(body)
+                        except _LoginPageReturned:
+                            if replay:
+                                raise AuthenticationFailed("Authentication failed") from None
+                            expired = True
+                        else:
+                            if not replay and require_auth and sysauth and sysauth == self._sysauth:
+                                # when the request was sent: the router accepted the
+                                # session no earlier, so the learned age stays a lower bound
+                                self._session_confirmed = max(self._session_confirmed or 0.0, started)
+                            return self._decode_body(resp, body, raw)
+                finally:
+                    if self.tracer.active:
+                        self._trace_request(method, path, resp.status, started, headers_at, trace_ctx)
+
+            self.session_stats["expired_replays"] += 1
+            await self._reauthenticate(sysauth)
+            headers["Cookie"] = f"sysauth={self.sysauth}" if self.sysauth else ""
+
+        return ""
+
+    @staticmethod
+    def _check_content_type(resp: aiohttp.ClientResponse) -> None:
+        ctype = resp.headers.get("Content-Type")
+        # a missing header is left to the parser
+        if ctype and not ctype.lower().lstrip().startswith(HTML_CONTENT_TYPES):
+            raise UnexpectedContent(f"{resp.url.path}: {ctype}")
+
+    @staticmethod
+    async def _read_body(
+        resp: aiohttp.ClientResponse, limit: int | None, *, detect_login: bool
+    ) -> bytes:
+        if limit and resp.content_length is not None and resp.content_length > limit:
+            raise ResponseTooLarge(f"{resp.url.path}: {resp.content_length} bytes (limit {limit})")
+        body = bytearray()
+        async for chunk in resp.content.iter_chunked(READ_CHUNK_SIZE):
+            sniff = len(body) < LOGIN_SNIFF_BYTES
+            body.extend(chunk)
+            if sniff and detect_login and _LOGIN_MARKER in body[:LOGIN_SNIFF_BYTES]:
+                raise _LoginPageReturned
+            if limit and len(body) > limit:
+                raise ResponseTooLarge(f"{resp.url.path}: more than {limit} bytes")
+        return bytes(body)
+
+    @staticmethod
+    def _decode_body(resp: aiohttp.ClientResponse, body: bytes, raw: bool) -> Any:
+        ctype = resp.headers.get("Content-Type", "")
+        if "application/json" in ctype:
+            return json_module.loads(body) if body else None
+        if raw:
+            return body
+        # the declared charset (LuCI always sends one) instead of charset detection
+        try:
+            return body.decode(resp.charset or "utf-8", errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
+    @staticmethod
+    def _record_timing(
+        timing: dict[str, float] | None, started: float, trace_ctx: SimpleNamespace
+    ) -> None:
+        if timing is None:
+            return
+        ttfb = time.monotonic() - started
+        timing["ttfb"] = ttfb
+        timing["server_time"] = max(ttfb - trace_ctx.connect, 0.0)
+
+    def _trace_request(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        started: float,
+        headers_at: float,
+        trace_ctx: SimpleNamespace,
+    ) -> None:
+        """One span per HTTP request with its phases (aiohttp reports TCP and TLS as one)."""
+        done = time.monotonic()
+        setup = trace_ctx.connect
+        self.tracer.record(
+            "request",
+            started,
+            done,
+            method=method,
+            path=path,
+            status=status,
+            dns_ms=round(trace_ctx.dns * 1000, 2),
+            connect_ms=round(max(setup - trace_ctx.dns, 0.0) * 1000, 2),
+            ttfb_ms=round(max(headers_at - started - setup, 0.0) * 1000, 2),
+            body_ms=round((done - headers_at) * 1000, 2),
+        )
+
+    async def get(self, path: str, **kwargs: Any) -> Any:
+        """GET ``path``; concurrent identical GETs share one HTTP request."""
+        if set(kwargs) - {"params", "timing", "max_bytes", "raw", "expect_html"}:
+            return await self.request("GET", path, **kwargs)
+        params = kwargs.get("params")
+        timing = kwargs.get("timing")
+        max_bytes = kwargs.get("max_bytes")
+        raw = bool(kwargs.get("raw", False))
+        expect_html = bool(kwargs.get("expect_html", False))
+        key = (path, frozenset((params or {}).items()), max_bytes, raw, expect_html)
+
+        recent = self._recent.get(key)
+        if recent is not None and time.monotonic() - recent[0] <= self.reuse_window:
+            self.request_stats["reused"] += 1
+            return recent[1]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            # shield: a cancelled follower must not cancel the shared request
+            shared = await asyncio.shield(inflight)
+            if shared is not None:
+                self.request_stats["coalesced"] += 1
+                result, error, shared_timing = shared
+                if timing is not None:
+                    timing.update(shared_timing)
+                if error is not None:
+                    raise error
+                return result
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        own_timing: dict[str, float] = {}
+        self.request_stats["requests"] += 1
+        try:
+            result = await self.request(
+                "GET",
+                path,
+                params=params,
+                timing=own_timing,
+                max_bytes=max_bytes,
+                raw=raw,
+                expect_html=expect_html,
+            )
+        except asyncio.CancelledError:
+            # followers issue their own request
+            future.set_result(None)
+            raise
+        except Exception as err:
+            future.set_result((None, err, own_timing))
+            raise
+        else:
+            future.set_result((result, None, own_timing))
+            if result and self.reuse_window > 0:
+                now = time.monotonic()
+                self._recent = {
+                    k: v for k, v in self._recent.items() if now - v[0] <= self.reuse_window
+                }
+                self._recent[key] = (now, result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if timing is not None:
+                timing.update(own_timing)
+
+    async def post(self, path: str, **kwargs: Any) -> Any:
+        # a write may change what the next GETs return
+        self._recent.clear()
+        return await self.request("POST", path, **kwargs)
+
+    async def get_json(self, path: str, **kwargs: Any) -> Any:
+        """Explicit JSON helper if a caller wants JSON only."""
+        result = await self.request("GET", path, **kwargs)
+        return result
+
+    # ------------------------------------------------------------------
+    # LuCI convenience helpers
+    # ------------------------------------------------------------------
+    async def luci_get(self, luci_path: str) -> str:
+        """GET a LuCI path like '/admin/status/overview'."""
+        if not luci_path.startswith("/"):
+            luci_path = "/" + luci_path
+        return await self.get(f"/cgi-bin/luci{luci_path}")
+
+    async def luci_post(self, luci_path: str, data: dict[str, Any] | None = None) -> str:
+        """POST to a LuCI path like '/admin/system/reboot'."""
+        if not luci_path.startswith("/"):
+            luci_path = "/" + luci_path
+        return await self.post(f"/cgi-bin/luci{luci_path}", data=data)
+
+    async def ping(self) -> bool:
+        """Quick connectivity check."""
+        try:
+            await self.get("/cgi-bin/luci", require_auth=False)
+            return True
+        except Exception:
+            return False
+
+    # ------------------------------------------------------------------
+    # ubus JSON-RPC transport
+    # ------------------------------------------------------------------
+    async def ubus_batch(self, calls: list[tuple[str, str, dict[str, Any]]]) -> list[Any]:
+        """Send ubus calls as a single JSON-RPC batch.
+
+        Returns one entry per call: the call's result object, or None if the
+        call failed or is not permitted for this session.
+        """
+        results: list[Any] = [None] * len(calls)
+        if not calls:
+            return results
+
+        await self.ensure_authenticated()
+        rejected = self._sysauth
+        response = await self.request("POST", UBUS_PATH, json=self._ubus_payload(calls))
+
+        if self._ubus_access_denied(response):
+            # the ubus session is the LuCI sysauth token, refresh it once
+            self.session_stats["expired_replays"] += 1
+            await self._reauthenticate(rejected)
+            if self._sysauth != rejected:
+                response = await self.request("POST", UBUS_PATH, json=self._ubus_payload(calls))
+
+        if isinstance(response, dict):
+            response = [response]
+        if not isinstance(response, list):
+            _LOGGER.debug("Unexpected ubus response: %r", response)
+            return results
+
+        for item in response:
+            if not isinstance(item, dict):
+                continue
+            call_id = item.get("id")
+            result = item.get("result")
+            if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                continue
+            # result is [status] or [status, data]; status 0 means success
+            if isinstance(result, list) and result and result[0] == 0:
+                results[call_id] = result[1] if len(result) > 1 else {}
+        return results
+
+    def _ubus_payload(self, calls: list[tuple[str, str, dict[str, Any]]]) -> list[dict[str, Any]]:
+        session_id = self._sysauth or "00000000000000000000000000000000"
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": index,
+                "method": "call",
+                "params": [session_id, obj, method, args or {}],
+            }
+            for index, (obj, method, args) in enumerate(calls)
+        ]
+
+    @staticmethod
+    def _ubus_access_denied(response: Any) -> bool:
+        items = response if isinstance(response, list) else [response]
+        codes = [
+            (item.get("error") or {}).get("code")
+            for item in items
+            if isinstance(item, dict)
+        ]
+        return bool(codes) and all(code == UBUS_ACCESS_DENIED for code in codes)
+
+    # ------------------------------------------------------------------
+    # Helper for tests / convenience
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_entry(cls, entry) -> "CudyClient":
+        data = entry.data
+        protocol = (data.get("protocol") or "http").lower()
+        use_https = protocol == "https"
+        return cls(
+            host=data.get("host"),
+            username=data.get("username"),
+            password=data.get("password"),
+            use_https=use_https,
+        )
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""Module and value keys shared by the client, the parser and Home Assistant."""
+
+DEFAULT_SCAN_INTERVAL = 30
+
+MODULE_SYSTEM = "system"
+MODULE_LAN = "lan"
+MODULE_DEVICES = "devices"
+MODULE_MESH = "mesh"
+MODULE_WAN = "wan"
+MODULE_WAN_SECONDARY = "wan_secondary"
+MODULE_MULTI_WAN = "multi_wan"
+MODULE_WIRELESS_24G = "wifi_24"
+MODULE_WIRELESS_5G = "wifi_5g"
+MODULE_WIRELESS_6G = "wifi_6g"
+MODULE_DHCP = "dhcp"
+MODULE_GSM = "gsm"
+MODULE_SMS = "sms"
+MODULE_VPN = "vpn"
+MODULE_USB = "usb"
+MODULE_DEVICE_LIST = "device_list"
+
+## System
+SENSOR_SYSTEM_FIRMWARE_VERSION = "system_firmware"
+SENSOR_SYSTEM_MODEL = "system_model"
+SENSOR_SYSTEM_HARDWARE = "system_hardware"
+SENSOR_SYSTEM_UPTIME = "system_uptime"
+SENSOR_SYSTEM_LOCALTIME = "system_localtime"
+## Mesh
+SENSOR_MESH_NETWORK = "mesh_network"
+SENSOR_MESH_UNITS = "mesh_units"
+## WAN
+SENSOR_WAN_PUBLIC_IP = "wan_public_ip"
+SENSOR_WAN_IP = "wan_ip"
+SENSOR_WAN_DNS = "wan_dns"
+SENSOR_WAN_TYPE = "wan_type"
+SENSOR_WAN_UPTIME = "wan_uptime"
+SENSOR_WAN_GATEWAY = "wan_gateway"
+SENSOR_WAN_MODE = "wan_mode"
+## LAN
+SENSOR_LAN_IP = "lan_ip"
+SENSOR_LAN_SUBNET = "lan_subnet"
+SENSOR_LAN_MAC = "lan_mac"
+## WiFI 2.4G
+SENSOR_24G_WIFI_SSID = "24g_wifi_ssid"
+SENSOR_24G_WIFI_BSSID = "24g_wifi_bssid"
+SENSOR_24G_WIFI_ENCRYPTION = "24g_wifi_encryption"
+SENSOR_24G_WIFI_CHANNEL = "24g_wifi_channel"
+## WiFi 5G
+SENSOR_5G_WIFI_SSID = "5g_wifi_ssid"
+SENSOR_5G_WIFI_BSSID = "5g_wifi_bssid"
+SENSOR_5G_WIFI_ENCRYPTION = "5g_wifi_encryption"
+SENSOR_5G_WIFI_CHANNEL = "5g_wifi_channel"
+## WiFi 6G
+SENSOR_6G_WIFI_SSID = "6g_wifi_ssid"
+SENSOR_6G_WIFI_BSSID = "6g_wifi_bssid"
+SENSOR_6G_WIFI_ENCRYPTION = "6g_wifi_encryption"
+SENSOR_6G_WIFI_CHANNEL = "6g_wifi_channel"
+## Devices
+SENSOR_DEVICE_COUNT = "device_count"
+SENSOR_DEVICE_WIFI_24_COUNT = "device_wifi_24_device_count"
+SENSOR_DEVICE_WIFI_5_COUNT = "device_wifi_5_device_count"
+SENSOR_DEVICE_WIRED_COUNT = "device_wired_device_count"
+SENSOR_DEVICE_MESH_COUNT = "device_mesh_device_count"
+SENSOR_DEVICE_ONLINE = "device_online"
+SENSOR_DEVICE_BLOCKED = "device_blocked"
+## DHCP
+SENSOR_DHCP_IP_START = "dhcp_ip_start"
+SENSOR_DHCP_IP_END = "dhcp_ip_end"
+SENSOR_DHCP_DNS_PRIMARY = "dhcp_dns_primary"
+SENSOR_DHCP_DNS_SECONDARY = "dhcp_dns_secondary"
+SENSOR_DHCP_GATEWAY = "dhcp_gateway"
+SENSOR_DHCP_LEASE_TIME = "dhcp_lease_time"
+## GSM
+SENSOR_GSM_NETWORK_TYPE = "gsm_network_type"
+SENSOR_GSM_DOWNLOAD = "gsm_download"
+SENSOR_GSM_UPLOAD = "gsm_upload"
+SENSOR_GSM_PUBLIC_IP = "gsm_public_ip"
+SENSOR_GSM_IP_ADDRESS = "gsm_ip_address"
+SENSOR_GSM_CONNECTED_TIME = "gsm_connected_time"
+## SMS
+SENSOR_SMS_INBOX = "sms_inbox"
+SENSOR_SMS_OUTBOX = "sms_outbox"
+## VPN
+SENSOR_VPN_ENABLED = "vpn_enabled"
+SENSOR_VPN_TUNNELS = "vpn_tunnels"
+## USB
+SENSOR_USB_TETHERING = "usb_tethering"
+SENSOR_USB_SHARING = "usb_sharing"
+
+SENSORS_KEY_KEY = "key"
+SENSORS_KEY_DESCRIPTION = "description"
+SENSORS_KEY_ICON = "icon"
+SENSORS_KEY_CATEGORY = "entity_category"
+SENSORS_KEY_CLASS = "state_class"
+
+# values of Home Assistant's SensorStateClass and EntityCategory
+STATE_CLASS_MEASUREMENT = "measurement"
+ENTITY_CATEGORY_DIAGNOSTIC = "diagnostic"
+
+DEVICE_HOSTNAME = "hostname"
+DEVICE_IP = "ip"
+DEVICE_MAC = "mac"
+DEVICE_UPLOAD_SPEED = "upload_speed"
+DEVICE_DOWNLOAD_SPEED = "download_speed"
+DEVICE_SIGNAL = "signal"
+DEVICE_ONLINE_TIME = "online_time"
+DEVICE_CONNECTION_TYPE = "connection_type"
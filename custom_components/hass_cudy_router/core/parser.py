@@ -1,23 +1,38 @@
-# custom_components/hass_cudy_router/parsers.py
+# custom_components/hass_cudy_router/core/parser.py
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 import re
 
-from bs4 import BeautifulSoup
-
-from custom_components.hass_cudy_router.const import (
-    SENSORS,
+from .const import (
     SENSORS_KEY_KEY,
     SENSORS_KEY_DESCRIPTION,
     SENSORS_KEY_CLASS,
-    SensorStateClass,
+    STATE_CLASS_MEASUREMENT,
     MODULE_DEVICES,
     MODULE_DEVICE_LIST,
 )
+from .specs import SENSORS
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+XHR_ENDPOINTS = "xhr_endpoints"
+
+_XHR_LOAD_RE = re.compile(r"cbi_xhr_load\(([^)]*)\)", re.MULTILINE)
+_XHR_STRING_RE = re.compile(r"([\"'])(.*?)\1")
 
 # ---- Helpers ---------------------------------------------------------------
 
+# bs4 is imported on the first parse, so importing the parser stays cheap
+HTML_PARSER = "html.parser"
+
+
+def _soup(html: str) -> BeautifulSoup:
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, HTML_PARSER)
+
 def _clean(s: str | None) -> str:
     return " ".join((s or "").split()).strip()
 
@@ -43,7 +58,7 @@ def extract_kv_pairs(html: str) -> dict[str, str]:
     if not html:
         return out
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
 
     # Tables
     for table in soup.find_all("table"):
@@ -81,29 +96,33 @@ def extract_kv_pairs(html: str) -> dict[str, str]:
 def extract_xhr_endpoints(html: str) -> dict[str, dict[str, str]]:
     """
     Extract endpoints from pages that use cbi_xhr_load.
-    Returns: { "/cgi-bin/luci/...": {"args": "nomodal=&iface=4g"} , ... }
+    Returns: { "/cgi-bin/luci/...": {"args": "nomodal=&iface=4g", "mode": "poll"} , ... }
     """
     endpoints: dict[str, dict[str, str]] = {}
     if not html:
         return endpoints
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
     scripts = soup.find_all("script")
 
-    # Matches: cbi_xhr_load(..., '/cgi-bin/luci/admin/...', 'argstring');
-    re_load = re.compile(
-        r"cbi_xhr_load\([^\)]*'([^']+)'(?:\s*,\s*'([^']*)')?\)",
-        re.MULTILINE,
-    )
-
     for script in scripts:
         text = script.string or script.get_text()
-        if not text:
+        if not text or "cbi_xhr_load" not in text:
             continue
-        for m in re_load.finditer(text):
-            url = m.group(1)
-            args = m.group(2) or ""
-            endpoints[url] = {"args": args}
+        # Matches: cbi_xhr_load("#target", "poll", "/cgi-bin/luci/admin/...", "argstring");
+        # quoting differs between firmwares, so collect the string arguments first
+        for call in _XHR_LOAD_RE.finditer(text):
+            strings = [m.group(2) for m in _XHR_STRING_RE.finditer(call.group(1))]
+            url_index = next(
+                (i for i, value in enumerate(strings) if value.startswith("/")),
+                None,
+            )
+            if url_index is None:
+                continue
+            url = strings[url_index]
+            args = strings[url_index + 1] if len(strings) > url_index + 1 else ""
+            mode = strings[url_index - 1] if url_index >= 2 else ""
+            endpoints[url] = {"args": args, "mode": mode}
 
     return endpoints
 
@@ -134,7 +153,7 @@ def parse_module_by_sensors(module: str, html: str) -> dict[str, Any]:
                 break
 
         state_class = spec.get(SENSORS_KEY_CLASS)
-        if state_class == SensorStateClass.MEASUREMENT:
+        if state_class == STATE_CLASS_MEASUREMENT:
             result[sensor_key] = _to_int_if_possible(found)
         else:
             result[sensor_key] = _clean(found) if found else None
@@ -152,7 +171,7 @@ def parse_devices(html: str) -> dict[str, Any]:
     - per-type rows like 2.4G / 5G / Wired / Mesh
     Still uses parse_module_by_sensors for initial fill.
     """
-    from custom_components.hass_cudy_router.const import (
+    from .const import (
         SENSOR_DEVICE_COUNT,
         SENSOR_DEVICE_ONLINE,
         SENSOR_DEVICE_BLOCKED,
@@ -167,7 +186,7 @@ def parse_devices(html: str) -> dict[str, Any]:
     if not html:
         return result
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
     table = soup.select_one("table.table")
     if not table:
         return result
@@ -223,7 +242,7 @@ def parse_device_list(html: str) -> list[dict[str, Any]]:
     Parses /admin/network/devices/devlist
     Returns list of dicts keyed by DEVICE_* constants.
     """
-    from custom_components.hass_cudy_router.const import (
+    from .const import (
         DEVICE_HOSTNAME,
         DEVICE_IP,
         DEVICE_MAC,
@@ -238,7 +257,7 @@ def parse_device_list(html: str) -> list[dict[str, Any]]:
     if not html:
         return out
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _soup(html)
     table = soup.find("table", class_=re.compile(r"\btable\b"))
     if not table:
         return out
@@ -331,7 +350,7 @@ def parse_html(module: str, html: str) -> Any:
     xhr = extract_xhr_endpoints(html)
     if xhr:
         # let API fetch each xhr endpoint and parse those fragments separately
-        return {"xhr_endpoints": xhr}
+        return {XHR_ENDPOINTS: xhr}
 
     if module == MODULE_DEVICES:
         return parse_devices(html)
@@ -340,4 +359,31 @@ def parse_html(module: str, html: str) -> Any:
         return parse_device_list(html)
 
     # default driven purely by SENSORS descriptors
-    return parse_module_by_sensors(module, html)
\ No newline at end of file
+    return parse_module_by_sensors(module, html)
+
+
+def parse_xhr_fragments(module: str, fragments: list[str]) -> Any:
+    """
+    Parse fragments loaded by an XHR shell page and merge them into one
+    module payload. The first fragment providing a value for a sensor wins.
+    Returns {} when no fragment provided any value, like an empty page.
+    """
+    if module == MODULE_DEVICE_LIST:
+        devices: list[dict[str, Any]] = []
+        for html in fragments:
+            if html:
+                devices.extend(parse_device_list(html))
+        return devices
+
+    result = parse_module_by_sensors(module, "")
+    for html in fragments:
+        if not html:
+            continue
+        data = parse_devices(html) if module == MODULE_DEVICES else parse_module_by_sensors(module, html)
+        for key, value in data.items():
+            if result.get(key) is None and value is not None:
+                result[key] = value
+
+    if all(value is None for value in result.values()):
+        return {}
+    return result
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+# polls kept per entry
+MAX_TRACES = 20
+# spans kept per poll; XHR shells can fan out into many requests
+MAX_SPANS = 500
+
+_NOOP = nullcontext()
+# module a request or parse belongs to; set per fetch task
+_module: ContextVar[str | None] = ContextVar("cudy_trace_module", default=None)
+
+
+class PollTracer:
+    """Timing spans of the last polls of one entry, kept in a ring buffer.
+
+    Spans are only recorded between ``begin()`` and ``finish()`` and while
+    ``enabled``; otherwise ``span()`` hands out a shared no-op context.
+    """
+
+    def __init__(self, enabled: bool = False, max_traces: int = MAX_TRACES) -> None:
+        self.enabled = enabled
+        self.traces: deque[dict[str, Any]] = deque(maxlen=max_traces)
+        self._current: dict[str, Any] | None = None
+        self._started = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._current is not None
+
+    def begin(self) -> None:
+        """Start tracing a poll, closing one left open by a failed refresh."""
+        if self._current is not None:
+            self.finish()
+        if not self.enabled:
+            return
+        self._started = time.monotonic()
+        self._current = {
+            "started": datetime.now(timezone.utc).isoformat(),
+            "spans": [],
+        }
+
+    def finish(self, error: str | None = None) -> None:
+        trace, self._current = self._current, None
+        if trace is None:
+            return
+        trace["duration_ms"] = _ms(time.monotonic() - self._started)
+        if error is not None:
+            trace["error"] = error
+        self.traces.append(trace)
+
+    def record(
+        self, name: str, start: float, end: float, module: str | None = None, **attrs: Any
+    ) -> None:
+        """Add a span measured with ``time.monotonic()`` to the current poll."""
+        trace = self._current
+        if trace is None or len(trace["spans"]) >= MAX_SPANS:
+            return
+        span = {
+            "name": name,
+            "module": module if module is not None else _module.get(),
+            "start_ms": _ms(start - self._started),
+            "duration_ms": _ms(end - start),
+        }
+        span.update(attrs)
+        trace["spans"].append(span)
+
+    def span(self, name: str, module: str | None = None, **attrs: Any):
+        if self._current is None:
+            return _NOOP
+        return self._span(name, module, attrs)
+
+    @contextmanager
+    def _span(self, name: str, module: str | None, attrs: dict[str, Any]) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.monotonic(), module, **attrs)
+
+    def module(self, module: str):
+        """Attribute spans recorded in this context (requests, parsing) to ``module``."""
+        if self._current is None:
+            return _NOOP
+        return _module_context(module)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"enabled": self.enabled, "traces": list(self.traces)}
+
+
+@contextmanager
+def _module_context(module: str) -> Iterator[None]:
+    token = _module.set(module)
+    try:
+        yield
+    finally:
+        _module.reset(token)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
@@ -4,12 +4,14 @@ from typing import Any
 
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import *
-from .coordinator import CudyCoordinator
+from .coordinator import CudyCoordinator, normalize_mac
+from .watchdog import watch
 
 
 def _device_unique_id(entry_id: str, mac: str) -> str:
@@ -17,6 +19,13 @@ def _device_unique_id(entry_id: str, mac: str) -> str:
     return f"{entry_id}_dev_{mac_norm}"
 
 
+def _is_tracked(coordinator: CudyCoordinator, mac: str) -> bool:
+    tracked = getattr(coordinator, "tracked_macs", None)
+    if not isinstance(tracked, (set, frozenset)):
+        return True
+    return normalize_mac(mac) in tracked
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -27,25 +36,73 @@ async def async_setup_entry(
     spec = data.get("spec")
     if spec and "device_tracker" not in getattr(spec, "platforms", set()):
         return
-    devices = _get_devices(coordinator.data)
-    entities = [
-        CudyDeviceTracker(coordinator, entry, dev)
-        for dev in devices
-    ]
-    async_add_entities(entities)
+    # lowercase MAC -> unique_id of the tracker created for it
+    known: dict[str, str] = {}
+    index = DeviceIndex()
+
+    @callback
+    def _async_sync_devices() -> None:
+        """Add trackers for new tracked devices, remove the ones no longer tracked."""
+        entities = []
+        for dev in _get_devices(coordinator.data):
+            mac = str(dev.get(DEVICE_MAC) or "").strip().lower()
+            if mac in known or not _is_tracked(coordinator, mac):
+                continue
+            entity = CudyDeviceTracker(coordinator, entry, dev, index)
+            known[mac] = entity.unique_id
+            entities.append(entity)
+
+        untracked = [mac for mac in known if not _is_tracked(coordinator, mac)]
+        if untracked:
+            ent_reg = er.async_get(hass)
+            for mac in untracked:
+                entity_id = ent_reg.async_get_entity_id("device_tracker", DOMAIN, known.pop(mac))
+                if entity_id is not None:
+                    ent_reg.async_remove(entity_id)
+
+        if entities:
+            async_add_entities(entities)
+
+    _async_sync_devices()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync_devices))
 
 
 def _get_devices(coordinator_data: dict[str, Any] | None) -> list[dict[str, Any]]:
     if not coordinator_data:
         return []
-    mod = coordinator_data.get(MODULE_DEVICES, {}) or {}
-    devs = mod.get(MODULE_DEVICE_LIST, []) or []
+    # the API returns the list as its own module, but accept it nested in devices too
+    devs = coordinator_data.get(MODULE_DEVICE_LIST)
+    if not isinstance(devs, list):
+        mod = coordinator_data.get(MODULE_DEVICES, {}) or {}
+        devs = mod.get(MODULE_DEVICE_LIST, []) if isinstance(mod, dict) else []
+    devs = devs or []
     return [
         d for d in devs
         if isinstance(d, dict) and d.get(DEVICE_MAC)
     ]
 
 
+class DeviceIndex:
+    """Devices by lowercase MAC, rebuilt once per coordinator update.
+
+    Shared by the trackers of an entry so each state write is a dict lookup
+    instead of a scan of the whole device list.
+    """
+
+    def __init__(self) -> None:
+        self._data: Any = None
+        self._by_mac: dict[str, dict[str, Any]] = {}
+
+    def get(self, coordinator_data: dict[str, Any] | None, mac: str) -> dict[str, Any] | None:
+        if coordinator_data is not self._data:
+            by_mac: dict[str, dict[str, Any]] = {}
+            for d in _get_devices(coordinator_data):
+                by_mac.setdefault(str(d.get(DEVICE_MAC)).strip().lower(), d)
+            self._by_mac = by_mac
+            self._data = coordinator_data
+        return self._by_mac.get(mac.lower())
+
+
 class CudyDeviceTracker(CoordinatorEntity, TrackerEntity):
     _attr_has_entity_name = True
 
@@ -54,9 +111,11 @@ class CudyDeviceTracker(CoordinatorEntity, TrackerEntity):
         coordinator: CudyCoordinator,
         entry: ConfigEntry,
         device: dict[str, Any],
+        index: DeviceIndex | None = None,
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
+        self._index = index or DeviceIndex()
         self._initial = device  # IMPORTANT fallback for attributes
         self._mac = str(device.get(DEVICE_MAC) or "").strip()
         hostname = (device.get(DEVICE_HOSTNAME) or "").strip()
@@ -86,14 +145,16 @@ class CudyDeviceTracker(CoordinatorEntity, TrackerEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
-        dev = self._find_self()
-        if dev is None:
-            dev = self._initial
-        return dev if isinstance(dev, dict) else None
+        with watch(self.coordinator, "attributes", MODULE_DEVICE_LIST):
+            dev = self._find_self()
+            if dev is None:
+                dev = self._initial
+            if not isinstance(dev, dict):
+                return None
+            # restored from the snapshot, not yet confirmed by the router
+            if getattr(self.coordinator, "stale", False) is True:
+                return {**dev, "stale": True}
+            return dev
 
     def _find_self(self) -> dict[str, Any] | None:
-        devices = _get_devices(getattr(self.coordinator, "data", None))
-        for d in devices:
-            if str(d.get(DEVICE_MAC) or "").strip().lower() == self._mac.lower():
-                return d
-        return None
\ No newline at end of file
+        return self._index.get(getattr(self.coordinator, "data", None), self._mac)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    data = hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}
+    integration = data.get("integration")
+    coordinator = data.get("coordinator")
+    api = getattr(integration, "api", None)
+
+    out: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "model": getattr(integration, "model", None),
+        "modules": sorted((getattr(coordinator, "data", None) or {}).keys()),
+    }
+    client = getattr(integration, "client", None)
+    if client is not None and hasattr(client, "session_stats"):
+        out["session"] = {
+            **client.session_stats,
+            "learned_lifetime_s": client.session_lifetime,
+        }
+        out["requests"] = dict(client.request_stats)
+    if api is not None:
+        out["polling"] = {
+            "backoff": api.errors.as_dict(),
+            "skipped_modules": sorted(api.skipped_modules),
+            "ubus_modules": sorted(api.ubus_modules),
+            "light_endpoints": {
+                module: {"path": light.path, "bytes_saved": light.bytes_saved}
+                for module, light in api.light_endpoints.items()
+            },
+            "costs": api.costs.as_dict(),
+            "concurrency": api.limiter.limit,
+        }
+    tracer = getattr(integration, "tracer", None)
+    if tracer is not None:
+        out["tracing"] = tracer.as_dict()
+    watchdog = getattr(integration, "watchdog", None)
+    if watchdog is not None:
+        out["watchdog"] = watchdog.as_dict()
+    capture = getattr(integration, "capture", None)
+    if capture is not None:
+        out["capture"] = capture.as_dict()
+    return out
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any
+
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+_VIEW_REGISTERED = f"{DOMAIN}_metrics_view"
+
+# family -> (type, help), in output order
+FAMILIES: dict[str, tuple[str, str]] = {
+    "cudy_router": ("info", "Router model and firmware."),
+    "cudy_router_up": ("gauge", "1 if the last poll succeeded."),
+    "cudy_router_uptime_seconds": ("gauge", "Router uptime."),
+    "cudy_router_clients": ("gauge", "Connected clients per connection type."),
+    "cudy_client_upload_bits_per_second": ("gauge", "Client upload rate."),
+    "cudy_client_download_bits_per_second": ("gauge", "Client download rate."),
+    "cudy_client_signal_db": ("gauge", "Client signal as reported by the router."),
+    "cudy_poll_duration_seconds": ("gauge", "Duration of the last poll."),
+    "cudy_poll_duration_p95_seconds": ("gauge", "95th percentile of recent poll durations."),
+    "cudy_poll_bytes": ("gauge", "Response bytes read by the last poll."),
+    "cudy_parse_cpu_seconds": ("gauge", "CPU time the last poll spent parsing."),
+    "cudy_polls": ("counter", "Polls since the entry was set up."),
+    "cudy_logins": ("counter", "Logins to the router."),
+    "cudy_requests": ("counter", "GET requests by outcome."),
+    "cudy_failed_modules": ("gauge", "Modules whose last fetch failed."),
+    "cudy_scan_interval_seconds": ("gauge", "Effective scan interval."),
+}
+
+CLIENT_COUNTS = {
+    SENSOR_DEVICE_COUNT: "total",
+    SENSOR_DEVICE_WIFI_24_COUNT: "wifi_24",
+    SENSOR_DEVICE_WIFI_5_COUNT: "wifi_5",
+    SENSOR_DEVICE_WIRED_COUNT: "wired",
+    SENSOR_DEVICE_MESH_COUNT: "mesh",
+}
+
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+_RATE_RE = re.compile(r"([\d.]+)\s*([KMG]?)(bps|B/s)", re.IGNORECASE)
+_DURATION_RE = re.compile(r"(?:(\d+)\s*d\w*[,\s]*)?(\d+):(\d{2}):(\d{2})")
+_PREFIX = {"": 1, "k": 1e3, "m": 1e6, "g": 1e9}
+
+
+def rate_bits(value: Any) -> float | None:
+    """'1.46 Kbps' -> 1460.0; byte rates ('2 MB/s') are converted to bits."""
+    m = _RATE_RE.search(str(value or ""))
+    if not m:
+        return None
+    rate = float(m.group(1)) * _PREFIX[m.group(2).lower()]
+    return rate * 8 if m.group(3) == "B/s" else rate
+
+
+def duration_seconds(value: Any) -> int | None:
+    """'2 days, 03:04:05' or '17:35:52' -> seconds."""
+    m = _DURATION_RE.search(str(value or ""))
+    if not m:
+        return None
+    days, hours, minutes, seconds = (int(g or 0) for g in m.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def number(value: Any) -> float | None:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    m = _NUMBER_RE.search(str(value or ""))
+    return float(m.group()) if m else None
+
+
+def _labels(labels: dict[str, Any]) -> str:
+    def escape(value: Any) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return ",".join(f'{key}="{escape(value)}"' for key, value in labels.items() if value is not None)
+
+
+def _sample(name: str, labels: dict[str, Any], value: float | int | None) -> str | None:
+    if value is None:
+        return None
+    return f"{name}{{{_labels(labels)}}} {value}"
+
+
+def render_entry(entry_id: str, coordinator: Any) -> dict[str, list[str]]:
+    """Samples of one entry by family, from data the coordinator already holds."""
+    data = getattr(coordinator, "data", None) or {}
+    base = {"entry": entry_id}
+    samples: dict[str, list[str]] = {}
+
+    def add(family: str, name: str, labels: dict[str, Any], value: float | int | None) -> None:
+        line = _sample(name, {**base, **labels}, value)
+        if line is not None:
+            samples.setdefault(family, []).append(line)
+
+    system = data.get(MODULE_SYSTEM) if isinstance(data.get(MODULE_SYSTEM), dict) else {}
+    add(
+        "cudy_router",
+        "cudy_router_info",
+        {
+            "model": system.get(SENSOR_SYSTEM_MODEL) or getattr(coordinator, "model", None),
+            "firmware": system.get(SENSOR_SYSTEM_FIRMWARE_VERSION),
+        },
+        1,
+    )
+    add("cudy_router_up", "cudy_router_up", {}, int(bool(getattr(coordinator, "last_update_success", False))))
+    add("cudy_router_uptime_seconds", "cudy_router_uptime_seconds", {}, duration_seconds(system.get(SENSOR_SYSTEM_UPTIME)))
+
+    devices = data.get(MODULE_DEVICES) if isinstance(data.get(MODULE_DEVICES), dict) else {}
+    for key, band in CLIENT_COUNTS.items():
+        value = devices.get(key)
+        add("cudy_router_clients", "cudy_router_clients", {"type": band}, int(value) if isinstance(value, int) else None)
+
+    device_list = data.get(MODULE_DEVICE_LIST)
+    for dev in device_list if isinstance(device_list, list) else []:
+        if not isinstance(dev, dict) or not dev.get(DEVICE_MAC):
+            continue
+        labels = {
+            "mac": str(dev[DEVICE_MAC]).lower(),
+            "hostname": dev.get(DEVICE_HOSTNAME),
+            "connection": dev.get(DEVICE_CONNECTION_TYPE),
+        }
+        for family, key in (
+            ("cudy_client_upload_bits_per_second", DEVICE_UPLOAD_SPEED),
+            ("cudy_client_download_bits_per_second", DEVICE_DOWNLOAD_SPEED),
+        ):
+            add(family, family, labels, rate_bits(dev.get(key)))
+        add("cudy_client_signal_db", "cudy_client_signal_db", labels, number(dev.get(DEVICE_SIGNAL)))
+
+    performance = coordinator.performance() if hasattr(coordinator, "performance") else {}
+
+    def seconds(ms: float | None) -> float | None:
+        return ms / 1000 if ms is not None else None
+
+    add("cudy_poll_duration_seconds", "cudy_poll_duration_seconds", {}, seconds(performance.get(PERF_POLL_DURATION)))
+    add("cudy_poll_duration_p95_seconds", "cudy_poll_duration_p95_seconds", {}, seconds(performance.get(PERF_POLL_DURATION_P95)))
+    add("cudy_poll_bytes", "cudy_poll_bytes", {}, performance.get(PERF_POLL_BYTES))
+    add("cudy_parse_cpu_seconds", "cudy_parse_cpu_seconds", {}, seconds(performance.get(PERF_PARSE_TIME)))
+    add("cudy_polls", "cudy_polls_total", {}, getattr(coordinator, "poll_count", None))
+    add("cudy_logins", "cudy_logins_total", {}, performance.get(PERF_LOGINS))
+    client = getattr(getattr(coordinator, "api", None), "client", None)
+    for outcome, count in (getattr(client, "request_stats", None) or {}).items():
+        add("cudy_requests", "cudy_requests_total", {"outcome": outcome}, count)
+    add("cudy_failed_modules", "cudy_failed_modules", {}, performance.get(PERF_FAILED_MODULES))
+    add("cudy_scan_interval_seconds", "cudy_scan_interval_seconds", {}, performance.get(PERF_SCAN_INTERVAL))
+    return samples
+
+
+def render(entries: list[dict[str, list[str]]]) -> str:
+    """Join the entries' samples family by family, as OpenMetrics requires."""
+    lines: list[str] = []
+    for family, (kind, help_text) in FAMILIES.items():
+        family_samples = [line for samples in entries for line in samples.get(family, ())]
+        if not family_samples:
+            continue
+        lines.append(f"# TYPE {family} {kind}")
+        lines.append(f"# HELP {family} {help_text}")
+        lines.extend(family_samples)
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+class CudyMetricsView(HomeAssistantView):
+    """OpenMetrics export of every entry with the metrics option enabled."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        # entry_id -> (data, poll_count, samples); rendered again only after a poll
+        self._cache: dict[str, tuple[Any, int, dict[str, list[str]]]] = {}
+
+    def samples(self, entry_id: str, coordinator: Any) -> dict[str, list[str]]:
+        data = getattr(coordinator, "data", None)
+        polls = getattr(coordinator, "poll_count", 0)
+        cached = self._cache.get(entry_id)
+        if cached is not None and cached[0] is data and cached[1] == polls:
+            return cached[2]
+        samples = render_entry(entry_id, coordinator)
+        self._cache[entry_id] = (data, polls, samples)
+        return samples
+
+    async def get(self, request: web.Request) -> web.Response:
+        hass = request.app[KEY_HASS]
+        loaded = hass.data.get(DOMAIN, {})
+        entries = []
+        for entry_id, entry_data in loaded.items():
+            entry = hass.config_entries.async_get_entry(entry_id)
+            coordinator = (entry_data or {}).get("coordinator")
+            if entry is None or coordinator is None or not entry.options.get(CONF_METRICS):
+                continue
+            entries.append(self.samples(entry_id, coordinator))
+        for entry_id in set(self._cache) - set(loaded):
+            del self._cache[entry_id]
+        return web.Response(body=render(entries).encode(), headers={"Content-Type": CONTENT_TYPE})
+
+
+@callback
+def async_register_view(hass: HomeAssistant) -> None:
+    """Serve the metrics; once per HA instance, and only if HTTP is set up."""
+    if hass.data.get(_VIEW_REGISTERED):
+        return
+    if getattr(hass, "http", None) is None:
+        _LOGGER.debug("HTTP server not available, not serving Cudy metrics")
+        return
+    hass.http.register_view(CudyMetricsView())
+    hass.data[_VIEW_REGISTERED] = True
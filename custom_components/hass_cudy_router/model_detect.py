@@ -5,7 +5,7 @@ from typing import Any, Dict
 
 from custom_components.hass_cudy_router.const import SENSOR_SYSTEM_MODEL, MODULE_SYSTEM, CUDY_DEVICES, CAPABILITY_URLS, \
     SENSOR_SYSTEM_HARDWARE
-from custom_components.hass_cudy_router.parser import parse_module_by_sensors
+from custom_components.hass_cudy_router.core.parser import parse_module_by_sensors
 
 SPECIAL_CASES = {
     "LT300 V3.0": "LT300V3",
@@ -14,16 +14,18 @@ SPECIAL_CASES = {
 }
 
 
-async def detect_model(client: Any) -> str:
+async def fetch_system(client: Any) -> Dict[str, Any]:
     path = f"/cgi-bin/luci{CAPABILITY_URLS[MODULE_SYSTEM][0]}"
-    try:
-        html = await client.get(path)
-        if html:
-            data = parse_module_by_sensors(MODULE_SYSTEM, html)
-            return fit_model(data)
+    html = await client.get(path)
+    if not html:
         raise Exception
-    except Exception:
-        raise
+    return parse_module_by_sensors(MODULE_SYSTEM, html)
+
+
+async def detect_model(client: Any, system: Dict[str, Any] | None = None) -> str:
+    """Detect the model; ``system`` reuses an already parsed system page."""
+    data = system if system is not None else await fetch_system(client)
+    return fit_model(data)
 
 def fit_model(data: Dict) -> str:
     potential_model = normalize_model_name(data[SENSOR_SYSTEM_MODEL])
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import *
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE_POLL = "profile_poll"
+ATTR_ENTRY_ID = "entry_id"
+PROFILE_POLL_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
+# modules whose functions are listed on their own in the report
+HOT_FILES = ("parser.py", "client.py")
+TOP_FUNCTIONS = 20
+TOP_ALLOCATIONS = 15
+_RUNNING = f"{DOMAIN}_profiling"
+_CORE_DIR = os.path.join(os.path.dirname(__file__), "core")
+
+
+@dataclass
+class PollProfile:
+    """Everything captured while profiling one poll."""
+
+    entry_id: str
+    model: str | None
+    started: str
+    duration: float
+    success: bool
+    profiler: cProfile.Profile
+    allocations: list[tracemalloc.StatisticDiff]
+    peak_memory: int
+    spans: list[dict[str, Any]] = field(default_factory=list)
+
+
+async def async_capture_poll(entry_id: str, integration: Any) -> PollProfile:
+    """Run one refresh under cProfile and tracemalloc.
+
+    Tracing is switched on for the refresh to split its time by module; the
+    profiler, tracemalloc and the tracer are back to their previous state when
+    this returns.
+    """
+    coordinator = integration.coordinator
+    tracer = getattr(integration, "tracer", None)
+    was_tracing = getattr(tracer, "enabled", False)
+    start_tracemalloc = not tracemalloc.is_tracing()
+    profiler = cProfile.Profile()
+
+    if tracer is not None:
+        tracer.enabled = True
+    if start_tracemalloc:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    started = dt_util.utcnow().isoformat()
+    began = time.monotonic()
+    try:
+        profiler.enable()
+        try:
+            await coordinator.async_refresh()
+        finally:
+            profiler.disable()
+        duration = time.monotonic() - began
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if start_tracemalloc:
+            tracemalloc.stop()
+        spans: list[dict[str, Any]] = []
+        if tracer is not None:
+            # a refresh without changes is not dispatched and leaves its trace open
+            if tracer.active:
+                tracer.finish()
+            tracer.enabled = was_tracing
+            if tracer.traces:
+                spans = tracer.traces[-1]["spans"]
+                if not was_tracing:
+                    tracer.traces.pop()
+
+    return PollProfile(
+        entry_id=entry_id,
+        model=getattr(integration, "model", None),
+        started=started,
+        duration=duration,
+        success=bool(getattr(coordinator, "last_update_success", False)),
+        profiler=profiler,
+        allocations=after.compare_to(before, "lineno")[:TOP_ALLOCATIONS],
+        peak_memory=peak,
+        spans=spans,
+    )
+
+
+def module_split(spans: list[dict[str, Any]]) -> dict[str, dict[str, float]]:
+    """Requests, request time and parse time of each module of a traced poll."""
+    split: dict[str, dict[str, float]] = {}
+    for span in spans:
+        if span.get("name") not in ("request", "parse"):
+            continue
+        module = span.get("module") or "-"
+        row = split.setdefault(module, {"requests": 0, "request_ms": 0.0, "parse_ms": 0.0})
+        if span["name"] == "request":
+            row["requests"] += 1
+            row["request_ms"] += span.get("duration_ms", 0.0)
+        else:
+            row["parse_ms"] += span.get("duration_ms", 0.0)
+    return dict(sorted(split.items(), key=lambda item: -(item[1]["request_ms"] + item[1]["parse_ms"])))
+
+
+def hot_functions(stats: pstats.Stats, limit: int = TOP_FUNCTIONS) -> list[tuple[str, int, float, float]]:
+    """(function, calls, own seconds, cumulative seconds) in HOT_FILES, by cumulative time."""
+    rows = []
+    for (filename, lineno, name), (_cc, calls, own, cumulative, _callers) in stats.stats.items():
+        if os.path.dirname(filename) != _CORE_DIR or os.path.basename(filename) not in HOT_FILES:
+            continue
+        rows.append((f"{os.path.basename(filename)}:{lineno}({name})", calls, own, cumulative))
+    rows.sort(key=lambda row: -row[3])
+    return rows[:limit]
+
+
+def format_report(profile: PollProfile) -> str:
+    stats = pstats.Stats(profile.profiler)
+    lines = [
+        f"Cudy router poll profile: {profile.entry_id} ({profile.model})",
+        f"started {profile.started}, {profile.duration * 1000:.1f} ms, "
+        f"{'succeeded' if profile.success else 'failed'}",
+        f"peak traced memory {profile.peak_memory / 1024:.1f} KiB",
+        "",
+        "Per module",
+        f"{'module':<20}{'requests':>10}{'request ms':>12}{'parse ms':>10}",
+    ]
+    for module, row in module_split(profile.spans).items():
+        lines.append(
+            f"{module:<20}{row['requests']:>10}{row['request_ms']:>12.1f}{row['parse_ms']:>10.1f}"
+        )
+
+    lines += [
+        "",
+        f"Hot functions in {', '.join(HOT_FILES)}",
+        f"{'calls':>8}{'own ms':>10}{'cum ms':>10}  function",
+    ]
+    for function, calls, own, cumulative in hot_functions(stats):
+        lines.append(f"{calls:>8}{own * 1000:>10.2f}{cumulative * 1000:>10.2f}  {function}")
+
+    lines += ["", "Allocations during the poll"]
+    lines += [str(stat) for stat in profile.allocations]
+
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+    lines += ["", "All functions", out.getvalue().strip("\n")]
+    return "\n".join(lines) + "\n"
+
+
+def write_profile(profile: PollProfile, base: str) -> str:
+    """Write the report and the raw pstats next to it; returns the report path."""
+    profile.profiler.dump_stats(f"{base}.prof")
+    path = f"{base}.txt"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(format_report(profile))
+    return path
+
+
+async def async_profile_entry(hass: HomeAssistant, entry_id: str, integration: Any) -> str:
+    profile = await async_capture_poll(entry_id, integration)
+    stamp = dt_util.utcnow().strftime("%Y%m%d_%H%M%S")
+    base = hass.config.path(f"{DOMAIN}_profile_{entry_id}_{stamp}")
+    path = await hass.async_add_executor_job(write_profile, profile, base)
+    _LOGGER.info("Profile of a %s poll written to %s", profile.model, path)
+    return path
+
+
+async def _async_profile_poll(call: ServiceCall) -> ServiceResponse:
+    hass = call.hass
+    loaded = hass.data.get(DOMAIN, {})
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    if entry_id is not None:
+        if entry_id not in loaded:
+            raise ServiceValidationError(f"Cudy router entry {entry_id} is not loaded")
+        entry_ids = [entry_id]
+    else:
+        entry_ids = list(loaded)
+    targets = [
+        (eid, (loaded[eid] or {}).get("integration"))
+        for eid in entry_ids
+        if getattr((loaded[eid] or {}).get("integration"), "coordinator", None) is not None
+    ]
+    if not targets:
+        raise ServiceValidationError("No Cudy router to profile")
+    # cProfile allows one profiler per process
+    if hass.data.get(_RUNNING):
+        raise HomeAssistantError("A Cudy router poll is already being profiled")
+
+    hass.data[_RUNNING] = True
+    try:
+        files = [await async_profile_entry(hass, eid, integration) for eid, integration in targets]
+    except ValueError as err:
+        raise HomeAssistantError(f"Profiling not possible: {err}") from err
+    finally:
+        hass.data.pop(_RUNNING, None)
+    return {"files": files}
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_POLL):
+        return
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_POLL,
+        _async_profile_poll,
+        schema=PROFILE_POLL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -1,17 +1,65 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers import entity_registry as er
 
-from .client import CudyClient
+from .core.client import CudyClient
 from .coordinator import CudyCoordinator
 from .api import CudyApi
-from .const import CUDY_DEVICES
+from .capture import ResponseCapture
+from .const import (
+    CAPABILITY_URLS,
+    CONF_CAPTURE,
+    CONF_TRACING,
+    CONF_WATCHDOG,
+    CUDY_DEVICES,
+    MODULE_DEVICE_LIST,
+    MODULE_SYSTEM,
+    SENSORS,
+    SENSORS_KEY_KEY,
+)
+from .core.tracing import PollTracer
+from .watchdog import LoopWatchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+# modules polled regardless of sensor entities: device info and device trackers
+ALWAYS_POLLED = {MODULE_SYSTEM, MODULE_DEVICE_LIST}
+
+
+def skipped_modules(hass: HomeAssistant, entry: ConfigEntry) -> set[str]:
+    """Modules whose sensor entities are all disabled in the entity registry.
+
+    A module without any registered entity is still polled, so values showing
+    up for the first time keep creating entities.
+    """
+    prefix = f"{entry.entry_id}_"
+    by_unique_id = {
+        f"{prefix}{module}_{sd[SENSORS_KEY_KEY]}": module
+        for module, sensor_defs in SENSORS.items()
+        for sd in sensor_defs
+        if sd.get(SENSORS_KEY_KEY)
+    }
+
+    enabled: set[str] = set()
+    registered: set[str] = set()
+    for reg_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+        module = by_unique_id.get(reg_entry.unique_id)
+        if module is None:
+            continue
+        registered.add(module)
+        if reg_entry.disabled_by is None:
+            enabled.add(module)
+
+    return {
+        module for module in registered - enabled
+        if module in CAPABILITY_URLS and module not in ALWAYS_POLLED
+    }
+
 
 class CudyIntegration:
     """Runtime integration instance.
@@ -32,17 +80,80 @@ class CudyIntegration:
         self.client = client
         self.model = model
 
-        self.api = CudyApi(client)
+        # one tracer per entry, shared by the client, the API and the coordinator
+        self.tracer = PollTracer(enabled=bool(entry.options.get(CONF_TRACING, False)))
+        client.tracer = self.tracer
+        self.watchdog = LoopWatchdog(model, enabled=bool(entry.options.get(CONF_WATCHDOG, False)))
+        self.capture = ResponseCapture(
+            enabled=bool(entry.options.get(CONF_CAPTURE, False)),
+            secrets=(entry.data.get("password") or "",),
+        )
+        self.api = CudyApi(
+            client, model, tracer=self.tracer, watchdog=self.watchdog, capture=self.capture
+        )
 
         self.coordinator = CudyCoordinator(
             hass=hass,
             entry=entry,
             api=self.api,
             host=entry.data.get("host"),
+            model=model,
+            tracer=self.tracer,
+            watchdog=self.watchdog,
         )
 
-    async def async_setup(self) -> None:
-        await self.coordinator.async_config_entry_first_refresh()
+    async def async_setup(self, system: dict[str, Any] | None = None) -> None:
+        """Seed the coordinator with the system page read during model detection.
+
+        Platforms can be forwarded right away; the remaining modules are loaded
+        by ``async_start`` in the background.
+        """
+        if not system:
+            return
+        self.api.prefetched(MODULE_SYSTEM, system)
+        self.coordinator.async_set_updated_data({MODULE_SYSTEM: system})
+
+    @callback
+    def async_restore(self, snapshot: dict[str, Any]) -> None:
+        """Serve the persisted snapshot until the background refresh replaces it."""
+        self.coordinator.async_restore_snapshot(snapshot)
+
+    @callback
+    def async_update_fetch_plan(self) -> None:
+        """Stop polling modules whose entities are all disabled (and resume when enabled)."""
+        skipped = skipped_modules(self.hass, self.entry)
+        if skipped != self.api.skipped_modules:
+            _LOGGER.debug("Modules not polled for %s: %s", self.model, sorted(skipped))
+            self.api.skipped_modules = skipped
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        self.async_update_fetch_plan()
+
+    @callback
+    def _is_own_entity_change(self, event_data: er.EventEntityRegistryUpdatedData) -> bool:
+        if event_data["action"] == "update" and "disabled_by" not in event_data["changes"]:
+            return False
+        entity = er.async_get(self.hass).async_get(event_data["entity_id"])
+        # removed entities are gone from the registry, recompute for those anyway
+        return entity is None or entity.config_entry_id == self.entry.entry_id
+
+    @callback
+    def async_start(self) -> None:
+        """Load all modules without blocking setup."""
+        self.async_update_fetch_plan()
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                self._async_entity_registry_updated,
+                event_filter=self._is_own_entity_change,
+            )
+        )
+        self.entry.async_create_task(
+            self.hass,
+            self.coordinator.async_refresh(),
+            f"{self.entry.entry_id} first refresh",
+        )
 
 
 async def create_model_integration(
@@ -61,5 +172,4 @@ async def create_model_integration(
         client=client,
         model=model,
     )
-    await integration.async_setup()
     return integration
\ No newline at end of file
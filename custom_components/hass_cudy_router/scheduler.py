@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass, field
+
+# Weak router CPUs render most LuCI pages in shell scripts, keep the ceiling low
+DEFAULT_MAX_CONCURRENCY = 4
+# A poll counts as congested when server times exceed their baseline by this factor
+CONGESTION_RATIO = 1.5
+EWMA_ALPHA = 0.3
+# How fast the per-module baseline follows slower samples (faster ones reset it)
+BASELINE_DRIFT = 0.05
+# Consecutive failures a module may have before it is backed off
+FAILURE_BUDGET = 3
+BACKOFF_BASE = 60.0
+# Longest backoff; a failing module is still probed this often
+PROBE_INTERVAL = 3600.0
+
+
+@dataclass
+class EndpointCost:
+    """Moving server-time statistics for one module endpoint (seconds)."""
+
+    average: float
+    baseline: float
+    samples: int = 1
+
+    def observe(self, server_time: float) -> None:
+        self.average += EWMA_ALPHA * (server_time - self.average)
+        if server_time < self.baseline:
+            self.baseline = server_time
+        else:
+            self.baseline += BASELINE_DRIFT * (server_time - self.baseline)
+        self.samples += 1
+
+
+@dataclass
+class CostModel:
+    """Per-module router cost, fed with server time (TTFB minus connect time)."""
+
+    costs: dict[str, EndpointCost] = field(default_factory=dict)
+
+    def observe(self, module: str, server_time: float) -> float:
+        """Record a sample and return its ratio to the module's baseline."""
+        cost = self.costs.get(module)
+        if cost is None:
+            self.costs[module] = EndpointCost(average=server_time, baseline=server_time)
+            return 1.0
+        ratio = server_time / cost.baseline if cost.baseline > 0 else 1.0
+        cost.observe(server_time)
+        return ratio
+
+    def cost(self, module: str) -> float:
+        cost = self.costs.get(module)
+        # unknown modules go first so they get measured
+        return cost.average if cost is not None else math.inf
+
+    def order(self, modules: list[str]) -> list[str]:
+        """Most expensive first, so slow pages overlap with the cheap ones."""
+        return sorted(modules, key=self.cost, reverse=True)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        return {
+            module: {
+                "average_ms": round(cost.average * 1000, 2),
+                "baseline_ms": round(cost.baseline * 1000, 2),
+                "samples": cost.samples,
+            }
+            for module, cost in self.costs.items()
+        }
+
+
+@dataclass
+class AimdLimiter:
+    """Additive-increase / multiplicative-decrease limit of concurrent requests.
+
+    After every poll the limit grows by one while the router answers as fast as
+    its baseline, and is halved as soon as concurrency makes it slower.
+    """
+
+    limit: int = 1
+    minimum: int = 1
+    maximum: int = DEFAULT_MAX_CONCURRENCY
+    decrease: float = 0.5
+    congestion_ratio: float = CONGESTION_RATIO
+
+    def on_poll(self, latency_ratios: list[float]) -> int:
+        if not latency_ratios:
+            return self.limit
+        ratio = sum(latency_ratios) / len(latency_ratios)
+        if ratio > self.congestion_ratio:
+            self.limit = max(self.minimum, int(self.limit * self.decrease))
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+        return self.limit
+
+
+@dataclass
+class ModuleFailures:
+    """Consecutive failures of one module and when it may be fetched again."""
+
+    failures: int = 0
+    retry_at: float = 0.0
+    last_error: str | None = None
+    skipped: int = 0
+
+
+@dataclass
+class ErrorBudget:
+    """Per-module failure tracking with exponential backoff.
+
+    A module may fail ``budget`` times in a row; after that it is retried after
+    ``base`` seconds, doubling with every failure up to ``probe_interval``.
+    One success resets it.
+    """
+
+    budget: int = FAILURE_BUDGET
+    base: float = BACKOFF_BASE
+    probe_interval: float = PROBE_INTERVAL
+    modules: dict[str, ModuleFailures] = field(default_factory=dict)
+
+    def allowed(self, module: str, now: float | None = None) -> bool:
+        state = self.modules.get(module)
+        if state is None or state.failures < self.budget:
+            return True
+        now = time.monotonic() if now is None else now
+        if now >= state.retry_at:
+            return True
+        state.skipped += 1
+        return False
+
+    def on_success(self, module: str) -> None:
+        self.modules.pop(module, None)
+
+    def on_failure(self, module: str, error: str, now: float | None = None) -> float:
+        """Record a failure; returns the backoff delay in seconds (0 within budget)."""
+        now = time.monotonic() if now is None else now
+        state = self.modules.setdefault(module, ModuleFailures())
+        state.failures += 1
+        state.last_error = error
+        if state.failures < self.budget:
+            return 0.0
+        delay = min(self.base * 2 ** (state.failures - self.budget), self.probe_interval)
+        state.retry_at = now + delay
+        return delay
+
+    def as_dict(self, now: float | None = None) -> dict[str, dict[str, object]]:
+        now = time.monotonic() if now is None else now
+        return {
+            module: {
+                "failures": state.failures,
+                "backed_off": state.failures >= self.budget and now < state.retry_at,
+                "retry_in_s": round(max(state.retry_at - now, 0.0), 1),
+                "skipped_polls": state.skipped,
+                "last_error": state.last_error,
+            }
+            for module, state in self.modules.items()
+        }
@@ -3,14 +3,16 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import *
 from .coordinator import CudyCoordinator
+from .watchdog import watch
 
 
 @dataclass(frozen=True)
@@ -23,6 +25,23 @@ class _SensorDef:
     translation_key: str
 
 
+def _enum(kind: type, value: str | None) -> Any | None:
+    """HA enum member for a plain value from the HA-free sensor specs."""
+    return kind(value) if value else None
+
+
+# key -> (icon, unit, state class) of the diagnostic sensors describing the polling
+PERFORMANCE_SENSORS: dict[str, tuple[str, str | None, SensorStateClass | None]] = {
+    PERF_POLL_DURATION: ("mdi:timer-outline", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    PERF_POLL_DURATION_P95: ("mdi:timer-alert-outline", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    PERF_POLL_BYTES: ("mdi:download-network", UnitOfInformation.BYTES, SensorStateClass.MEASUREMENT),
+    PERF_PARSE_TIME: ("mdi:cpu-64-bit", UnitOfTime.MILLISECONDS, SensorStateClass.MEASUREMENT),
+    PERF_LOGINS: ("mdi:login", None, SensorStateClass.TOTAL_INCREASING),
+    PERF_FAILED_MODULES: ("mdi:alert-circle-outline", None, SensorStateClass.MEASUREMENT),
+    PERF_SCAN_INTERVAL: ("mdi:update", UnitOfTime.SECONDS, None),
+}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -31,6 +50,30 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: CudyCoordinator = data["coordinator"]
 
+    known: set[str] = set()
+
+    @callback
+    def _async_add_new_sensors() -> None:
+        """Add sensors for values that appeared since the last update."""
+        entities = _new_sensors(coordinator, entry, known)
+        if entities:
+            async_add_entities(entities)
+
+    if hasattr(coordinator, "performance"):
+        async_add_entities(
+            CudyPerformanceSensor(coordinator, entry, key) for key in PERFORMANCE_SENSORS
+        )
+
+    # setup only sees the seeded modules, the rest arrives with later refreshes
+    _async_add_new_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_sensors))
+
+
+def _new_sensors(
+    coordinator: CudyCoordinator,
+    entry: ConfigEntry,
+    known: set[str],
+) -> list[CudySensor]:
     entities: list[CudySensor] = []
     modules: dict[str, dict[str, Any]] = coordinator.data or {}
 
@@ -51,6 +94,11 @@ async def async_setup_entry(
             if sensor_key not in module_data:
                 continue
 
+            unique_key = f"{module_name}_{sensor_key}"
+            if unique_key in known:
+                continue
+            known.add(unique_key)
+
             entities.append(
                 CudySensor(
                     coordinator=coordinator,
@@ -59,14 +107,14 @@ async def async_setup_entry(
                         module=module_name,
                         key=sensor_key,
                         icon=sd.get(SENSORS_KEY_ICON),
-                        entity_category=sd.get(SENSORS_KEY_CATEGORY),
-                        state_class=sd.get(SENSORS_KEY_CLASS),
+                        entity_category=_enum(EntityCategory, sd.get(SENSORS_KEY_CATEGORY)),
+                        state_class=_enum(SensorStateClass, sd.get(SENSORS_KEY_CLASS)),
                         translation_key=sensor_key,  # 🔑 THIS fixes translations
                     ),
                 )
             )
 
-    async_add_entities(entities)
+    return entities
 
 
 class CudySensor(SensorEntity):
@@ -116,6 +164,14 @@ class CudySensor(SensorEntity):
             return None
         return module.get(self._def.key)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        with watch(self.coordinator, "attributes", self._def.module):
+            # restored from the snapshot, not yet confirmed by the router
+            if getattr(self.coordinator, "stale", False) is True:
+                return {"stale": True}
+            return None
+
     async def async_added_to_hass(self) -> None:
         self.coordinator.async_add_listener(self.async_write_ha_state)
 
@@ -136,4 +192,40 @@ class CudySensor(SensorEntity):
             manufacturer="Cudy",
             model=model,
             sw_version=sw_version,
-        )
\ No newline at end of file
+        )
+
+
+class CudyPerformanceSensor(CudySensor):
+    """Diagnostic sensor fed by the integration's own poll counters."""
+
+    # opt-in: one set per router adds up
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: CudyCoordinator, entry: ConfigEntry, key: str) -> None:
+        icon, unit, state_class = PERFORMANCE_SENSORS[key]
+        super().__init__(
+            coordinator=coordinator,
+            entry=entry,
+            sensor_def=_SensorDef(
+                module=MODULE_PERFORMANCE,
+                key=key,
+                icon=icon,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                state_class=state_class,
+                translation_key=key,
+            ),
+        )
+        self._attr_native_unit_of_measurement = unit
+
+    @property
+    def available(self) -> bool:
+        # failed polls are what these sensors are about
+        return True
+
+    @property
+    def native_value(self) -> Any:
+        return self.coordinator.performance().get(self._def.key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        return None
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import ipaddress
+import re
+import time
+from typing import Any, Callable
+
+from custom_components.hass_cudy_router.const import *
+
+# Sensor values that legitimately change between two reads of the same module
+VOLATILE_SENSORS = {
+    SENSOR_SYSTEM_UPTIME,
+    SENSOR_SYSTEM_LOCALTIME,
+    SENSOR_WAN_UPTIME,
+}
+
+UbusCall = tuple[str, str, dict[str, Any]]
+
+
+def _dig(data: Any, *keys: Any) -> Any:
+    for key in keys:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and isinstance(key, int) and -len(data) <= key < len(data):
+            data = data[key]
+        else:
+            return None
+    return data
+
+
+def _format_duration(seconds: Any) -> str | None:
+    """Format seconds like the LuCI status pages do (``[Nd ]HH:MM:SS``)."""
+    if not isinstance(seconds, (int, float)):
+        return None
+    seconds = int(seconds)
+    days, rest = divmod(seconds, 86400)
+    hours, rest = divmod(rest, 3600)
+    minutes, secs = divmod(rest, 60)
+    clock = f"{hours:02d}:{minutes:02d}:{secs:02d}"
+    return f"{days}d {clock}" if days else clock
+
+
+def _netmask(prefix: Any) -> str | None:
+    if not isinstance(prefix, int):
+        return None
+    return str(ipaddress.IPv4Network(f"0.0.0.0/{prefix}").netmask)
+
+
+def _ipv4(status: Any) -> dict[str, Any]:
+    addr = _dig(status, "ipv4-address", 0)
+    return addr if isinstance(addr, dict) else {}
+
+
+def _gateway(status: Any) -> str | None:
+    for route in _dig(status, "route") or []:
+        if isinstance(route, dict) and route.get("target") == "0.0.0.0" and route.get("mask") == 0:
+            return route.get("nexthop")
+    return None
+
+
+def _map_system(results: list[Any]) -> dict[str, Any]:
+    board, info = results
+    model = _dig(board, "model")
+    if isinstance(model, str):
+        # "Cudy WR3000 v1" -> "WR3000"
+        model = re.sub(r"^\s*cudy\s+", "", model, flags=re.IGNORECASE)
+        model = re.sub(r"\s+v\d+(\.\d+)*\s*$", "", model, flags=re.IGNORECASE)
+    localtime = _dig(info, "localtime")
+    return {
+        SENSOR_SYSTEM_MODEL: model or None,
+        SENSOR_SYSTEM_UPTIME: _format_duration(_dig(info, "uptime")),
+        SENSOR_SYSTEM_LOCALTIME: (
+            time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(localtime))
+            if isinstance(localtime, (int, float))
+            else None
+        ),
+    }
+
+
+def _map_lan(results: list[Any]) -> dict[str, Any]:
+    status, devices = results
+    addr = _ipv4(status)
+    device = _dig(devices, _dig(status, "l3_device") or _dig(status, "device"))
+    return {
+        SENSOR_LAN_IP: addr.get("address"),
+        SENSOR_LAN_SUBNET: _netmask(addr.get("mask")),
+        SENSOR_LAN_MAC: (_dig(device, "mac") or "").upper() or None,
+    }
+
+
+def _map_wan(results: list[Any]) -> dict[str, Any]:
+    (status,) = results
+    dns = _dig(status, "dns-server") or []
+    return {
+        SENSOR_WAN_TYPE: _dig(status, "proto"),
+        SENSOR_WAN_IP: _ipv4(status).get("address"),
+        SENSOR_WAN_GATEWAY: _gateway(status),
+        SENSOR_WAN_UPTIME: _format_duration(_dig(status, "uptime")),
+        SENSOR_WAN_DNS: ", ".join(dns) if dns else None,
+    }
+
+
+def _map_dhcp(results: list[Any]) -> dict[str, Any]:
+    section, status = results
+    values = _dig(section, "values") or {}
+    addr = _ipv4(status)
+    ip_start = ip_end = None
+    try:
+        network = ipaddress.IPv4Network(f"{addr['address']}/{addr['mask']}", strict=False)
+        start = int(values["start"])
+        ip_start = str(network.network_address + start)
+        ip_end = str(network.network_address + start + int(values["limit"]) - 1)
+    except (KeyError, TypeError, ValueError):
+        pass
+    dns = [
+        opt.split(",", 1)[1]
+        for opt in values.get("dhcp_option") or []
+        if isinstance(opt, str) and opt.startswith("6,")
+    ]
+    dns_servers = dns[0].split(",") if dns else []
+    lease = values.get("leasetime")
+    if isinstance(lease, str) and lease.endswith("m"):
+        lease = f"{lease[:-1]} Mins"
+    return {
+        SENSOR_DHCP_IP_START: ip_start,
+        SENSOR_DHCP_IP_END: ip_end,
+        SENSOR_DHCP_DNS_PRIMARY: dns_servers[0] if dns_servers else addr.get("address"),
+        SENSOR_DHCP_DNS_SECONDARY: dns_servers[1] if len(dns_servers) > 1 else None,
+        SENSOR_DHCP_GATEWAY: addr.get("address"),
+        SENSOR_DHCP_LEASE_TIME: lease,
+    }
+
+
+def _map_wireless(prefix: str) -> Callable[[list[Any]], dict[str, Any]]:
+    keys = {
+        "24g": (SENSOR_24G_WIFI_SSID, SENSOR_24G_WIFI_BSSID, SENSOR_24G_WIFI_ENCRYPTION, SENSOR_24G_WIFI_CHANNEL),
+        "5g": (SENSOR_5G_WIFI_SSID, SENSOR_5G_WIFI_BSSID, SENSOR_5G_WIFI_ENCRYPTION, SENSOR_5G_WIFI_CHANNEL),
+        "6g": (SENSOR_6G_WIFI_SSID, SENSOR_6G_WIFI_BSSID, SENSOR_6G_WIFI_ENCRYPTION, SENSOR_6G_WIFI_CHANNEL),
+    }[prefix]
+
+    def mapper(results: list[Any]) -> dict[str, Any]:
+        (info,) = results
+        ssid, bssid, encryption, channel = keys
+        return {
+            ssid: _dig(info, "ssid"),
+            bssid: _dig(info, "bssid"),
+            encryption: _dig(info, "encryption", "description"),
+            channel: _dig(info, "channel"),
+        }
+
+    return mapper
+
+
+# module -> (ubus calls sent in the batch, mapper from call results to SENSORS keys)
+UBUS_MODULES: dict[str, tuple[list[UbusCall], Callable[[list[Any]], dict[str, Any]]]] = {
+    MODULE_SYSTEM: (
+        [("system", "board", {}), ("system", "info", {})],
+        _map_system,
+    ),
+    MODULE_LAN: (
+        [("network.interface.lan", "status", {}), ("luci-rpc", "getNetworkDevices", {})],
+        _map_lan,
+    ),
+    MODULE_WAN: (
+        [("network.interface.wan", "status", {})],
+        _map_wan,
+    ),
+    MODULE_WAN_SECONDARY: (
+        [("network.interface.wand", "status", {})],
+        _map_wan,
+    ),
+    MODULE_DHCP: (
+        [("uci", "get", {"config": "dhcp", "section": "lan"}), ("network.interface.lan", "status", {})],
+        _map_dhcp,
+    ),
+    MODULE_WIRELESS_24G: (
+        [("iwinfo", "info", {"device": "wlan00"})],
+        _map_wireless("24g"),
+    ),
+    MODULE_WIRELESS_5G: (
+        [("iwinfo", "info", {"device": "wlan10"})],
+        _map_wireless("5g"),
+    ),
+    MODULE_WIRELESS_6G: (
+        [("iwinfo", "info", {"device": "wlan20"})],
+        _map_wireless("6g"),
+    ),
+}
+
+
+def ubus_calls(modules: list[str]) -> list[UbusCall]:
+    """Flatten the calls of the given modules into one batch (in module order)."""
+    calls: list[UbusCall] = []
+    for module in modules:
+        calls.extend(UBUS_MODULES[module][0])
+    return calls
+
+
+def map_ubus_results(modules: list[str], results: list[Any]) -> dict[str, dict[str, Any] | None]:
+    """Split batch results back per module; None when a call of the module failed."""
+    out: dict[str, dict[str, Any] | None] = {}
+    index = 0
+    for module in modules:
+        calls, mapper = UBUS_MODULES[module]
+        chunk = results[index:index + len(calls)]
+        index += len(calls)
+        if len(chunk) != len(calls) or any(r is None for r in chunk):
+            out[module] = None
+            continue
+        out[module] = mapper(chunk)
+    return out
+
+
+def agrees_with_html(html_data: Any, ubus_data: Any) -> bool:
+    """True if ubus reproduces every (non-volatile) value scraped from the HTML page."""
+    if not isinstance(html_data, dict) or not isinstance(ubus_data, dict):
+        return False
+    found = {k: v for k, v in html_data.items() if v is not None}
+    if not found:
+        return False
+    for key, value in found.items():
+        other = ubus_data.get(key)
+        if other is None:
+            return False
+        if key not in VOLATILE_SENSORS and str(other).strip().lower() != str(value).strip().lower():
+            return False
+    return True
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+# a section holding the loop longer than this is logged
+SLOW_SECTION_MS = 50.0
+# upper bounds (ms) of the histogram buckets; the last bucket is unbounded
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+# slow sections kept for diagnostics
+MAX_SLOW = 20
+
+_NOOP = nullcontext()
+
+
+class LoopWatchdog:
+    """Times the synchronous sections the integration runs on the event loop.
+
+    Sections are parse calls, the coordinator's listener dispatch and entity
+    attribute builds. Each kind gets a duration histogram; sections over the
+    threshold are logged. While disabled, ``section()`` hands out a shared
+    no-op context.
+    """
+
+    def __init__(
+        self, model: str | None = None, enabled: bool = False, threshold_ms: float = SLOW_SECTION_MS
+    ) -> None:
+        self.model = model
+        self.enabled = enabled
+        self.threshold_ms = threshold_ms
+        # kind -> counts per bucket, the last one for anything above BUCKETS_MS
+        self.histograms: dict[str, list[int]] = {}
+        self.max_ms: dict[str, float] = {}
+        self.slow: deque[dict[str, Any]] = deque(maxlen=MAX_SLOW)
+
+    def section(self, kind: str, module: str | None = None):
+        if not self.enabled:
+            return _NOOP
+        return self._section(kind, module)
+
+    @contextmanager
+    def _section(self, kind: str, module: str | None) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(kind, module, (time.perf_counter() - start) * 1000)
+
+    def observe(self, kind: str, module: str | None, duration_ms: float) -> None:
+        counts = self.histograms.setdefault(kind, [0] * (len(BUCKETS_MS) + 1))
+        counts[bisect.bisect_left(BUCKETS_MS, duration_ms)] += 1
+        self.max_ms[kind] = max(self.max_ms.get(kind, 0.0), duration_ms)
+        if duration_ms < self.threshold_ms:
+            return
+        _LOGGER.warning(
+            "Cudy router %s blocked the event loop for %.1f ms in %s (module %s)",
+            self.model,
+            duration_ms,
+            kind,
+            module or "-",
+        )
+        self.slow.append(
+            {
+                "kind": kind,
+                "module": module,
+                "duration_ms": round(duration_ms, 2),
+                "at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound}ms" for bound in BUCKETS_MS] + ["inf"]
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self.threshold_ms,
+            "histograms": {
+                kind: {
+                    "count": sum(counts),
+                    "max_ms": round(self.max_ms.get(kind, 0.0), 2),
+                    "buckets": dict(zip(labels, counts)),
+                }
+                for kind, counts in self.histograms.items()
+            },
+            "slow": list(self.slow),
+        }
+
+
+def watch(owner: Any, kind: str, module: str | None = None):
+    """Section of ``owner.watchdog``; a no-op for owners without a watchdog."""
+    watchdog = getattr(owner, "watchdog", None)
+    if not isinstance(watchdog, LoopWatchdog):
+        return _NOOP
+    return watchdog.section(kind, module)
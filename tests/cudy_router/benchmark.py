@@ -0,0 +1,159 @@
+"""Helpers for the benchmark tests: timing, peak memory and baseline files."""
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from custom_components.hass_cudy_router.const import CAPABILITY_URLS
+from tests.cudy_router.fixtures import BASE
+
+BASELINE_DIR = Path(__file__).resolve().parent / "benchmarks"
+# A result slower than baseline * (1 + threshold) is a regression
+DEFAULT_THRESHOLD = 0.5
+# baseline key describing where it was recorded; timings only compare on that machine
+ENVIRONMENT = "_environment"
+
+
+def threshold() -> float:
+    return float(os.getenv("CUDY_BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+
+
+@dataclass
+class Page:
+    model: str
+    module: str
+    html: str
+
+    @property
+    def size(self) -> int:
+        return len(self.html.encode())
+
+
+def corpus(modules: list[str] | None = None) -> Iterator[Page]:
+    """Every fixture page of a known module, model by model."""
+    for model_dir in sorted(p for p in BASE.iterdir() if p.is_dir()):
+        for module in modules or CAPABILITY_URLS:
+            path = model_dir / f"{module}.html"
+            if path.is_file():
+                yield Page(model_dir.name, module, path.read_text(encoding="utf-8", errors="ignore"))
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def write_results(results: dict[str, Any]) -> Path | None:
+    """Also write results to ``CUDY_BENCH_OUTPUT`` when set, for comparing runs."""
+    output = os.getenv("CUDY_BENCH_OUTPUT")
+    if not output:
+        return None
+    path = Path(output)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def best_time(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Best wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    """Peak bytes allocated by one call."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@dataclass
+class Throughput:
+    pages: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    peak_bytes: int = 0
+
+    def add(self, size: int, seconds: float, peak: int) -> None:
+        self.pages += 1
+        self.bytes += size
+        self.seconds += seconds
+        self.peak_bytes = max(self.peak_bytes, peak)
+
+    @property
+    def pages_per_s(self) -> float:
+        return self.pages / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.bytes / 1_000_000 / self.seconds if self.seconds else 0.0
+
+    @property
+    def ms_per_page(self) -> float:
+        return self.seconds * 1000 / self.pages if self.pages else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            **asdict(self),
+            "pages_per_s": round(self.pages_per_s, 1),
+            "mb_per_s": round(self.mb_per_s, 2),
+            "ms_per_page": round(self.ms_per_page, 3),
+            "peak_kb": round(self.peak_bytes / 1024, 1),
+        }
+
+
+def load_baseline(name: str) -> dict[str, Any] | None:
+    path = BASELINE_DIR / f"{name}.json"
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(name: str, results: dict[str, Any]) -> Path:
+    """Store results as the baseline, noting the machine that measured them."""
+    BASELINE_DIR.mkdir(exist_ok=True)
+    path = BASELINE_DIR / f"{name}.json"
+    environment = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+    path.write_text(
+        json.dumps({**results, ENVIRONMENT: environment}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    metric: str,
+    limit: float,
+) -> list[str]:
+    """Cases whose ``metric`` (lower is better) grew beyond ``limit`` over the baseline."""
+    out = []
+    for case, values in sorted(results.items()):
+        reference = (baseline.get(case) or {}).get(metric)
+        if not reference:
+            continue
+        if values[metric] > reference * (1 + limit):
+            out.append(f"{case}: {metric} {values[metric]} vs baseline {reference} (+{limit:.0%} allowed)")
+    return out
@@ -3,7 +3,12 @@
 pytest_plugins = "pytest_homeassistant_custom_component"
 
 import os
+from typing import Any
+
 import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.const import DOMAIN
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -13,6 +18,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=False,
         help="Run tests that hit a real Cudy router (network tests).",
     )
+    parser.addoption(
+        "--cudy-bench",
+        action="store_true",
+        default=False,
+        help="Run the performance benchmarks (slow, compared against stored baselines).",
+    )
+    parser.addoption(
+        "--cudy-bench-update",
+        action="store_true",
+        default=False,
+        help="Store the benchmark results as the new baselines instead of comparing.",
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -20,6 +37,10 @@ def pytest_configure(config: pytest.Config) -> None:
         "markers",
         "cudy_live: marks tests that require a real router / network access",
     )
+    config.addinivalue_line(
+        "markers",
+        "cudy_bench: marks performance benchmarks (run with --cudy-bench)",
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -38,4 +59,65 @@ def cudy_live(request: pytest.FixtureRequest) -> bool:
 @pytest.fixture(autouse=True)
 def _skip_cudy_live_tests(request: pytest.FixtureRequest, cudy_live: bool) -> None:
     if request.node.get_closest_marker("cudy_live") and not cudy_live:
-        pytest.skip("Live Cudy router tests disabled (use --cudy-live or CUDY_LIVE=1)")
\ No newline at end of file
+        pytest.skip("Live Cudy router tests disabled (use --cudy-live or CUDY_LIVE=1)")
+
+
+@pytest.fixture
+def cudy_bench(request: pytest.FixtureRequest) -> bool:
+    enabled = bool(request.config.getoption("--cudy-bench"))
+    if not enabled:
+        enabled = os.getenv("CUDY_BENCH", "0") in ("1", "true", "yes", "on")
+    return enabled
+
+
+@pytest.fixture
+def cudy_bench_update(request: pytest.FixtureRequest) -> bool:
+    return bool(request.config.getoption("--cudy-bench-update"))
+
+
+@pytest.fixture(autouse=True)
+def _skip_cudy_bench_tests(request: pytest.FixtureRequest, cudy_bench: bool) -> None:
+    if request.node.get_closest_marker("cudy_bench") and not cudy_bench:
+        pytest.skip("Benchmarks disabled (use --cudy-bench or CUDY_BENCH=1)")
+
+
+@pytest.fixture
+def setup_cudy_entry(hass, monkeypatch: pytest.MonkeyPatch):
+    """Factory setting up a router entry; await ``hass.async_block_till_done()`` after it.
+
+    ``client`` (e.g. a FakeClient) replaces CudyClient, otherwise the entry talks
+    to ``host`` for real. ``model`` replaces model detection when given.
+    """
+
+    async def _setup(
+        client: Any = None,
+        model: str | None = None,
+        *,
+        host: str = "192.168.1.1",
+        options: dict[str, Any] | None = None,
+        entry_id: str | None = None,
+    ) -> MockConfigEntry:
+        if client is not None:
+            monkeypatch.setattr(
+                "custom_components.hass_cudy_router.CudyClient",
+                lambda *args, **kwargs: client,
+            )
+        if model is not None:
+
+            async def _detect_model(_client, *args):
+                return model
+
+            monkeypatch.setattr("custom_components.hass_cudy_router.detect_model", _detect_model)
+
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Cudy Router ({model})" if model else "Cudy Router",
+            data={"protocol": "http", "host": host, "username": "admin", "password": "admin"},
+            options=options or {},
+            **({"entry_id": entry_id} if entry_id else {}),
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        return entry
+
+    return _setup
@@ -0,0 +1,145 @@
+"""Synthetic ``/admin/network/devices/devlist`` pages with any number of clients.
+
+The rows follow the structure of the real fixture pages as far as
+``parse_device_list`` looks at them: ``cbi-table-*`` rows, ``hidden-xs``
+paragraphs (plus their ``visible-xs`` twins) and ↑/↓ speeds.
+
+    devlist = DevlistGenerator(seed=0)
+    html = devlist.snapshot(2000)   # first page
+    html = devlist.churn()          # some clients left, some joined
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from custom_components.hass_cudy_router.const import (
+    DEVICE_CONNECTION_TYPE,
+    DEVICE_HOSTNAME,
+    DEVICE_IP,
+    DEVICE_MAC,
+)
+
+# rough mix seen across the fixture pages
+CONNECTION_TYPES = {
+    "Wired": 0.4,
+    "2.4G WiFi": 0.2,
+    "5G WiFi": 0.3,
+    "6G WiFi": 0.05,
+    "Mesh": 0.05,
+}
+HOSTNAMES = ("Phone", "Laptop", "TV", "Camera", "Printer", "Speaker", "Tablet", "Thermostat")
+SPEED_UNITS = ("bps", "Kbps", "Mbps")
+
+PAGE = """<div class="table-responsive">
+<table class="table table-striped">
+	<thead>
+	<tr><th class="hidden-xs">No.</th><th class="hidden-xs">Hostname</th><th class="visible-xs">Hostname</th><th class="hidden-xs"></th><th class="hidden-xs">IP / MAC Address</th><th class="hidden-xs">Real-time Rate</th><th class="hidden-xs">Signal</th><th class="hidden-xs">Duration</th><th>Internet</th></tr>
+	</thead>
+	<tbody>
+	<tr class="cbi-section-table-descr"></tr>{rows}
+	</tbody>
+</table>
+</div>
+"""
+
+ROW = """<tr id="cbi-table-{idx}" data-sid="{idx}" data-store="cbi.sts.table.table">
+{cells}
+</tr>"""
+
+CELL = """<td class="{td_class}"><div id="cbi-table-{idx}-{name}">
+	<p class="form-control-static hidden-xs">{value}</p>
+	<p class="visible-xs">{value}</p>
+</div>
+<div id="cbip-table-{idx}-{name}"></div>
+</td>"""
+
+
+@dataclass
+class Client:
+    hostname: str
+    mac: str
+    ip: str
+    connection_type: str
+    upload: str
+    download: str
+    signal: str
+    online: str
+
+    def expected(self) -> dict[str, str]:
+        """The fields ``parse_device_list`` should read back for this row."""
+        return {
+            DEVICE_HOSTNAME: self.hostname,
+            DEVICE_IP: self.ip,
+            DEVICE_MAC: self.mac,
+            DEVICE_CONNECTION_TYPE: self.connection_type,
+        }
+
+
+class DevlistGenerator:
+    """Builds devlist pages and keeps the client population between snapshots."""
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._random = random.Random(seed)
+        self._next_id = 0
+        self.clients: list[Client] = []
+
+    def _speed(self) -> str:
+        return f"{self._random.uniform(0, 999):.2f} {self._random.choice(SPEED_UNITS)}"
+
+    def _client(self) -> Client:
+        # sequential ids keep MACs and IPs unique however many clients come and go
+        self._next_id += 1
+        n = self._next_id
+        conn_type = self._random.choices(
+            list(CONNECTION_TYPES), weights=list(CONNECTION_TYPES.values())
+        )[0]
+        seconds = self._random.randrange(86400)
+        return Client(
+            hostname=f"{self._random.choice(HOSTNAMES)}-{n}",
+            mac="02:" + ":".join(f"{(n >> s) & 0xFF:02X}" for s in (32, 24, 16, 8, 0)),
+            ip=f"10.{(n >> 16) & 0xFF}.{(n >> 8) & 0xFF}.{n & 0xFF}",
+            connection_type=conn_type,
+            upload=self._speed(),
+            download=self._speed(),
+            signal="---" if conn_type == "Wired" else f"{self._random.randint(10, 70)}dB",
+            online=f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}",
+        )
+
+    def snapshot(self, count: int) -> str:
+        """A fresh population of ``count`` clients."""
+        self.clients = [self._client() for _ in range(count)]
+        return self.html()
+
+    def churn(self, rate: float = 0.1) -> str:
+        """Replace ``rate`` of the clients and refresh everyone's speeds."""
+        leaving = set(self._random.sample(range(len(self.clients)), int(len(self.clients) * rate)))
+        kept = [c for i, c in enumerate(self.clients) if i not in leaving]
+        for c in kept:
+            c.upload, c.download = self._speed(), self._speed()
+        self.clients = kept + [self._client() for _ in leaving]
+        return self.html()
+
+    def html(self) -> str:
+        return PAGE.format(rows="".join(_row(i, c) for i, c in enumerate(self.clients, start=1)))
+
+
+def _row(idx: int, client: Client) -> str:
+    cells = [
+        ("hidden-xs", "idx", str(idx)),
+        ("hidden-xs", "hostname", f'{client.hostname}<br /><span class="text-primary">{client.connection_type}</span>'),
+        ("visible-xs", "hostnamexs", f"{client.hostname}<br />{client.ip}"),
+        ("hidden-xs", "icon", ""),
+        ("hidden-xs", "ipmac", f"{client.ip}<br />{client.mac}"),
+        ("hidden-xs", "speed", f"↑ {client.upload}<br />↓ {client.download}"),
+        ("hidden-xs", "signal", client.signal),
+        ("hidden-xs", "online", client.online),
+        ("", "internet", ""),
+    ]
+    return ROW.format(
+        idx=idx,
+        cells="\n".join(
+            CELL.format(td_class=td_class, idx=idx, name=name, value=value)
+            for td_class, name, value in cells
+        ),
+    )
@@ -0,0 +1,244 @@
+"""Local Cudy router emulator serving the fixture pages over real HTTP.
+
+Run standalone with ``python -m tests.cudy_router.emulator --model WR3000``
+and point the integration (or ``CudyClient``) at the printed host.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import random
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.const import CAPABILITY_URLS, OVERVIEW_URL
+from tests.cudy_router.fixtures import html_exists, read_html
+
+LOGIN_PATH = "/cgi-bin/luci"
+
+LOGIN_HTML = """<!DOCTYPE html>
+<html><body>
+<form method="post" action="/cgi-bin/luci">
+<input type="hidden" name="token" value="{token}"/>
+<input type="hidden" name="salt" value="{salt}"/>
+<input type="text" name="luci_username"/>
+<input type="password" name="luci_password"/>
+</form>
+</body></html>
+"""
+
+
+@dataclass
+class EmulatorStats:
+    requests: int = 0
+    logins: int = 0
+    failed_logins: int = 0
+    errors: int = 0
+    expired: int = 0
+    not_found: int = 0
+    bytes_sent: int = 0
+    paths: dict[str, int] = field(default_factory=dict)
+
+
+class RouterEmulator:
+    """aiohttp app emulating LuCI: salt/token login, sysauth cookie and module pages.
+
+    ``latency`` and ``jitter`` delay every page (seconds), ``error_rate`` is the
+    share of page requests answered with HTTP 500 and ``session_lifetime``
+    expires a sysauth that many seconds after login (403 afterwards).
+    """
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        username: str = "admin",
+        password: str = "admin",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        session_lifetime: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self.model = model
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.session_lifetime = session_lifetime
+        self.stats = EmulatorStats()
+
+        self._random = random.Random(seed)
+        self._salt = secrets.token_hex(8)
+        self._token = secrets.token_hex(16)
+        # sysauth -> monotonic login time
+        self._sessions: dict[str, float] = {}
+        self.pages: dict[str, str] = {}
+        for module, urls in CAPABILITY_URLS.items():
+            if html_exists(model, module):
+                self.pages[CudyApi.luci(urls[0])] = read_html(model, f"{module}.html")
+        if html_exists(model, "overview"):
+            self.pages[CudyApi.luci(OVERVIEW_URL)] = read_html(model, "overview.html")
+
+        self.app = web.Application()
+        self.app.router.add_get(LOGIN_PATH, self._login_page)
+        self.app.router.add_post(LOGIN_PATH, self._login)
+        self.app.router.add_get(LOGIN_PATH + "/{tail:.*}", self._page)
+        self.app.router.add_post(LOGIN_PATH + "/{tail:.*}", self._page)
+
+        self._server: TestServer | None = None
+        self.host: str | None = None
+        self._thread: threading.Thread | None = None
+        self._thread_loop: asyncio.AbstractEventLoop | None = None
+
+    def expected_password(self) -> str:
+        hashed = hashlib.sha256((self.password + self._salt).encode()).hexdigest()
+        return hashlib.sha256((hashed + self._token).encode()).hexdigest()
+
+    def expire_sessions(self) -> None:
+        self._sessions.clear()
+
+    async def start(self, host: str = "127.0.0.1", port: int | None = None) -> str:
+        self._server = TestServer(self.app, host=host, port=port)
+        await self._server.start_server()
+        self.host = f"{host}:{self._server.port}"
+        return self.host
+
+    async def close(self) -> None:
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    def start_in_thread(self, host: str = "127.0.0.1") -> str:
+        """Serve from a separate thread and event loop.
+
+        The emulator's own work then does not count against the client's event
+        loop, which matters when that loop is what is being measured.
+        """
+        self._thread_loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._thread_loop.run_forever, name="cudy-emulator", daemon=True
+        )
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(self.start(host), self._thread_loop).result()
+
+    def stop_thread(self) -> None:
+        if self._thread_loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.close(), self._thread_loop).result()
+        self._thread_loop.call_soon_threadsafe(self._thread_loop.stop)
+        self._thread.join()
+        self._thread_loop.close()
+        self._thread = self._thread_loop = None
+
+    async def __aenter__(self) -> RouterEmulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _delay(self) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _login_html(self) -> str:
+        return LOGIN_HTML.format(token=self._token, salt=self._salt)
+
+    async def _login_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=self._login_html(), content_type="text/html")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if (
+            form.get("luci_username") != self.username
+            or form.get("luci_password") != self.expected_password()
+        ):
+            self.stats.failed_logins += 1
+            return web.Response(status=403, text=self._login_html(), content_type="text/html")
+
+        self.stats.logins += 1
+        sysauth = secrets.token_hex(16)
+        self._sessions[sysauth] = time.monotonic()
+        resp = web.Response(status=302, headers={"Location": LOGIN_PATH + "/admin"})
+        resp.set_cookie("sysauth", sysauth, path=LOGIN_PATH)
+        return resp
+
+    def _session_valid(self, sysauth: str | None) -> bool:
+        started = self._sessions.get(sysauth or "")
+        if started is None:
+            return False
+        if self.session_lifetime is not None and time.monotonic() - started > self.session_lifetime:
+            del self._sessions[sysauth]
+            self.stats.expired += 1
+            return False
+        return True
+
+    async def _page(self, request: web.Request) -> web.Response:
+        self.stats.requests += 1
+        self.stats.paths[request.path_qs] = self.stats.paths.get(request.path_qs, 0) + 1
+        if not self._session_valid(request.cookies.get("sysauth")):
+            return web.Response(status=403)
+
+        await self._delay()
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats.errors += 1
+            return web.Response(status=500)
+
+        html = self.pages.get(request.path_qs)
+        if html is None:
+            self.stats.not_found += 1
+            return web.Response(status=404)
+        body = html.encode()
+        self.stats.bytes_sent += len(body)
+        return web.Response(body=body, content_type="text/html", charset="utf-8")
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    emulator = RouterEmulator(
+        args.model,
+        username=args.username,
+        password=args.password,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        session_lifetime=args.session_lifetime,
+    )
+    host = await emulator.start(args.host, args.port)
+    print(f"Emulating {args.model} on http://{host} (Ctrl+C to stop)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await emulator.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve Cudy fixture pages over LuCI-like HTTP.")
+    parser.add_argument("--model", default="WR3000")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--session-lifetime", type=float, default=None)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
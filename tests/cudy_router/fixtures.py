@@ -4,6 +4,7 @@ from pathlib import Path
 
 from custom_components.hass_cudy_router.api import CudyApi
 from custom_components.hass_cudy_router.const import SENSORS, CAPABILITY_URLS
+from custom_components.hass_cudy_router.core.parser import extract_xhr_endpoints
 
 BASE = Path(__file__).resolve().parent / "html"
 
@@ -16,15 +17,19 @@ def html_exists(model: str, name: str) -> bool:
     p = BASE / model / name
     return p.is_file()
 
+def xhr_shell(model: str, name: str) -> bool:
+    """Fixture page that only loads its values through cbi_xhr_load fragments."""
+    return html_exists(model, name) and bool(extract_xhr_endpoints(read_html(model, f"{name}.html")))
+
 class FakeClient:
     def __init__(self, model: str) -> None:
         self._mapping = {}
-        for sensor_key in SENSORS.keys():
+        for sensor_key in CAPABILITY_URLS.keys():
             if html_exists(model, sensor_key):
                 url = CAPABILITY_URLS[sensor_key][0]
                 self._mapping[CudyApi.luci(url)] = read_html(model, f"{sensor_key}.html")
 
-    async def get(self, path: str):
+    async def get(self, path: str, **kwargs):
         if path in self._mapping.keys():
             return self._mapping[path]
         return ""
\ No newline at end of file
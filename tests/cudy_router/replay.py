@@ -0,0 +1,127 @@
+"""Replay router responses kept by the ``capture`` option, offline.
+
+Download the diagnostics of an entry with capture enabled, then:
+
+    python -m tests.cudy_router.replay config_entry-hass_cudy_router-XXXX.json --repeat 20
+
+re-parses the latest captured fetch of every module and prints its parse time
+next to the timing recorded on the router. ``--data`` prints the parsed values
+instead. ``ReplayApi`` feeds the captured polls through a ``CudyCoordinator``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from custom_components.hass_cudy_router.capture import KIND_LIGHT, KIND_PAGE, KIND_XHR, decode_body
+from custom_components.hass_cudy_router.core.parser import parse_html, parse_xhr_fragments
+from tests.cudy_router.benchmark import best_time
+
+
+@dataclass
+class Capture:
+    model: str | None
+    # module -> fetches, oldest first, as exported by ResponseCapture.as_dict()
+    modules: dict[str, list[dict[str, Any]]]
+
+    def polls(self) -> list[dict[str, dict[str, Any]]]:
+        """Fetches grouped by poll, oldest poll first."""
+        by_poll: dict[int, dict[str, dict[str, Any]]] = {}
+        for module, fetches in self.modules.items():
+            for fetch in fetches:
+                by_poll.setdefault(fetch["poll"], {})[module] = fetch
+        return [by_poll[poll] for poll in sorted(by_poll)]
+
+    def latest(self) -> dict[str, dict[str, Any]]:
+        return {module: fetches[-1] for module, fetches in self.modules.items() if fetches}
+
+
+def load_capture(source: str | Path | dict[str, Any]) -> Capture:
+    """Read a capture from downloaded diagnostics (or their ``data`` part)."""
+    data = source if isinstance(source, dict) else json.loads(Path(source).read_text(encoding="utf-8"))
+    # HA wraps the integration's diagnostics in "data"
+    data = data.get("data", data)
+    capture = data.get("capture") or {}
+    return Capture(model=data.get("model"), modules=capture.get("modules") or {})
+
+
+def parse_fetch(module: str, fetch: dict[str, Any]) -> Any:
+    """Parse one captured fetch the way CudyApi parsed the live responses."""
+    bodies: dict[str, list[str]] = {}
+    for response in fetch["responses"]:
+        bodies.setdefault(response["kind"], []).append(decode_body(response["body"]))
+    if KIND_XHR in bodies:
+        return parse_xhr_fragments(module, bodies[KIND_XHR])
+    if KIND_PAGE in bodies:
+        return parse_html(module, bodies[KIND_PAGE][0])
+    return parse_xhr_fragments(module, bodies.get(KIND_LIGHT, [])[:1])
+
+
+def replay_poll(fetches: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for module, fetch in fetches.items():
+        data = parse_fetch(module, fetch)
+        if data is not None and len(data) > 0:
+            out[module] = data
+    return out
+
+
+class ReplayApi:
+    """Stands in for CudyApi, serving the captured polls in turn."""
+
+    def __init__(self, capture: Capture) -> None:
+        self._polls = capture.polls()
+        self._next = 0
+
+    async def get_data(self) -> dict[str, Any]:
+        if not self._polls:
+            return {}
+        fetches = self._polls[self._next % len(self._polls)]
+        self._next += 1
+        return replay_poll(fetches)
+
+
+def benchmark(capture: Capture, repeat: int = 5) -> dict[str, dict[str, Any]]:
+    """Parse time of each module's latest fetch, with the timing captured live."""
+    results = {}
+    for module, fetch in sorted(capture.latest().items()):
+        results[module] = {
+            "bytes": sum(r["bytes"] for r in fetch["responses"]),
+            "elapsed_ms": fetch["elapsed_ms"],
+            "server_ms": fetch.get("server_ms"),
+            "parse_ms": round(best_time(lambda: parse_fetch(module, fetch), repeat) * 1000, 2),
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("diagnostics", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--data", action="store_true", help="print the parsed values of the latest poll")
+    args = parser.parse_args(argv)
+
+    capture = load_capture(args.diagnostics)
+    if not capture.modules:
+        print("No captured responses; enable the capture option and download diagnostics again")
+        return 1
+
+    if args.data:
+        data = replay_poll(capture.latest())
+        print(json.dumps(data, indent=2, sort_keys=True, default=str))
+        return 0
+
+    print(f"{capture.model}: {len(capture.polls())} poll(s) captured")
+    print(f"{'module':<16}{'bytes':>9}{'fetch ms':>10}{'server ms':>11}{'parse ms':>10}")
+    for module, r in benchmark(capture, args.repeat).items():
+        server = r["server_ms"] if r["server_ms"] is not None else "-"
+        print(f"{module:<16}{r['bytes']:>9}{r['elapsed_ms']:>10}{server:>11}{r['parse_ms']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
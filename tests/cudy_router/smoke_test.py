@@ -14,7 +14,7 @@ from custom_components.hass_cudy_router.model_detect import detect_model
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../.."))
 sys.path.insert(0, ROOT)
 
-from custom_components.hass_cudy_router.client import CudyClient
+from custom_components.hass_cudy_router.core.client import CudyClient
 
 # ------------------------------------------------------------------
 # CONFIG (via env vars)
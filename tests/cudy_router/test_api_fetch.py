@@ -1,4 +1,6 @@
 import pytest
+from aiohttp import ClientResponseError, RequestInfo
+from yarl import URL
 
 from custom_components.hass_cudy_router.api import CudyApi
 from custom_components.hass_cudy_router.const import *
@@ -14,4 +16,153 @@ async def test_api_get_data(model: str) -> None:
     data = await api.get_data()
 
     assert MODULE_SYSTEM in data
-    assert MODULE_DEVICES in data
\ No newline at end of file
+    assert MODULE_DEVICES in data
+
+SHELL_HTML = """
+<div id="tab-1"></div>
+<script type="text/javascript">cbi_xhr_load("#tab-1", "get", "/cgi-bin/luci/admin/network/gcom/iface/4g/info", "embedded=&iface=4g");</script>
+<div id="tab-2"></div>
+<script type="text/javascript">cbi_xhr_load("#tab-2", "poll", "/cgi-bin/luci/admin/network/gcom/iface/4g/traffic", "embedded=&iface=4g");</script>
+"""
+
+INFO_HTML = """
+<table>
+<tr><td></td><td>Public IP Address</td><td>10.0.0.1</td></tr>
+<tr><td></td><td>Connected Time</td><td>1h 2m</td></tr>
+</table>
+"""
+
+TRAFFIC_HTML = """
+<table>
+<tr><td></td><td>Download</td><td>12 MB</td></tr>
+<tr><td></td><td>Upload</td><td>3 MB</td></tr>
+</table>
+"""
+
+
+class XhrClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict | None]] = []
+        self._mapping = {
+            CudyApi.luci(CAPABILITY_URLS[MODULE_GSM][0]): SHELL_HTML,
+            "/cgi-bin/luci/admin/network/gcom/iface/4g/info": INFO_HTML,
+            "/cgi-bin/luci/admin/network/gcom/iface/4g/traffic": TRAFFIC_HTML,
+        }
+
+    async def get(self, path: str, params: dict | None = None, **kwargs):
+        self.calls.append((path, params))
+        return self._mapping.get(path, "")
+
+
+@pytest.mark.asyncio
+async def test_api_resolves_xhr_fragments() -> None:
+    client = XhrClient()
+    api = CudyApi(client, "LT400")
+
+    data = await api.get_data()
+
+    gsm = data[MODULE_GSM]
+    assert gsm[SENSOR_GSM_PUBLIC_IP] == "10.0.0.1"
+    assert gsm[SENSOR_GSM_CONNECTED_TIME] == "1h 2m"
+    assert gsm[SENSOR_GSM_DOWNLOAD] == "12 MB"
+    assert gsm[SENSOR_GSM_UPLOAD] == "3 MB"
+    assert "xhr_endpoints" not in gsm
+    assert ("/cgi-bin/luci/admin/network/gcom/iface/4g/info", {"embedded": "", "iface": "4g"}) in client.calls
+
+    shell_path = CudyApi.luci(CAPABILITY_URLS[MODULE_GSM][0])
+    client.calls.clear()
+    await api.get_data()
+    assert shell_path not in [path for path, _ in client.calls]
+
+
+@pytest.mark.asyncio
+async def test_api_drops_module_when_no_fragment_parses() -> None:
+    client = XhrClient()
+    # every fragment fails or comes back empty
+    client._mapping.pop("/cgi-bin/luci/admin/network/gcom/iface/4g/info")
+    client._mapping["/cgi-bin/luci/admin/network/gcom/iface/4g/traffic"] = "<p>error</p>"
+    api = CudyApi(client, "LT400")
+
+    data = await api.get_data()
+
+    assert MODULE_GSM not in data
+    assert api.errors.as_dict()[MODULE_GSM]["last_error"] == "no data"
+
+
+OVERVIEW_HTML = """
+<div id="status-lan"></div>
+<script type="text/javascript">cbi_xhr_load("#status-lan", "poll", "/cgi-bin/luci/admin/network/lan/status", "");</script>
+<div id="status-wifi"></div>
+<script type="text/javascript">cbi_xhr_load("#status-wifi", "poll", "/cgi-bin/luci/admin/network/wireless/status", "iface=wlan00");</script>
+"""
+
+LAN_LIGHT_HTML = """
+<table>
+<tr><td></td><td>IP Address</td><td>192.168.10.1</td></tr>
+<tr><td></td><td>Subnet Mask</td><td>255.255.255.0</td></tr>
+<tr><td></td><td>MAC-Address</td><td>AA:BB:CC:DD:EE:FF</td></tr>
+</table>
+"""
+
+
+class LightClient(FakeClient):
+    def __init__(self, model: str) -> None:
+        super().__init__(model)
+        self.paths: list[str] = []
+        self._mapping[CudyApi.luci(OVERVIEW_URL)] = OVERVIEW_HTML
+        self._mapping["/cgi-bin/luci/admin/network/lan/status"] = LAN_LIGHT_HTML
+
+    async def get(self, path: str, **kwargs):
+        self.paths.append(path)
+        return await super().get(path, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_api_prefers_light_endpoint() -> None:
+    client = LightClient("WR3000")
+    api = CudyApi(client, "WR3000")
+
+    first = await api.get_data()
+    assert MODULE_LAN in api.light_endpoints
+    # wireless light endpoint serves nothing here, the detail page stays in use
+    assert MODULE_WIRELESS_24G not in api.light_endpoints
+
+    client.paths.clear()
+    second = await api.get_data()
+
+    lan_detail = CudyApi.luci(CAPABILITY_URLS[MODULE_LAN][0])
+    assert lan_detail not in client.paths
+    assert "/cgi-bin/luci/admin/network/lan/status" in client.paths
+    assert second[MODULE_LAN].keys() == first[MODULE_LAN].keys()
+    assert second[MODULE_LAN][SENSOR_LAN_MAC] == "AA:BB:CC:DD:EE:FF"
+    assert api.bytes_saved == api.light_endpoints[MODULE_LAN].bytes_saved > 0
+
+
+@pytest.mark.asyncio
+async def test_api_falls_back_when_light_endpoint_disappears() -> None:
+    client = LightClient("WR3000")
+    api = CudyApi(client, "WR3000")
+    await api.get_data()
+    assert MODULE_LAN in api.light_endpoints
+
+    light_path = "/cgi-bin/luci/admin/network/lan/status"
+    original_get = client.get
+
+    async def _get(path: str, **kwargs):
+        if path == light_path:
+            client.paths.append(path)
+            raise ClientResponseError(RequestInfo(URL(path), "GET", {}), (), status=404)
+        return await original_get(path, **kwargs)
+
+    setattr(client, "get", _get)
+    client.paths.clear()
+    data = await api.get_data()
+
+    assert MODULE_LAN not in api.light_endpoints
+    assert CudyApi.luci(CAPABILITY_URLS[MODULE_LAN][0]) in client.paths
+    assert data[MODULE_LAN][SENSOR_LAN_MAC]
+    assert MODULE_LAN not in api.errors.modules
+
+    client.paths.clear()
+    await api.get_data()
+    assert light_path not in client.paths
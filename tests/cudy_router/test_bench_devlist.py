@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.device_tracker import DeviceIndex, async_setup_entry
+from custom_components.hass_cudy_router.core.parser import parse_device_list
+from tests.cudy_router.benchmark import (
+    best_time,
+    load_baseline,
+    regressions,
+    save_baseline,
+    threshold,
+    write_results,
+)
+from tests.cudy_router.devlist import DevlistGenerator
+
+BASELINE = "devlist"
+CLIENT_COUNTS = [int(n) for n in os.getenv("CUDY_BENCH_CLIENTS", "50,500,2000").split(",")]
+# per-device update cost may grow this much from the smallest to the largest list
+MAX_SCALING = 4.0
+
+
+def test_generated_devlist_parses_back():
+    devlist = DevlistGenerator(seed=1)
+    html = devlist.snapshot(25)
+
+    parsed = parse_device_list(html)
+
+    assert len(parsed) == 25
+    for row, client in zip(parsed, devlist.clients):
+        assert {k: row[k] for k in client.expected()} == client.expected()
+        assert row[DEVICE_UPLOAD_SPEED] and row[DEVICE_DOWNLOAD_SPEED]
+    assert {row[DEVICE_CONNECTION_TYPE] for row in parsed} > {"Wired"}
+
+
+def test_churn_replaces_some_clients():
+    devlist = DevlistGenerator(seed=1)
+    devlist.snapshot(100)
+    before = {c.mac for c in devlist.clients}
+
+    parsed = parse_device_list(devlist.churn(0.2))
+
+    after = {row[DEVICE_MAC] for row in parsed}
+    assert len(after) == 100
+    assert len(before - after) == 20
+
+
+def test_device_index_follows_coordinator_data():
+    index = DeviceIndex()
+    first = {MODULE_DEVICE_LIST: [{DEVICE_MAC: "AA:BB"}, {DEVICE_MAC: "aa:bb", DEVICE_IP: "dup"}]}
+    second = {MODULE_DEVICE_LIST: [{DEVICE_MAC: "CC:DD"}]}
+
+    assert index.get(first, "aa:BB") == {DEVICE_MAC: "AA:BB"}
+    assert index.get(second, "AA:BB") is None
+    assert index.get(second, "cc:dd") == {DEVICE_MAC: "CC:DD"}
+    assert index.get(None, "cc:dd") is None
+
+
+async def _bench_clients(hass, count: int) -> dict[str, float]:
+    devlist = DevlistGenerator(seed=count)
+    html = devlist.snapshot(count)
+    parse_ms = best_time(lambda: parse_device_list(html), repeat=3) * 1000
+
+    coordinator = MagicMock()
+    coordinator.last_update_success = True
+    coordinator.tracked_macs = None
+    coordinator.stale = False
+    coordinator.data = {MODULE_DEVICE_LIST: parse_device_list(html)}
+    entry = MagicMock(entry_id=f"bench_{count}")
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+    platform = MockEntityPlatform(hass, domain="device_tracker", platform_name=DOMAIN)
+
+    added: list[Any] = []
+    started = time.perf_counter()
+    await async_setup_entry(hass, entry, added.extend)
+    await platform.async_add_entities(added)
+    create_ms = (time.perf_counter() - started) * 1000
+    assert len(added) == count
+
+    # one poll: some clients left, the rest changed speed; every tracker writes its state
+    coordinator.data = {MODULE_DEVICE_LIST: parse_device_list(devlist.churn())}
+    started = time.perf_counter()
+    for entity in added:
+        entity.async_write_ha_state()
+    update_ms = (time.perf_counter() - started) * 1000
+
+    await platform.async_reset()
+    return {
+        "parse_ms": round(parse_ms, 2),
+        "create_ms": round(create_ms, 2),
+        "update_ms": round(update_ms, 2),
+        "update_us_per_device": round(update_ms * 1000 / count, 2),
+    }
+
+
+@pytest.mark.cudy_bench
+@pytest.mark.asyncio
+async def test_bench_device_list_scaling(hass, cudy_bench_update: bool, capsys) -> None:
+    results = {f"{count}_clients": await _bench_clients(hass, count) for count in CLIENT_COUNTS}
+    write_results(results)
+
+    with capsys.disabled():
+        print(f"\n{'clients':<14}{'parse ms':>10}{'create ms':>11}{'update ms':>11}{'us/device':>11}")
+        for case, r in results.items():
+            print(
+                f"{case:<14}{r['parse_ms']:>10}{r['create_ms']:>11}{r['update_ms']:>11}"
+                f"{r['update_us_per_device']:>11}"
+            )
+
+    # a lookup that scans the device list makes this quadratic in the client count
+    per_device = [r["update_us_per_device"] for r in results.values()]
+    assert per_device[-1] <= per_device[0] * MAX_SCALING, "Tracker updates scale worse than linearly"
+
+    baseline = load_baseline(BASELINE)
+    if baseline is None or cudy_bench_update:
+        save_baseline(BASELINE, results)
+        return
+
+    slower = []
+    for metric in ("parse_ms", "create_ms", "update_ms"):
+        slower += regressions(results, baseline, metric, threshold())
+    assert not slower, "Device list regressions:\n" + "\n".join(slower)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
+import pytest
+
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.core.parser import parse_html
+from tests.cudy_router.benchmark import (
+    Throughput,
+    best_time,
+    corpus,
+    load_baseline,
+    peak_memory,
+    regressions,
+    save_baseline,
+    threshold,
+)
+
+BASELINE = "parser"
+
+
+def test_regressions_flags_slower_cases_only():
+    baseline = {"a": {"ms_per_page": 1.0}, "b": {"ms_per_page": 1.0}}
+    results = {"a": {"ms_per_page": 1.4}, "b": {"ms_per_page": 1.6}, "c": {"ms_per_page": 9.0}}
+
+    assert [r.split(":")[0] for r in regressions(results, baseline, "ms_per_page", 0.5)] == ["b"]
+
+
+@pytest.mark.cudy_bench
+def test_bench_parse_html(cudy_bench_update: bool, capsys) -> None:
+    per_module: dict[str, Throughput] = defaultdict(Throughput)
+    total = Throughput()
+
+    for page in corpus():
+        seconds = best_time(lambda: parse_html(page.module, page.html))
+        peak = peak_memory(lambda: parse_html(page.module, page.html))
+        per_module[page.module].add(page.size, seconds, peak)
+        total.add(page.size, seconds, peak)
+
+    results = {module: t.as_dict() for module, t in sorted(per_module.items())}
+    results["total"] = total.as_dict()
+
+    with capsys.disabled():
+        print(f"\n{'module':<16}{'pages':>6}{'pages/s':>10}{'MB/s':>8}{'ms/page':>10}{'peak KB':>10}")
+        for module, r in results.items():
+            marker = " <- headline" if module == MODULE_DEVICE_LIST else ""
+            print(
+                f"{module:<16}{r['pages']:>6}{r['pages_per_s']:>10}{r['mb_per_s']:>8}"
+                f"{r['ms_per_page']:>10}{r['peak_kb']:>10}{marker}"
+            )
+
+    baseline = load_baseline(BASELINE)
+    if baseline is None or cudy_bench_update:
+        save_baseline(BASELINE, results)
+        return
+
+    slower = regressions(results, baseline, "ms_per_page", threshold())
+    slower += regressions(results, baseline, "peak_kb", threshold())
+    assert not slower, "Parser regressions:\n" + "\n".join(slower)
@@ -0,0 +1,136 @@
+"""End-to-end poll cycle benchmark against the emulator.
+
+Timings in ``benchmarks/poll.json`` are absolute and only comparable on the
+machine that recorded them. Regenerate the baseline there before comparing:
+
+    pytest tests/cudy_router/test_bench_poll.py --cudy-bench --cudy-bench-update
+"""
+from __future__ import annotations
+
+import gc
+import os
+import time
+import tracemalloc
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.core.client import CudyClient
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from tests.cudy_router.benchmark import (
+    load_baseline,
+    percentile,
+    regressions,
+    save_baseline,
+    threshold,
+    write_results,
+)
+from tests.cudy_router.emulator import RouterEmulator
+from tests.cudy_router.fixtures import html_exists
+
+BASELINE = "poll"
+# cycles run under tracemalloc after the timed ones, which it would slow down
+TRACED_CYCLES = 5
+_NOT_TRACEMALLOC = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # parsed soups are reference cycles; count what survives a collection
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(_NOT_TRACEMALLOC)
+
+
+async def _bench_model(hass, model: str, cycles: int) -> dict[str, float]:
+    emulator = RouterEmulator(model, seed=0)
+    host = emulator.start_in_thread()
+    client = CudyClient(host, "admin", "admin", reuse_window=0)
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": host}, options={})
+    entry.add_to_hass(hass)
+    coordinator = CudyCoordinator(hass, entry, CudyApi(client, model), model=model)
+
+    wall: list[float] = []
+    loop_cpu: list[float] = []
+    try:
+        # warm-up: login, light endpoint and ubus discovery are one-off costs
+        await coordinator.async_refresh()
+        sent = emulator.stats.bytes_sent
+        for _ in range(cycles):
+            started, cpu_started = time.perf_counter(), time.thread_time()
+            await coordinator.async_refresh()
+            wall.append(time.perf_counter() - started)
+            # the emulator runs in its own thread, so this is the client's loop time
+            loop_cpu.append(time.thread_time() - cpu_started)
+        sent = emulator.stats.bytes_sent - sent
+
+        blocks: list[float] = []
+        sizes: list[float] = []
+        tracemalloc.start()
+        try:
+            before = _snapshot()
+            for _ in range(TRACED_CYCLES):
+                await coordinator.async_refresh()
+                after = _snapshot()
+                diff = after.compare_to(before, "filename")
+                blocks.append(sum(stat.count_diff for stat in diff))
+                sizes.append(sum(stat.size_diff for stat in diff))
+                before = after
+        finally:
+            tracemalloc.stop()
+    finally:
+        await client.async_close()
+        emulator.stop_thread()
+
+    assert coordinator.last_update_success
+    return {
+        "p50_ms": round(percentile(wall, 50) * 1000, 2),
+        "p95_ms": round(percentile(wall, 95) * 1000, 2),
+        "p99_ms": round(percentile(wall, 99) * 1000, 2),
+        "loop_ms": round(percentile(loop_cpu, 50) * 1000, 2),
+        "bytes_per_cycle": sent // cycles,
+        # blocks and KB a cycle leaves allocated (snapshot diff after a collection)
+        "alloc_blocks_per_cycle": int(percentile(blocks, 50)),
+        "alloc_kb_per_cycle": round(percentile(sizes, 50) / 1024, 1),
+    }
+
+
+@pytest.mark.cudy_bench
+@pytest.mark.asyncio
+async def test_bench_poll_cycle(hass, socket_enabled, cudy_bench_update: bool, capsys) -> None:
+    cycles = int(os.getenv("CUDY_BENCH_CYCLES", "20"))
+    results: dict[str, dict[str, float]] = {}
+    for model in CUDY_DEVICES:
+        if html_exists(model, MODULE_SYSTEM):
+            results[model] = await _bench_model(hass, model, cycles)
+
+    with capsys.disabled():
+        print(
+            f"\n{'model':<16}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'loop ms':>9}{'bytes':>9}"
+            f"{'blocks/cycle':>14}{'KB/cycle':>10}"
+        )
+        for model, r in results.items():
+            print(
+                f"{model:<16}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}"
+                f"{r['loop_ms']:>9}{r['bytes_per_cycle']:>9}"
+                f"{r['alloc_blocks_per_cycle']:>14}{r['alloc_kb_per_cycle']:>10}"
+            )
+    write_results({"cycles": cycles, "models": results})
+
+    baseline = load_baseline(BASELINE)
+    if baseline is None or cudy_bench_update:
+        save_baseline(BASELINE, results)
+        return
+
+    slower = regressions(results, baseline, "p50_ms", threshold())
+    slower += regressions(results, baseline, "loop_ms", threshold())
+    slower += regressions(results, baseline, "bytes_per_cycle", threshold())
+    assert not slower, "Poll cycle regressions:\n" + "\n".join(slower)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.capture import REDACTED, ResponseCapture, decode_body, redact
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from tests.cudy_router.fixtures import FakeClient, read_html
+from tests.cudy_router.replay import ReplayApi, benchmark, load_capture, main
+
+MODEL = "WR3000"
+
+
+def test_redact_removes_tokens_and_secrets():
+    html = (
+        '<input type="hidden" name="token" value="dd71162f" />'
+        '<input type="password" name="wpakey" value="hunter22">'
+        '<a href="/cgi-bin/luci/;stok=abc123/admin">x</a>'
+        "<script>var sysauth='f00d';</script>"
+        "<td>admin-pass-123</td><td>192.168.10.1</td>"
+    )
+
+    text = redact(html, ("admin-pass-123",))
+
+    for secret in ("dd71162f", "hunter22", "abc123", "f00d", "admin-pass-123"):
+        assert secret not in text
+    assert text.count(REDACTED) == 5
+    assert "192.168.10.1" in text
+
+
+def test_capture_keeps_last_fetches_and_drops_them_when_disabled():
+    capture = ResponseCapture(enabled=True, max_captures=2)
+
+    for poll in range(3):
+        capture.begin_poll()
+        capture.response(MODULE_LAN, "page", "/lan", None, f"<p>{poll}</p>")
+        capture.finish(MODULE_LAN, 0.01)
+
+    fetches = capture.as_dict()["modules"][MODULE_LAN]
+    assert [f["poll"] for f in fetches] == [2, 3]
+    assert decode_body(fetches[-1]["responses"][0]["body"]) == "<p>2</p>"
+
+    capture.enabled = False
+    assert capture.as_dict()["modules"] == {}
+    capture.response(MODULE_LAN, "page", "/lan", None, "<p>x</p>")
+    capture.finish(MODULE_LAN, 0.01)
+    assert capture.captures == {}
+
+
+@pytest.mark.asyncio
+async def test_captured_polls_replay_through_the_coordinator(hass, tmp_path, capsys):
+    capture = ResponseCapture(enabled=True, max_captures=2)
+    api = CudyApi(FakeClient(MODEL), MODEL, capture=capture)
+    for _ in range(3):
+        live = await api.get_data()
+
+    exported = {"data": {"model": MODEL, "capture": json.loads(json.dumps(capture.as_dict()))}}
+    system = exported["data"]["capture"]["modules"][MODULE_SYSTEM]
+    assert len(system) == 2
+    assert system[-1]["responses"][0]["kind"] == "page"
+    assert system[-1]["responses"][0]["bytes"] == len(read_html(MODEL, "system.html").encode())
+
+    replayed = load_capture(exported)
+    assert replayed.model == MODEL
+    assert len(replayed.polls()) == 2
+
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "192.168.1.1"}, options={})
+    entry.add_to_hass(hass)
+    coordinator = CudyCoordinator(hass, entry, ReplayApi(replayed), model=MODEL)
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.data == live
+
+    assert benchmark(replayed, repeat=1)[MODULE_SYSTEM]["parse_ms"] >= 0
+    path = tmp_path / "diagnostics.json"
+    path.write_text(json.dumps(exported))
+    assert main([str(path), "--repeat", "1"]) == 0
+    assert MODULE_SYSTEM in capsys.readouterr().out
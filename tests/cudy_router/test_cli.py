@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from custom_components.hass_cudy_router.cli import Config, NdjsonSink, RouterConfig, load_config, run
+from custom_components.hass_cudy_router.const import *
+from tests.cudy_router.emulator import RouterEmulator
+
+MODEL = "WR3000"
+ROOT = Path(__file__).resolve().parents[2]
+
+# the CLI with Home Assistant made unimportable
+NO_HA = """
+import sys
+sys.modules["homeassistant"] = None
+from custom_components.hass_cudy_router.cli import main
+sys.exit(main(sys.argv[1:]))
+"""
+
+
+class ListSink(NdjsonSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lines: list[str] = []
+
+    def write(self, lines: list[str]) -> None:
+        self.lines.extend(lines)
+
+
+@pytest.fixture
+async def emulators(socket_enabled):
+    async with RouterEmulator(MODEL, seed=1) as first, RouterEmulator(MODEL, seed=2) as second:
+        yield first, second
+
+
+def test_load_config(tmp_path: Path):
+    path = tmp_path / "routers.json"
+    path.write_text(
+        json.dumps(
+            {
+                "scan_interval": 10,
+                "routers": [
+                    {"host": "192.168.10.1", "password": "secret"},
+                    {"name": "home", "host": "192.168.1.1", "password": "x", "scan_interval": 60},
+                ],
+            }
+        )
+    )
+
+    config = load_config(path)
+
+    assert [(r.name, r.scan_interval, r.username) for r in config.routers] == [
+        ("192.168.10.1", 10.0, "admin"),
+        ("home", 60.0, "admin"),
+    ]
+    path.write_text(json.dumps({"routers": [{"host": "192.168.10.1"}]}))
+    with pytest.raises(ValueError):
+        load_config(path)
+
+
+def test_sink_rotates_output(tmp_path: Path):
+    path = tmp_path / "polls.ndjson"
+    sink = NdjsonSink(path, max_bytes=100, backups=2)
+
+    for batch in range(4):
+        sink.write([json.dumps({"batch": batch, "pad": "x" * 80})])
+    sink.close()
+
+    assert json.loads(Path(f"{path}.1").read_text())["batch"] == 3
+    assert json.loads(Path(f"{path}.2").read_text())["batch"] == 2
+    assert not Path(f"{path}.3").exists()
+    assert path.read_text() == ""
+
+
+@pytest.mark.asyncio
+async def test_polls_routers_concurrently(emulators):
+    first, second = emulators
+    config = Config(
+        routers=[
+            RouterConfig(name="first", host=first.host, password="admin"),
+            RouterConfig(name="second", host=second.host, password="admin", model=MODEL),
+        ]
+    )
+    sink = ListSink()
+
+    await run(config, sink, once=True)
+
+    records = [json.loads(line) for line in sink.lines]
+    assert {r["router"] for r in records} == {"first", "second"}
+    assert all(r["model"] == MODEL and r["poll"] == 1 for r in records)
+    by_router = {(r["router"], r["module"]): r for r in records}
+    assert by_router[("first", MODULE_SYSTEM)]["data"][SENSOR_SYSTEM_MODEL]
+    assert by_router[("second", MODULE_DEVICE_LIST)]["data"]
+    assert first.stats.logins == second.stats.logins == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_router_is_reported(socket_enabled):
+    config = Config(routers=[RouterConfig(name="gone", host="127.0.0.1:9", password="admin")])
+    sink = ListSink()
+
+    await run(config, sink, once=True)
+
+    (record,) = [json.loads(line) for line in sink.lines]
+    assert record["router"] == "gone"
+    assert record["module"] is None
+    assert record["error"]
+
+
+@pytest.mark.asyncio
+async def test_runs_without_home_assistant(emulators, tmp_path: Path):
+    first, _ = emulators
+    config = tmp_path / "routers.json"
+    config.write_text(json.dumps({"routers": [{"host": first.host, "password": "admin"}]}))
+
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        NO_HA,
+        str(config),
+        "--once",
+        cwd=ROOT,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await asyncio.wait_for(proc.communicate(), 60)
+
+    assert proc.returncode == 0, stderr.decode()
+    modules = {json.loads(line)["module"] for line in stdout.decode().splitlines()}
+    assert MODULE_SYSTEM in modules
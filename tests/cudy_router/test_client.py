@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.hass_cudy_router.core import client as client_module
+from custom_components.hass_cudy_router.core.client import CudyClient, ResponseTooLarge, UnexpectedContent
+
+LOGIN_HTML = (
+    '<form><input type="hidden" name="token" value="tok"/><input type="hidden" name="salt" value="salt"/>'
+    '<input type="password" name="luci_password"/></form>'
+)
+LIFETIME = 1.0
+
+
+class ExpiringRouter:
+    """LuCI stand-in whose sessions expire LIFETIME seconds after login."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, float] = {}
+        self.rejected = 0
+        # some firmwares answer an expired session with the login form instead of a 403
+        self.login_form_on_expiry = False
+        self.big_body = b"x" * 100_000
+        self.app = web.Application()
+        self.app.router.add_get("/cgi-bin/luci", self._login_page)
+        self.app.router.add_post("/cgi-bin/luci", self._login)
+        self.app.router.add_get("/cgi-bin/luci/admin/big", self._big)
+        self.app.router.add_get("/cgi-bin/luci/admin/backup", self._backup)
+        self.app.router.add_get("/cgi-bin/luci/admin/broken", self._broken)
+        self.app.router.add_get("/cgi-bin/luci/{tail:.*}", self._page)
+
+    async def _login_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=LOGIN_HTML, content_type="text/html")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        token = f"{len(self.sessions):032x}"
+        self.sessions[token] = time.monotonic()
+        resp = web.Response(status=302, headers={"Location": "/cgi-bin/luci/admin"})
+        resp.set_cookie("sysauth", token, path="/cgi-bin/luci")
+        return resp
+
+    async def _page(self, request: web.Request) -> web.Response:
+        started = self.sessions.get(request.cookies.get("sysauth", ""))
+        if started is None or time.monotonic() - started > LIFETIME:
+            self.rejected += 1
+            if self.login_form_on_expiry:
+                return web.Response(text=LOGIN_HTML, content_type="text/html")
+            return web.Response(status=403)
+        return web.Response(text="ok", content_type="text/html")
+
+    async def _backup(self, request: web.Request) -> web.Response:
+        return web.Response(body=self.big_body, content_type="application/octet-stream")
+
+    async def _broken(self, request: web.Request) -> web.Response:
+        return web.Response(status=500, text="x" * 100_000, content_type="text/html")
+
+    async def _big(self, request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse(headers={"Content-Type": "text/html; charset=utf-8"})
+        await resp.prepare(request)
+        for offset in range(0, len(self.big_body), 10_000):
+            await resp.write(self.big_body[offset:offset + 10_000])
+        await resp.write_eof()
+        return resp
+
+
+@pytest.fixture
+async def router(socket_enabled):
+    stand_in = ExpiringRouter()
+    server = TestServer(stand_in.app, host="127.0.0.1")
+    await server.start_server()
+    stand_in.host = f"127.0.0.1:{server.port}"
+    yield stand_in
+    await server.close()
+
+
+@pytest.mark.asyncio
+async def test_session_refreshed_before_learned_expiry(router: ExpiringRouter, monkeypatch):
+    monkeypatch.setattr(client_module, "MIN_SESSION_LIFETIME", 0.0)
+    # a wide margin keeps the test stable on a busy machine
+    monkeypatch.setattr(client_module, "SESSION_REFRESH_FACTOR", 0.5)
+    client = CudyClient(router.host, "admin", "admin", reuse_window=0)
+    try:
+        # poll until the first expiry teaches the client the session lifetime
+        while client.session_stats["expired_replays"] == 0:
+            assert await client.get("/cgi-bin/luci/admin/status") == "ok"
+            await asyncio.sleep(0.1)
+        assert client.session_lifetime is not None
+        assert client.session_lifetime <= LIFETIME
+
+        rejected = router.rejected
+        for _ in range(30):
+            assert await client.get("/cgi-bin/luci/admin/status") == "ok"
+            await asyncio.sleep(0.1)
+    finally:
+        await client.async_close()
+
+    # three lifetimes later the session was renewed ahead of every expiry
+    assert client.session_stats["proactive_refreshes"] >= 2
+    assert router.rejected == rejected
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_request(router: ExpiringRouter):
+    client = CudyClient(router.host, "admin", "admin", reuse_window=60)
+    pages: list[str] = []
+    original_request = client.request
+
+    async def _request(method: str, path: str, **kwargs):
+        pages.append(path)
+        await asyncio.sleep(0.05)
+        return await original_request(method, path, **kwargs)
+
+    setattr(client, "request", _request)
+    try:
+        timings = [{} for _ in range(3)]
+        results = await asyncio.gather(
+            *(client.get("/cgi-bin/luci/admin/status", timing=t) for t in timings),
+            client.get("/cgi-bin/luci/admin/status", params={"detail": "1"}),
+        )
+        again = await client.get("/cgi-bin/luci/admin/status")
+    finally:
+        await client.async_close()
+
+    assert results == ["ok"] * 4
+    assert again == "ok"
+    assert pages.count("/cgi-bin/luci/admin/status") == 2
+    assert all("server_time" in t for t in timings)
+    assert client.request_stats == {"requests": 2, "coalesced": 2, "reused": 1}
+
+
+@pytest.mark.asyncio
+async def test_login_page_instead_of_module_page_replays_request(router: ExpiringRouter):
+    router.login_form_on_expiry = True
+    client = CudyClient(router.host, "admin", "admin", reuse_window=0)
+    try:
+        assert await client.get("/cgi-bin/luci/admin/status") == "ok"
+        router.sessions.clear()
+        assert await client.get("/cgi-bin/luci/admin/status") == "ok"
+    finally:
+        await client.async_close()
+
+    assert router.rejected == 1
+    assert client.session_stats["expired_replays"] == 1
+    assert client.session_stats["logins"] == 2
+
+
+@pytest.mark.asyncio
+async def test_response_size_cap_and_raw_body(router: ExpiringRouter):
+    client = CudyClient(router.host, "admin", "admin", reuse_window=0)
+    try:
+        body = await client.get("/cgi-bin/luci/admin/big", raw=True)
+        with pytest.raises(ResponseTooLarge):
+            await client.get("/cgi-bin/luci/admin/big", max_bytes=50_000)
+        text = await client.get("/cgi-bin/luci/admin/status")
+    finally:
+        await client.async_close()
+
+    assert body == router.big_body
+    assert text == "ok"
+
+
+@pytest.mark.asyncio
+async def test_non_page_responses_are_not_read(router: ExpiringRouter):
+    client = CudyClient(router.host, "admin", "admin", reuse_window=0)
+    try:
+        await client.get("/cgi-bin/luci/admin/status", expect_html=True)
+        received = client.bytes_received
+        with pytest.raises(UnexpectedContent):
+            await client.get("/cgi-bin/luci/admin/backup", expect_html=True)
+        assert await client.get("/cgi-bin/luci/admin/broken", expect_html=True) == ""
+        # neither body was downloaded
+        assert client.bytes_received == received
+        # without expect_html the body is still returned
+        assert await client.get("/cgi-bin/luci/admin/backup", raw=True) == router.big_body
+    finally:
+        await client.async_close()
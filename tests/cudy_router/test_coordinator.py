@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import UpdateFailed
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.hass_cudy_router.const import DOMAIN, SENSOR_SYSTEM_FIRMWARE_VERSION
-from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from custom_components.hass_cudy_router.coordinator import (
+    SNAPSHOT_SAVE_DELAY,
+    CudyCoordinator,
+    async_load_snapshot,
+)
 
 
 @pytest.mark.asyncio
@@ -48,4 +54,50 @@ async def test_coordinator_api_exception_wraps_updatefailed(hass: HomeAssistant)
     c = CudyCoordinator(hass=hass, entry=entry, api=api, host="test")
 
     with pytest.raises(UpdateFailed):
-        await c._async_update_data()
\ No newline at end of file
+        await c._async_update_data()
+
+@pytest.mark.asyncio
+async def test_coordinator_snapshot_written_on_schedule(hass: HomeAssistant, hass_storage):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "test"}, options={})
+    entry.add_to_hass(hass)
+
+    api = AsyncMock()
+    api.get_data.return_value = {"system": {SENSOR_SYSTEM_FIRMWARE_VERSION: "X"}}
+
+    c = CudyCoordinator(hass=hass, entry=entry, api=api, host="test", model="WR3000")
+
+    await c.async_refresh()
+    await c.async_refresh()
+    await hass.async_block_till_done()
+    key = f"{DOMAIN}.{entry.entry_id}"
+    assert key not in hass_storage
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+
+    snapshot = await async_load_snapshot(hass, entry)
+    assert snapshot["model"] == "WR3000"
+    assert snapshot["data"]["system"][SENSOR_SYSTEM_FIRMWARE_VERSION] == "X"
+
+
+@pytest.mark.asyncio
+async def test_coordinator_restored_snapshot_is_stale_until_refresh(hass: HomeAssistant):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "test"}, options={})
+    entry.add_to_hass(hass)
+
+    api = AsyncMock()
+    api.get_data.return_value = {}
+
+    c = CudyCoordinator(hass=hass, entry=entry, api=api, host="test", model="WR3000")
+    c.async_restore_snapshot({"model": "WR3000", "data": {"system": {SENSOR_SYSTEM_FIRMWARE_VERSION: "old"}}})
+    assert c.stale is True
+
+    # an empty answer keeps the snapshot instead of wiping it
+    await c.async_refresh()
+    assert c.data["system"][SENSOR_SYSTEM_FIRMWARE_VERSION] == "old"
+    assert c.stale is True
+
+    api.get_data.return_value = {"system": {SENSOR_SYSTEM_FIRMWARE_VERSION: "new"}}
+    await c.async_refresh()
+    assert c.data["system"][SENSOR_SYSTEM_FIRMWARE_VERSION] == "new"
+    assert c.stale is False
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from tests.cudy_router.benchmark import load_baseline, regressions, save_baseline, threshold
+from tests.cudy_router.fixtures import read_html
+
+MODEL = "WR3000"
+ROOT = Path(__file__).resolve().parents[2]
+BASELINE = "core_import"
+# cold imports timed for the benchmark, the best one counts
+IMPORT_RUNS = 5
+
+# imports the core with Home Assistant made unimportable, then parses a page
+PROBE = """
+import json, sys, time
+sys.modules["homeassistant"] = None
+started = time.perf_counter()
+from custom_components.hass_cudy_router.core import client, parser
+elapsed = time.perf_counter() - started
+loaded = sorted(
+    name for name, module in sys.modules.items()
+    if module and name.split(".")[0] in ("bs4", "homeassistant")
+)
+values = parser.parse_html("system", sys.stdin.read())
+print(json.dumps({"elapsed": elapsed, "loaded": loaded, "bs4": "bs4" in sys.modules, "values": values}))
+"""
+
+
+def _probe() -> dict[str, Any]:
+    """Run PROBE in a fresh interpreter and return what it reported."""
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        input=read_html(MODEL, "system.html"),
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert proc.returncode == 0, proc.stderr
+    return json.loads(proc.stdout)
+
+
+def test_core_imports_without_home_assistant_and_bs4():
+    result = _probe()
+
+    assert result["loaded"] == []
+    assert result["bs4"]
+    assert result["values"]
+
+
+@pytest.mark.cudy_bench
+def test_bench_core_import(cudy_bench_update: bool, capsys) -> None:
+    # ~0.35 s here, mostly aiohttp; only meaningful against a baseline from the same machine
+    import_ms = min(_probe()["elapsed"] for _ in range(IMPORT_RUNS)) * 1000
+    results = {"core": {"import_ms": round(import_ms, 1)}}
+
+    with capsys.disabled():
+        print(f"\ncore import: {import_ms:.1f} ms (best of {IMPORT_RUNS})")
+
+    baseline = load_baseline(BASELINE)
+    if baseline is None or cudy_bench_update:
+        save_baseline(BASELINE, results)
+        return
+
+    slower = regressions(results, baseline, "import_ms", threshold())
+    assert not slower, "Import regressions:\n" + "\n".join(slower)
@@ -7,6 +7,7 @@ import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import parse_tracked_macs, tracked_macs_option
 from custom_components.hass_cudy_router.device_tracker import (
     async_setup_entry,
     CudyDeviceTracker,
@@ -148,4 +149,40 @@ def test_extra_state_attributes_returns_device_dict(coordinator: MagicMock):
         device,
     )
 
-    assert tracker.extra_state_attributes == device
\ No newline at end of file
+    assert tracker.extra_state_attributes == device
+
+def test_parse_tracked_macs_normalizes_separators():
+    assert parse_tracked_macs("") == set()
+    assert parse_tracked_macs("AA:BB:CC:DD:EE:FF, 11-22-33-44-55-66\naabb.ccdd.eeff") == {
+        "aabbccddeeff",
+        "112233445566",
+    }
+
+
+def test_tracking_every_device_is_opt_in():
+    # an empty MAC list tracks nothing, as before the option could change in place
+    assert tracked_macs_option({}) == set()
+    assert tracked_macs_option({MODULE_DEVICE_LIST: "aa:bb:cc:dd:ee:ff"}) == {"aabbccddeeff"}
+    assert tracked_macs_option({CONF_TRACK_ALL: True, MODULE_DEVICE_LIST: "aa:bb"}) is None
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry_skips_untracked_devices(
+    hass: HomeAssistant, coordinator: MagicMock
+):
+    entry = MagicMock()
+    entry.entry_id = "test_entry"
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+
+    coordinator.tracked_macs = {"aabbccddeeff"}
+    coordinator.data = {
+        MODULE_DEVICE_LIST: [
+            {DEVICE_MAC: "AA:BB:CC:DD:EE:FF"},
+            {DEVICE_MAC: "11:22:33:44:55:66"},
+        ]
+    }
+
+    added: list[Any] = []
+    await async_setup_entry(hass, entry, added.extend)
+
+    assert [e.mac_address for e in added] == ["AA:BB:CC:DD:EE:FF"]
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.diagnostics import async_get_config_entry_diagnostics
+from tests.cudy_router.fixtures import FakeClient
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_show_module_backoff(hass, setup_cudy_entry) -> None:
+    model = "WR3000"
+    entry = await setup_cudy_entry(FakeClient(model), model)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"]["password"] == "**REDACTED**"
+    assert diagnostics["model"] == model
+    assert MODULE_SYSTEM in diagnostics["modules"]
+    # WR3000 has no 6 GHz radio, its page comes back empty
+    backoff = diagnostics["polling"]["backoff"][MODULE_WIRELESS_6G]
+    assert backoff["failures"] == 1
+    assert backoff["last_error"] == "no data"
+    # tracing is off unless enabled in the options
+    assert diagnostics["tracing"] == {"enabled": False, "traces": []}
+    assert diagnostics["watchdog"]["enabled"] is False
+    assert diagnostics["watchdog"]["histograms"] == {}
+    assert diagnostics["capture"] == {"enabled": False, "max_captures": 5, "modules": {}}
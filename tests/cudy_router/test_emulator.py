@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.core.client import CudyClient
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from tests.cudy_router.emulator import RouterEmulator
+from tests.cudy_router.fixtures import FakeClient
+
+MODEL = "WR3000"
+
+
+@pytest.fixture
+async def emulator(socket_enabled):
+    async with RouterEmulator(MODEL, seed=1) as stand_in:
+        yield stand_in
+
+
+@pytest.mark.asyncio
+async def test_real_client_reads_fixture_pages(emulator: RouterEmulator):
+    client = CudyClient(emulator.host, "admin", "admin")
+    try:
+        data = await CudyApi(client, MODEL).get_data()
+    finally:
+        await client.async_close()
+
+    expected = await CudyApi(FakeClient(MODEL), MODEL).get_data()
+    assert data == expected
+    assert emulator.stats.logins == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_counters(emulator: RouterEmulator):
+    client = CudyClient(emulator.host, "admin", "admin")
+    api = CudyApi(client, MODEL)
+    try:
+        await api.get_data()
+    finally:
+        await client.async_close()
+
+    assert 0 < api.poll_bytes <= emulator.stats.bytes_sent
+    assert api.parse_time > 0
+    assert client.session_stats["logins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wrong_password_is_rejected(emulator: RouterEmulator):
+    client = CudyClient(emulator.host, "admin", "wrong")
+    try:
+        assert await client.authenticate() is False
+    finally:
+        await client.async_close()
+
+    assert emulator.stats.failed_logins >= 1
+
+
+@pytest.mark.asyncio
+async def test_expired_session_and_errors(emulator: RouterEmulator):
+    client = CudyClient(emulator.host, "admin", "admin", reuse_window=0)
+    api = CudyApi(client, MODEL)
+    try:
+        await api.get_data()
+        emulator.expire_sessions()
+        data = await api.get_data()
+        assert MODULE_SYSTEM in data
+        assert emulator.stats.logins == 2
+
+        emulator.error_rate = 1.0
+        assert await api.get_data() == {}
+    finally:
+        await client.async_close()
+
+    assert emulator.stats.errors > 0
+
+
+@pytest.mark.asyncio
+async def test_coordinator_polls_emulator(hass, emulator: RouterEmulator):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": emulator.host}, options={})
+    entry.add_to_hass(hass)
+    client = CudyClient(emulator.host, "admin", "admin")
+    coordinator = CudyCoordinator(hass, entry, CudyApi(client, MODEL), model=MODEL)
+    try:
+        await coordinator.async_refresh()
+    finally:
+        await client.async_close()
+
+    assert coordinator.last_update_success
+    assert coordinator.data[MODULE_SYSTEM][SENSOR_SYSTEM_MODEL]
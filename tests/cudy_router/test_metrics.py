@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pytest
+from homeassistant.setup import async_setup_component
+
+from custom_components.hass_cudy_router import metrics
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.metrics import (
+    CONTENT_TYPE,
+    METRICS_URL,
+    duration_seconds,
+    rate_bits,
+    render,
+    render_entry,
+)
+from custom_components.hass_cudy_router.core.parser import parse_device_list
+from tests.cudy_router.devlist import DevlistGenerator
+from tests.cudy_router.fixtures import FakeClient
+
+MODEL = "WR3000"
+
+
+def test_value_conversions():
+    assert rate_bits("1.46 Kbps") == pytest.approx(1460)
+    assert rate_bits("2MB/s") == pytest.approx(16_000_000)
+    assert rate_bits("---") is None
+    assert duration_seconds("17:35:52") == 63352
+    assert duration_seconds("2 days, 01:00:05") == 2 * 86400 + 3605
+    assert duration_seconds(None) is None
+
+
+def test_render_groups_families_across_entries():
+    class Coordinator:
+        last_update_success = True
+        model = MODEL
+
+        def __init__(self, devices):
+            self.data = {
+                MODULE_SYSTEM: {SENSOR_SYSTEM_UPTIME: "00:01:00"},
+                MODULE_DEVICES: {SENSOR_DEVICE_COUNT: len(devices)},
+                MODULE_DEVICE_LIST: devices,
+            }
+
+    devlist = DevlistGenerator(seed=3)
+    first = render_entry("a", Coordinator(parse_device_list(devlist.snapshot(2))))
+    second = render_entry("b", Coordinator([]))
+
+    text = render([first, second])
+
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert lines.count("# TYPE cudy_router_uptime_seconds gauge") == 1
+    assert 'cudy_router_uptime_seconds{entry="a"} 60' in lines
+    assert 'cudy_router_uptime_seconds{entry="b"} 60' in lines
+    assert 'cudy_router_clients{entry="a",type="total"} 2' in lines
+    mac = devlist.clients[0].mac.lower()
+    assert any(
+        line.startswith(f'cudy_client_upload_bits_per_second{{entry="a",mac="{mac}"') for line in lines
+    )
+    # samples of one family stay together
+    families = [line.split()[2] for line in lines if line.startswith("# TYPE")]
+    assert len(families) == len(set(families))
+
+
+@pytest.mark.asyncio
+async def test_metrics_view_serves_cached_snapshot(hass, hass_client, monkeypatch, setup_cudy_entry) -> None:
+    assert await async_setup_component(hass, "http", {})
+    fake = FakeClient(MODEL)
+    requests = 0
+    fake_get = fake.get
+
+    async def counting_get(path, **kwargs):
+        nonlocal requests
+        requests += 1
+        return await fake_get(path, **kwargs)
+
+    fake.get = counting_get
+    entry = await setup_cudy_entry(fake, MODEL, options={CONF_METRICS: True})
+    await hass.async_block_till_done()
+
+    rendered = 0
+
+    def counting_render(*args):
+        nonlocal rendered
+        rendered += 1
+        return render_entry(*args)
+
+    monkeypatch.setattr(metrics, "render_entry", counting_render)
+    client = await hass_client()
+    polled = requests
+    resp = await client.get(METRICS_URL)
+    assert resp.status == 200
+    assert resp.headers["Content-Type"] == CONTENT_TYPE
+    text = await resp.text()
+    assert f'cudy_router_info{{entry="{entry.entry_id}",model="{MODEL}"' in text
+    assert f'cudy_polls_total{{entry="{entry.entry_id}"}} 1' in text
+
+    resp = await client.get(METRICS_URL)
+    assert await resp.text() == text
+    # served from the coordinator's data, never from the router, and rendered once per poll
+    assert requests == polled
+    assert rendered == 1
+
+    unauthenticated = await hass_client(None)
+    assert (await unauthenticated.get(METRICS_URL)).status == 401
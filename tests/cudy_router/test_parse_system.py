@@ -1,7 +1,7 @@
 import pytest
 
 from custom_components.hass_cudy_router.const import *
-from custom_components.hass_cudy_router.parser import parse_module_by_sensors
+from custom_components.hass_cudy_router.core.parser import parse_module_by_sensors
 from tests.cudy_router.fixtures import read_html, html_exists
 
 @pytest.mark.asyncio
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.profiling import SERVICE_PROFILE_POLL, module_split
+from tests.cudy_router.emulator import RouterEmulator
+
+MODEL = "WR3000"
+
+
+def test_module_split_sums_spans_per_module():
+    spans = [
+        {"name": "login", "module": None, "duration_ms": 5.0},
+        {"name": "request", "module": MODULE_LAN, "duration_ms": 3.0},
+        {"name": "request", "module": MODULE_LAN, "duration_ms": 2.0},
+        {"name": "parse", "module": MODULE_LAN, "duration_ms": 1.5},
+        {"name": "request", "module": MODULE_SYSTEM, "duration_ms": 20.0},
+    ]
+
+    split = module_split(spans)
+
+    assert list(split) == [MODULE_SYSTEM, MODULE_LAN]
+    assert split[MODULE_LAN] == {"requests": 2, "request_ms": 5.0, "parse_ms": 1.5}
+
+
+@pytest.fixture
+async def emulator(socket_enabled):
+    async with RouterEmulator(MODEL, seed=1) as stand_in:
+        yield stand_in
+
+
+@pytest.mark.asyncio
+async def test_profile_poll_writes_report_and_leaves_nothing_running(
+    hass, setup_cudy_entry, emulator: RouterEmulator, tmp_path: Path
+) -> None:
+    hass.config.config_dir = str(tmp_path)
+    entry = await setup_cudy_entry(model=MODEL, host=emulator.host)
+    await hass.async_block_till_done(wait_background_tasks=True)
+    integration = hass.data[DOMAIN][entry.entry_id]["integration"]
+    polls = integration.coordinator.poll_count
+
+    try:
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE_POLL, {"entry_id": entry.entry_id}, blocking=True, return_response=True
+        )
+    finally:
+        await hass.config_entries.async_unload(entry.entry_id)
+
+    report = Path(response["files"][0])
+    assert report.parent == tmp_path
+    assert report.with_suffix(".prof").exists()
+    text = report.read_text()
+    assert f"({MODEL})" in text
+    assert "parser.py:" in text
+    assert "client.py:" in text
+    assert MODULE_SYSTEM in text.split("Per module")[1].split("Hot functions")[0]
+    assert "Allocations during the poll" in text
+    assert integration.coordinator.poll_count == polls + 1
+
+    # no profiler, tracemalloc or tracing left behind
+    assert not tracemalloc.is_tracing()
+    assert sys.getprofile() is None
+    if hasattr(sys, "monitoring"):
+        assert sys.monitoring.get_tool(sys.monitoring.PROFILER_ID) is None
+    assert not integration.tracer.enabled
+    assert not integration.tracer.active
+    assert list(integration.tracer.traces) == []
+
+
+@pytest.mark.asyncio
+async def test_profile_poll_rejects_unknown_entry(hass, setup_cudy_entry, emulator: RouterEmulator) -> None:
+    entry = await setup_cudy_entry(model=MODEL, host=emulator.host)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PROFILE_POLL, {"entry_id": "missing"}, blocking=True
+        )
+    await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import ClientResponseError, RequestInfo
+from yarl import URL
+
+from custom_components.hass_cudy_router import scheduler
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.core.client import AuthenticationFailed
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.scheduler import (
+    FAILURE_BUDGET,
+    AimdLimiter,
+    CostModel,
+    ErrorBudget,
+)
+from tests.cudy_router.fixtures import FakeClient
+
+
+def test_cost_model_orders_expensive_and_unknown_first():
+    costs = CostModel()
+    costs.observe(MODULE_LAN, 0.01)
+    costs.observe(MODULE_SYSTEM, 0.30)
+
+    assert costs.order([MODULE_LAN, MODULE_SYSTEM, MODULE_DHCP]) == [
+        MODULE_DHCP,
+        MODULE_SYSTEM,
+        MODULE_LAN,
+    ]
+
+
+def test_cost_model_reports_ratio_to_baseline():
+    costs = CostModel()
+    assert costs.observe(MODULE_LAN, 0.1) == 1.0
+    assert costs.observe(MODULE_LAN, 0.3) == pytest.approx(3.0)
+
+
+def test_aimd_limiter_increases_additively_and_halves():
+    limiter = AimdLimiter(maximum=8)
+
+    for _ in range(5):
+        limiter.on_poll([1.0, 1.1])
+    assert limiter.limit == 6
+
+    limiter.on_poll([2.0, 2.5])
+    assert limiter.limit == 3
+
+    limiter.on_poll([])
+    assert limiter.limit == 3
+
+
+class LoadedRouterClient(FakeClient):
+    """Router whose server time grows with the number of requests in flight."""
+
+    def __init__(self, model: str, capacity: int) -> None:
+        super().__init__(model)
+        self.capacity = capacity
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get(self, path: str, timing: dict | None = None, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        load = max(self.in_flight - self.capacity, 0)
+        await asyncio.sleep(0)
+        if timing is not None:
+            timing["server_time"] = 0.01 * (1 + load)
+        self.in_flight -= 1
+        return await super().get(path, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_api_concurrency_backs_off_when_router_slows_down():
+    client = LoadedRouterClient("WR3000", capacity=2)
+    api = CudyApi(client, "WR3000")
+
+    limits = []
+    for _ in range(8):
+        await api.get_data()
+        limits.append(api.limiter.limit)
+
+    assert limits[0] == 2
+    assert max(limits) <= 4
+    assert client.peak <= max(limits)
+    assert 1 <= api.limiter.limit < 4
+
+
+def test_error_budget_backs_off_exponentially_and_resets():
+    errors = ErrorBudget(budget=2, base=10.0, probe_interval=35.0)
+
+    assert errors.on_failure(MODULE_WIRELESS_6G, "HTTP 404", now=0.0) == 0.0
+    assert errors.allowed(MODULE_WIRELESS_6G, now=0.0)
+    assert errors.on_failure(MODULE_WIRELESS_6G, "HTTP 404", now=0.0) == 10.0
+    assert not errors.allowed(MODULE_WIRELESS_6G, now=5.0)
+    assert errors.allowed(MODULE_WIRELESS_6G, now=10.0)
+    assert errors.on_failure(MODULE_WIRELESS_6G, "HTTP 404", now=10.0) == 20.0
+    # capped at the probe interval
+    assert errors.on_failure(MODULE_WIRELESS_6G, "HTTP 404", now=30.0) == 35.0
+
+    state = errors.as_dict(now=40.0)[MODULE_WIRELESS_6G]
+    assert state["failures"] == 4
+    assert state["backed_off"] is True
+    assert state["skipped_polls"] == 1
+    assert state["last_error"] == "HTTP 404"
+
+    errors.on_success(MODULE_WIRELESS_6G)
+    assert errors.allowed(MODULE_WIRELESS_6G, now=40.0)
+    assert errors.as_dict() == {}
+
+
+@pytest.mark.asyncio
+async def test_api_stops_requesting_failing_module():
+    client = FakeClient("WR3000")
+    requested: list[str] = []
+    original_get = client.get
+    missing = CudyApi.luci(CAPABILITY_URLS[MODULE_WIRELESS_6G][0])
+
+    async def _get(path: str, **kwargs):
+        requested.append(path)
+        if path == missing:
+            raise ClientResponseError(RequestInfo(URL(path), "GET", {}), (), status=404)
+        return await original_get(path, **kwargs)
+
+    setattr(client, "get", _get)
+    api = CudyApi(client, "WR3000")
+
+    for _ in range(FAILURE_BUDGET):
+        data = await api.get_data()
+    assert MODULE_SYSTEM in data
+    assert requested.count(missing) == FAILURE_BUDGET
+
+    await api.get_data()
+    assert requested.count(missing) == FAILURE_BUDGET
+    assert api.errors.as_dict()[MODULE_WIRELESS_6G]["backed_off"] is True
+
+
+class FailingModuleClient(FakeClient):
+    """Router where one module page raises instead of answering."""
+
+    def __init__(self, model: str, module: str, error: BaseException) -> None:
+        super().__init__(model)
+        self.failing = CudyApi.luci(CAPABILITY_URLS[module][0])
+        self.error = error
+        self.requested: list[str] = []
+
+    async def get(self, path: str, **kwargs):
+        self.requested.append(path)
+        if path == self.failing:
+            raise self.error
+        # the other pages are still in flight when the failing one raises
+        await asyncio.sleep(0.01)
+        return await super().get(path, **kwargs)
+
+
+def _pending_tasks() -> list[asyncio.Task]:
+    return [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+
+@pytest.mark.asyncio
+async def test_api_timeout_fails_only_its_module():
+    client = FailingModuleClient("WR3000", MODULE_LAN, TimeoutError())
+    api = CudyApi(client, "WR3000")
+
+    data = await api.get_data()
+
+    assert MODULE_SYSTEM in data
+    assert MODULE_LAN not in data
+    assert api.errors.as_dict()[MODULE_LAN]["last_error"] == "TimeoutError()"
+    assert MODULE_LAN in api.failed_modules
+    assert _pending_tasks() == []
+
+
+@pytest.mark.asyncio
+async def test_api_authentication_failure_cancels_other_fetches():
+    client = FailingModuleClient("WR3000", MODULE_LAN, AuthenticationFailed("Authentication failed"))
+    api = CudyApi(client, "WR3000")
+
+    with pytest.raises(AuthenticationFailed):
+        await api.get_data()
+
+    assert _pending_tasks() == []
+    assert MODULE_LAN not in api.errors.modules
+
+
+@pytest.mark.asyncio
+async def test_api_backs_off_module_that_keeps_raising(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(scheduler, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    client = FailingModuleClient("WR3000", MODULE_LAN, ConnectionResetError("reset by peer"))
+    api = CudyApi(client, "WR3000")
+    api.errors = ErrorBudget(budget=2, base=10.0, probe_interval=100.0)
+
+    def requests() -> int:
+        return client.requested.count(client.failing)
+
+    for _ in range(2):
+        assert MODULE_SYSTEM in await api.get_data()
+    state = api.errors.as_dict()[MODULE_LAN]
+    assert state["backed_off"] is True
+    assert state["retry_in_s"] == 10.0
+    assert state["last_error"] == "ConnectionResetError('reset by peer')"
+
+    await api.get_data()
+    assert requests() == 2
+
+    # every failed probe doubles the delay
+    clock[0] += 10.0
+    await api.get_data()
+    assert requests() == 3
+    assert api.errors.as_dict()[MODULE_LAN]["retry_in_s"] == 20.0
+    clock[0] += 10.0
+    await api.get_data()
+    assert requests() == 3
+    assert api.errors.as_dict()[MODULE_LAN]["skipped_polls"] == 2
@@ -7,8 +7,12 @@ from homeassistant.config_entries import ConfigEntry
 from custom_components.hass_cudy_router.const import *
 from custom_components.hass_cudy_router.api import CudyApi
 from custom_components.hass_cudy_router.coordinator import CudyCoordinator
-from custom_components.hass_cudy_router.sensor import async_setup_entry as sensor_setup
-from tests.cudy_router.fixtures import html_exists, FakeClient
+from custom_components.hass_cudy_router.sensor import (
+    PERFORMANCE_SENSORS,
+    CudyPerformanceSensor,
+    async_setup_entry as sensor_setup,
+)
+from tests.cudy_router.fixtures import html_exists, xhr_shell, FakeClient
 
 
 @pytest.mark.asyncio
@@ -19,6 +23,7 @@ async def test_sensor_platform(hass: HomeAssistant, model: str):
     entry = MagicMock(spec=ConfigEntry)
     entry.entry_id = model
     entry.data = {"host": "test.local"}
+    entry.pref_disable_polling = True
 
     coordinator = CudyCoordinator(hass=hass, entry=entry, api=api, host="test.local")
 
@@ -29,7 +34,7 @@ async def test_sensor_platform(hass: HomeAssistant, model: str):
     assert coordinator.data[MODULE_SYSTEM][SENSOR_SYSTEM_FIRMWARE_VERSION] is not None
 
     for module in SENSORS.keys():
-        if html_exists(model, module):
+        if html_exists(model, module) and not xhr_shell(model, module):
             assert module in coordinator.data.keys()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
@@ -42,4 +47,38 @@ async def test_sensor_platform(hass: HomeAssistant, model: str):
 
     fw_entities = [e for e in added if getattr(e, "unique_id", "").endswith(SENSOR_SYSTEM_FIRMWARE_VERSION)]
     assert fw_entities
-    assert fw_entities[0].native_value == coordinator.data[MODULE_SYSTEM][SENSOR_SYSTEM_FIRMWARE_VERSION]
\ No newline at end of file
+    assert fw_entities[0].native_value == coordinator.data[MODULE_SYSTEM][SENSOR_SYSTEM_FIRMWARE_VERSION]
+
+@pytest.mark.asyncio
+async def test_performance_sensors(hass: HomeAssistant):
+    model = "WR3000"
+    api = CudyApi(FakeClient(model), model)
+    entry = MagicMock(spec=ConfigEntry)
+    entry.entry_id = model
+    entry.data = {"host": "test.local"}
+    entry.options = {"scan_interval": 60}
+    entry.pref_disable_polling = True
+
+    coordinator = CudyCoordinator(hass=hass, entry=entry, api=api, host="test.local")
+    coordinator.data = await coordinator._async_update_data()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {"coordinator": coordinator}
+
+    added = []
+    await sensor_setup(hass, entry, added.extend)
+
+    perf = {e._def.key: e for e in added if isinstance(e, CudyPerformanceSensor)}
+    assert set(perf) == set(PERFORMANCE_SENSORS)
+    assert all(e.entity_registry_enabled_default is False for e in perf.values())
+
+    assert perf[PERF_POLL_DURATION].native_value >= 0
+    assert perf[PERF_POLL_DURATION_P95].native_value == perf[PERF_POLL_DURATION].native_value
+    assert perf[PERF_PARSE_TIME].native_value > 0
+    # pages the model does not have come back empty, which is not a failure
+    assert perf[PERF_FAILED_MODULES].native_value == 0
+    assert perf[PERF_SCAN_INTERVAL].native_value == 60
+    # the fake client keeps no session or transfer counters
+    assert perf[PERF_LOGINS].native_value is None
+    assert perf[PERF_POLL_BYTES].native_value is None
+
+    api.errors.on_failure(MODULE_LAN, "HTTP 500")
+    assert perf[PERF_FAILED_MODULES].native_value == 1
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+import time
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.hass_cudy_router.const import *
+from tests.cudy_router.benchmark import percentile
+from tests.cudy_router.emulator import RouterEmulator
+from tests.cudy_router.fixtures import html_exists
+
+SCAN_INTERVAL = 30
+# 480 polls at 30 s: four hours of simulated time
+DEFAULT_CYCLES = 480
+# allocation growth tolerated over the last quarter of the run
+MAX_GROWTH_KB = int(os.getenv("CUDY_SOAK_MAX_GROWTH_KB", "1024"))
+# RSS also counts allocator fragmentation and tracemalloc's own tables
+MAX_RSS_GROWTH_KB = int(os.getenv("CUDY_SOAK_MAX_RSS_GROWTH_KB", "8192"))
+# the test loop runs in asyncio debug mode and pages are parsed on it, so this
+# only catches pathological blocking; compare the recorded p99 between runs
+MAX_LAG_MS = float(os.getenv("CUDY_SOAK_MAX_LAG_MS", "1000"))
+
+
+def _open_sockets() -> int | None:
+    fd_dir = Path("/proc/self/fd")
+    if not fd_dir.is_dir():
+        return None
+    count = 0
+    for fd in fd_dir.iterdir():
+        try:
+            if os.readlink(fd).startswith("socket:"):
+                count += 1
+        except OSError:
+            continue
+    return count
+
+
+def _rss_kb() -> int | None:
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+class LagMonitor:
+    """Samples event-loop lag: how late a short sleep wakes up."""
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(time.perf_counter() - started - self.interval, 0.0))
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+@pytest.mark.cudy_bench
+@pytest.mark.asyncio
+async def test_soak_many_routers(hass, socket_enabled, monkeypatch, caplog, record_property) -> None:
+    # captured log records (access log, slow-callback warnings) would count as growth
+    caplog.set_level(logging.ERROR)
+    entries_count = int(os.getenv("CUDY_SOAK_ENTRIES", "8"))
+    cycles = int(os.getenv("CUDY_SOAK_CYCLES", str(DEFAULT_CYCLES)))
+    models = [m for m in CUDY_DEVICES if html_exists(m, MODULE_SYSTEM)][:entries_count]
+
+    emulators: dict[str, RouterEmulator] = {}
+    for model in models:
+        emulator = RouterEmulator(model, seed=0, session_lifetime=900)
+        await emulator.start()
+        emulators[emulator.host] = emulator
+
+    async def _detect_model(client, *args):
+        return emulators[client.base_url.split("://", 1)[1]].model
+
+    monkeypatch.setattr("custom_components.hass_cudy_router.detect_model", _detect_model)
+
+    sockets_before = _open_sockets()
+    entries = []
+    for host in emulators:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={"protocol": "http", "host": host, "username": "admin", "password": "admin"},
+            options={"scan_interval": SCAN_INTERVAL},
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        entries.append(entry)
+    await hass.async_block_till_done()
+
+    async def poll(cycles: int) -> None:
+        nonlocal now
+        for _ in range(cycles):
+            now += timedelta(seconds=SCAN_INTERVAL)
+            async_fire_time_changed(hass, now)
+            # coordinator refreshes run as background tasks
+            await hass.async_block_till_done(wait_background_tasks=True)
+            # the test harness mocks Store writes and the mock keeps every
+            # snapshot it was called with, which would read as a leak
+            Store._async_write_data.reset_mock()
+
+    def sample() -> dict[str, int | None]:
+        gc.collect()
+        return {
+            "alloc": tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None,
+            "rss": _rss_kb(),
+            "tasks": len(asyncio.all_tasks()),
+            "sockets": _open_sockets(),
+        }
+
+    now = dt_util.utcnow()
+    # first half: event-loop lag, without tracemalloc slowing the loop down
+    lag = LagMonitor()
+    lag.start()
+    try:
+        await poll(cycles // 2)
+    finally:
+        await lag.stop()
+
+    # second half: anything still growing after warm-up is a leak. The first
+    # polls under tracemalloc only replace data allocated before tracing began.
+    tracemalloc.start()
+    try:
+        await poll(cycles // 4)
+        mid = sample()
+        await poll(cycles - cycles // 2 - cycles // 4)
+        end = sample()
+    finally:
+        tracemalloc.stop()
+
+    for entry in entries:
+        assert entry.state is ConfigEntryState.LOADED
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        assert coordinator.last_update_success, coordinator.last_exception
+
+    polls = sum(e.stats.requests for e in emulators.values())
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    # let the emulators notice the closed connections and close their ends
+    await asyncio.sleep(0.5)
+    sockets_after = _open_sockets()
+    for emulator in emulators.values():
+        await emulator.close()
+
+    growth_kb = (end["alloc"] - mid["alloc"]) / 1024
+    rss_growth_kb = end["rss"] - mid["rss"] if end["rss"] is not None else None
+    for name, value in {
+        "routers": len(entries),
+        "polls": cycles,
+        "simulated_hours": round(cycles * SCAN_INTERVAL / 3600, 1),
+        "page_requests": polls,
+        "lag_p50_ms": round(percentile(lag.samples, 50) * 1000, 1),
+        "lag_p99_ms": round(percentile(lag.samples, 99) * 1000, 1),
+        "lag_max_ms": round(max(lag.samples, default=0) * 1000, 1),
+        "traced_growth_kb": round(growth_kb, 1),
+        "rss_growth_kb": rss_growth_kb,
+        "tasks": f"{mid['tasks']} -> {end['tasks']}",
+        "sockets": f"{sockets_before} -> {mid['sockets']} -> {end['sockets']} -> {sockets_after}",
+    }.items():
+        record_property(name, value)
+
+    assert growth_kb < MAX_GROWTH_KB, f"Allocations grew {growth_kb:.0f} KB over the last quarter"
+    if rss_growth_kb is not None:
+        assert rss_growth_kb < MAX_RSS_GROWTH_KB, f"RSS grew {rss_growth_kb} KB over the last quarter"
+    assert end["tasks"] <= mid["tasks"], "Tasks keep accumulating"
+    assert percentile(lag.samples, 99) * 1000 < MAX_LAG_MS
+    if sockets_before is not None:
+        assert end["sockets"] <= mid["sockets"], "Sockets keep accumulating"
+        # every CudyClient session is closed on unload, none may be left over
+        assert sockets_after <= sockets_before, f"{sockets_after - sockets_before} socket(s) leaked"
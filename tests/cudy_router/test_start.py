@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.helpers import entity_registry as er
 
+from custom_components.hass_cudy_router.api import CudyApi
 from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.registry import skipped_modules
 
-from tests.cudy_router.fixtures import FakeClient, html_exists
+from tests.cudy_router.fixtures import FakeClient, html_exists, xhr_shell
 
 MODULES = [
     MODULE_SYSTEM,
@@ -32,50 +38,19 @@ MODULES = [
 @pytest.mark.parametrize("model", CUDY_DEVICES)
 async def test_platform_setup_creates_entities(
     hass,
-    monkeypatch,
+    setup_cudy_entry,
     model: str,
 ) -> None:
 
     fake = FakeClient(model)
 
-    async def _noop(*args, **kwargs):
-        return None
-
     async def _auth_ok(*args, **kwargs):
         return True
 
     setattr(fake, "authenticate", _auth_ok)
-    setattr(fake, "close", _noop)
-    setattr(fake, "async_close", _noop)
-
-    # Patch the integration to use FakeClient instead of real CudyClient
-    monkeypatch.setattr(
-        "custom_components.hass_cudy_router.CudyClient",
-        lambda *args, **kwargs: fake,
-    )
-
-    # Patch model detection to return the requested model
-    async def _detect_model(_client):
-        return model
-
-    monkeypatch.setattr(
-        "custom_components.hass_cudy_router.detect_model",
-        _detect_model,
-    )
 
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        title=f"Cudy Router ({model})",
-        data={
-            "protocol": "http",
-            "host": "192.168.1.1",
-            "username": "admin",
-            "password": "admin",
-        },
-    )
-    entry.add_to_hass(hass)
-
-    assert await hass.config_entries.async_setup(entry.entry_id)
+    # FakeClient instead of the real CudyClient, detection returns the requested model
+    entry = await setup_cudy_entry(fake, model)
     await hass.async_block_till_done()
 
     ent_reg = er.async_get(hass)
@@ -98,11 +73,219 @@ async def test_platform_setup_creates_entities(
             sensor_list[sensor.unique_id] = sensor
     for module in MODULES:
         data = coord.data
-        if html_exists(model, module):
+        if html_exists(model, module) and not xhr_shell(model, module):
             for submodule in SENSORS[module]:
                 entity_id = f"{uuid}_{module}_{submodule[SENSORS_KEY_KEY]}"
                 assert entity_id in sensor_list.keys()
                 sensor = sensor_list[entity_id]
                 assert sensor
         else:
-            assert module not in data
\ No newline at end of file
+            assert module not in data
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model", CUDY_DEVICES)
+async def test_setup_to_entities_time(
+    hass,
+    setup_cudy_entry,
+    record_property,
+    model: str,
+) -> None:
+    if not html_exists(model, MODULE_SYSTEM):
+        pytest.skip(f"No system page fixture for {model}")
+
+    fake = FakeClient(model)
+    requested: list[str] = []
+    original_get = fake.get
+
+    async def _get(path: str, **kwargs):
+        requested.append(path)
+        return await original_get(path, **kwargs)
+
+    async def _auth_ok(*args, **kwargs):
+        return True
+
+    setattr(fake, "get", _get)
+    setattr(fake, "authenticate", _auth_ok)
+
+    # the model is detected from the system page, as on a real setup
+    started = time.perf_counter()
+    entry = await setup_cudy_entry(fake)
+    setup_done = time.perf_counter()
+    await hass.async_block_till_done()
+    all_done = time.perf_counter()
+
+    ent_reg = er.async_get(hass)
+    entries = [e for e in ent_reg.entities.values() if e.config_entry_id == entry.entry_id]
+    assert entries
+
+    # the system page read for model detection is reused by the first refresh
+    system_path = CudyApi.luci(CAPABILITY_URLS[MODULE_SYSTEM][0])
+    assert requested.count(system_path) == 1
+    assert any(e.unique_id.startswith(f"{entry.entry_id}_{MODULE_SYSTEM}_") for e in entries)
+
+    record_property("setup_ms", round((setup_done - started) * 1000, 2))
+    record_property("entities_ms", round((all_done - started) * 1000, 2))
+
+
+@pytest.mark.asyncio
+async def test_setup_serves_snapshot_before_router_answers(
+    hass,
+    hass_storage,
+    monkeypatch,
+    setup_cudy_entry,
+) -> None:
+    model = "WR3000"
+    fake = FakeClient(model)
+    router_ready = asyncio.Event()
+    original_get = fake.get
+
+    async def _slow_get(path: str, **kwargs):
+        await router_ready.wait()
+        return await original_get(path, **kwargs)
+
+    async def _no_detection(*args, **kwargs):
+        raise AssertionError("model detection must not run with a snapshot")
+
+    setattr(fake, "get", _slow_get)
+    monkeypatch.setattr("custom_components.hass_cudy_router.detect_model", _no_detection)
+
+    entry_id = "snapshot"
+    hass_storage[f"{DOMAIN}.{entry_id}"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry_id}",
+        "data": {
+            "model": model,
+            "saved": "2026-01-01T00:00:00+00:00",
+            "data": {MODULE_SYSTEM: {SENSOR_SYSTEM_MODEL: model, SENSOR_SYSTEM_FIRMWARE_VERSION: "1.0.0"}},
+        },
+    }
+
+    entry = await setup_cudy_entry(fake, entry_id=entry_id)
+
+    ent_reg = er.async_get(hass)
+    entity_id = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{MODULE_SYSTEM}_{SENSOR_SYSTEM_FIRMWARE_VERSION}"
+    )
+    state = hass.states.get(entity_id)
+    assert state.state == "1.0.0"
+    assert state.attributes.get("stale") is True
+
+    router_ready.set()
+    await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state != "1.0.0"
+    assert "stale" not in state.attributes
+
+
+@pytest.mark.asyncio
+async def test_options_apply_without_reload(hass, monkeypatch, setup_cudy_entry) -> None:
+    model = "WR3000"
+    fake = FakeClient(model)
+    requested: list[str] = []
+    original_get = fake.get
+
+    async def _get(path: str, **kwargs):
+        requested.append(path)
+        return await original_get(path, **kwargs)
+
+    detections: list[str] = []
+
+    async def _detect_model(_client, *args):
+        detections.append(model)
+        return model
+
+    setattr(fake, "get", _get)
+    monkeypatch.setattr("custom_components.hass_cudy_router.detect_model", _detect_model)
+
+    entry = await setup_cudy_entry(fake)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    ent_reg = er.async_get(hass)
+
+    def trackers() -> list[str]:
+        return [
+            e.unique_id for e in ent_reg.entities.values()
+            if e.config_entry_id == entry.entry_id and e.domain == "device_tracker"
+        ]
+
+    devices = coordinator.data[MODULE_DEVICE_LIST]
+    tracked = devices[0][DEVICE_MAC]
+    # nothing is tracked until MACs are listed
+    assert trackers() == []
+
+    requested.clear()
+    hass.config_entries.async_update_entry(
+        entry,
+        options={CONF_SCAN_INTERVAL: 90, MODULE_DEVICE_LIST: f"00-11-22-33-44-55, {tracked.lower()}"},
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id]["coordinator"] is coordinator
+    assert coordinator.update_interval.total_seconds() == 90
+    assert trackers() == [f"{entry.entry_id}_dev_{tracked.lower().replace(':', '')}"]
+    assert requested == []
+    assert detections == [model]
+
+    # untracking removes the tracker, from the data already held
+    hass.config_entries.async_update_entry(
+        entry,
+        options={CONF_SCAN_INTERVAL: 90, MODULE_DEVICE_LIST: "00-11-22-33-44-55"},
+    )
+    await hass.async_block_till_done()
+    assert trackers() == []
+
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_SCAN_INTERVAL: 90, CONF_TRACK_ALL: True}
+    )
+    await hass.async_block_till_done()
+    assert len(trackers()) == len({d[DEVICE_MAC].lower() for d in devices})
+    assert requested == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_plan_skips_modules_with_only_disabled_entities(hass) -> None:
+    model = "WR3000"
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "192.168.1.1"})
+    entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+
+    for sd in SENSORS[MODULE_DHCP]:
+        ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{MODULE_DHCP}_{sd[SENSORS_KEY_KEY]}",
+            config_entry=entry, disabled_by=er.RegistryEntryDisabler.USER,
+        )
+    # one enabled entity keeps its module in the plan
+    for i, sd in enumerate(SENSORS[MODULE_LAN]):
+        ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{MODULE_LAN}_{sd[SENSORS_KEY_KEY]}",
+            config_entry=entry, disabled_by=er.RegistryEntryDisabler.USER if i else None,
+        )
+    # system is always polled: it names the device
+    for sd in SENSORS[MODULE_SYSTEM]:
+        ent_reg.async_get_or_create(
+            "sensor", DOMAIN, f"{entry.entry_id}_{MODULE_SYSTEM}_{sd[SENSORS_KEY_KEY]}",
+            config_entry=entry, disabled_by=er.RegistryEntryDisabler.USER,
+        )
+
+    assert skipped_modules(hass, entry) == {MODULE_DHCP}
+
+    fake = FakeClient(model)
+    requested: list[str] = []
+    original_get = fake.get
+
+    async def _get(path: str, **kwargs):
+        requested.append(path)
+        return await original_get(path, **kwargs)
+
+    setattr(fake, "get", _get)
+    api = CudyApi(fake, model)
+    api.skipped_modules = skipped_modules(hass, entry)
+
+    data = await api.get_data()
+
+    assert MODULE_DHCP not in data
+    assert MODULE_LAN in data
+    assert CudyApi.luci(CAPABILITY_URLS[MODULE_DHCP][0]) not in requested
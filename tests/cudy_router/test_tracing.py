@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.core.client import CudyClient
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from custom_components.hass_cudy_router.core.tracing import PollTracer
+from tests.cudy_router.emulator import RouterEmulator
+
+MODEL = "WR3000"
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = PollTracer()
+
+    tracer.begin()
+    with tracer.span("parse", MODULE_SYSTEM):
+        pass
+    tracer.finish()
+
+    assert not tracer.active
+    assert list(tracer.traces) == []
+
+
+def test_tracer_keeps_the_last_polls():
+    tracer = PollTracer(enabled=True, max_traces=2)
+
+    for poll in range(3):
+        tracer.begin()
+        with tracer.module(MODULE_LAN), tracer.span("parse", poll=poll):
+            pass
+        tracer.finish(error="boom" if poll == 2 else None)
+
+    assert [t["spans"][0]["poll"] for t in tracer.traces] == [1, 2]
+    assert tracer.traces[-1]["error"] == "boom"
+    assert tracer.traces[0]["spans"][0]["module"] == MODULE_LAN
+
+
+@pytest.mark.asyncio
+async def test_poll_is_traced_from_login_to_dispatch(hass, socket_enabled):
+    async with RouterEmulator(MODEL, seed=1) as emulator:
+        client = CudyClient(emulator.host, "admin", "admin")
+        tracer = PollTracer(enabled=True)
+        client.tracer = tracer
+        entry = MockConfigEntry(domain=DOMAIN, data={"host": emulator.host}, options={})
+        entry.add_to_hass(hass)
+        coordinator = CudyCoordinator(
+            hass, entry, CudyApi(client, MODEL, tracer=tracer), model=MODEL, tracer=tracer
+        )
+        unsub = coordinator.async_add_listener(lambda: None)
+        try:
+            await coordinator.async_refresh()
+        finally:
+            unsub()
+            await client.async_close()
+
+    assert len(tracer.traces) == 1
+    spans = tracer.traces[0]["spans"]
+    names = {span["name"] for span in spans}
+    assert {"login", "request", "parse", "dispatch"} <= names
+
+    system_request = next(
+        s for s in spans if s["name"] == "request" and s["module"] == MODULE_SYSTEM
+    )
+    assert system_request["status"] == 200
+    for phase in ("dns_ms", "connect_ms", "ttfb_ms", "body_ms"):
+        assert system_request[phase] >= 0
+    assert any(s["name"] == "parse" and s["module"] == MODULE_SYSTEM for s in spans)
+    assert spans[-1]["name"] == "dispatch"
+    assert spans[-1]["listeners"] == 1
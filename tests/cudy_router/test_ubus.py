@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.core.client import CudyClient
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.ubus import map_ubus_results, ubus_calls
+from tests.cudy_router.fixtures import html_exists, read_html
+
+MODEL = "WR3000"
+SYSAUTH = "0123456789abcdef0123456789abcdef"
+
+LOGIN_HTML = """
+<form method="post">
+<input type="hidden" name="token" value="tok"/>
+<input type="hidden" name="salt" value="salt"/>
+</form>
+"""
+
+LAN_STATUS = {
+    "up": True,
+    "proto": "static",
+    "l3_device": "br-lan",
+    "ipv4-address": [{"address": "192.168.10.1", "mask": 24}],
+}
+
+UBUS_RESULTS: dict[tuple[str, str], Any] = {
+    ("system", "board"): {"model": "Cudy WR3000 v1", "release": {"version": "21.02"}},
+    ("system", "info"): {"uptime": 63352, "localtime": 1748336866},
+    ("network.interface.lan", "status"): LAN_STATUS,
+    ("luci-rpc", "getNetworkDevices"): {"br-lan": {"mac": "80:af:ca:73:41:b8"}},
+    ("uci", "get"): {"values": {"start": "10", "limit": "241", "leasetime": "120m"}},
+    ("iwinfo", "info"): {
+        "ssid": "Cudy-41B8",
+        "bssid": "80:AF:CA:73:41:B8",
+        "channel": 9,
+        "encryption": {"description": "WPA-PSK/WPA2-PSK"},
+    },
+}
+
+
+class UbusRouter:
+    """Minimal LuCI stand-in: login form, module pages and a /ubus endpoint."""
+
+    def __init__(self, model: str) -> None:
+        self.requests: list[str] = []
+        self.batches: list[list[dict[str, Any]]] = []
+        self.pages: dict[str, str] = {}
+        for module, urls in CAPABILITY_URLS.items():
+            if html_exists(model, module):
+                self.pages[CudyApi.luci(urls[0])] = read_html(model, f"{module}.html")
+
+        self.app = web.Application()
+        self.app.router.add_get("/cgi-bin/luci", self._login_page)
+        self.app.router.add_post("/cgi-bin/luci", self._login)
+        self.app.router.add_post("/ubus", self._ubus)
+        self.app.router.add_get("/cgi-bin/luci/{tail:.*}", self._page)
+
+    async def _login_page(self, request: web.Request) -> web.Response:
+        return web.Response(text=LOGIN_HTML, content_type="text/html")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        resp = web.Response(status=302, headers={"Location": "/cgi-bin/luci/admin"})
+        resp.set_cookie("sysauth", SYSAUTH, path="/cgi-bin/luci")
+        return resp
+
+    async def _page(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path_qs)
+        html = self.pages.get(request.path_qs)
+        if html is None:
+            return web.Response(status=404)
+        return web.Response(text=html, content_type="text/html")
+
+    async def _ubus(self, request: web.Request) -> web.Response:
+        batch = await request.json()
+        self.batches.append(batch)
+        out = []
+        for call in batch:
+            session, obj, method, _args = call["params"]
+            if session != SYSAUTH:
+                out.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32002, "message": "Access denied"}})
+                continue
+            result = UBUS_RESULTS.get((obj, method))
+            out.append(
+                {"jsonrpc": "2.0", "id": call["id"], "result": [0, result] if result is not None else [4]}
+            )
+        return web.json_response(out)
+
+
+@pytest.fixture
+async def router(socket_enabled):
+    stand_in = UbusRouter(MODEL)
+    server = TestServer(stand_in.app, host="127.0.0.1")
+    await server.start_server()
+    stand_in.host = f"127.0.0.1:{server.port}"
+    yield stand_in
+    await server.close()
+
+
+def test_map_ubus_results_marks_failed_calls():
+    modules = [MODULE_LAN, MODULE_WIRELESS_24G]
+    calls = ubus_calls(modules)
+    results = [LAN_STATUS, None, UBUS_RESULTS[("iwinfo", "info")]]
+
+    mapped = map_ubus_results(modules, results)
+
+    assert len(calls) == 3
+    assert mapped[MODULE_LAN] is None
+    assert mapped[MODULE_WIRELESS_24G][SENSOR_24G_WIFI_CHANNEL] == 9
+
+
+@pytest.mark.asyncio
+async def test_ubus_batch(router: UbusRouter):
+    client = CudyClient(router.host, "admin", "admin", use_ubus=True, reuse_window=0)
+    try:
+        results = await client.ubus_batch(
+            [("system", "board", {}), ("network.interface.wan", "status", {})]
+        )
+    finally:
+        await client.async_close()
+
+    assert results[0]["model"] == "Cudy WR3000 v1"
+    assert results[1] is None
+    assert len(router.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_api_switches_matching_modules_to_ubus(router: UbusRouter):
+    client = CudyClient(router.host, "admin", "admin", use_ubus=True, reuse_window=0)
+    api = CudyApi(client, MODEL)
+    try:
+        first = await api.get_data()
+        router.requests.clear()
+        router.batches.clear()
+        second = await api.get_data()
+    finally:
+        await client.async_close()
+
+    assert api.ubus_modules == {MODULE_LAN, MODULE_DHCP, MODULE_WIRELESS_24G}
+    assert len(router.batches) == 1
+    for module in api.ubus_modules:
+        assert CudyApi.luci(CAPABILITY_URLS[module][0]) not in router.requests
+        assert second[module] == first[module]
+    # firmware and hardware are not available through ubus
+    assert CudyApi.luci(CAPABILITY_URLS[MODULE_SYSTEM][0]) in router.requests
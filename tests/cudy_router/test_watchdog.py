@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import logging
+import time
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_cudy_router.api import CudyApi
+from custom_components.hass_cudy_router.const import *
+from custom_components.hass_cudy_router.coordinator import CudyCoordinator
+from custom_components.hass_cudy_router.watchdog import LoopWatchdog, watch
+from tests.cudy_router.fixtures import FakeClient
+
+MODEL = "WR3000"
+
+
+def test_disabled_watchdog_records_nothing():
+    watchdog = LoopWatchdog(MODEL)
+
+    with watchdog.section("parse", MODULE_SYSTEM):
+        pass
+
+    assert watchdog.as_dict()["histograms"] == {}
+
+
+def test_sections_fill_histogram_and_log_slow_ones(caplog):
+    watchdog = LoopWatchdog(MODEL, enabled=True, threshold_ms=50)
+
+    watchdog.observe("parse", MODULE_LAN, 0.4)
+    watchdog.observe("parse", MODULE_LAN, 7)
+    with caplog.at_level(logging.WARNING):
+        watchdog.observe("parse", MODULE_DEVICE_LIST, 120)
+        watchdog.observe("dispatch", None, 2000)
+
+    parse = watchdog.as_dict()["histograms"]["parse"]
+    assert parse["count"] == 3
+    assert parse["max_ms"] == 120
+    assert parse["buckets"]["le_1ms"] == 1
+    assert parse["buckets"]["le_10ms"] == 1
+    assert parse["buckets"]["le_250ms"] == 1
+    assert watchdog.as_dict()["histograms"]["dispatch"]["buckets"]["inf"] == 1
+    assert [(s["kind"], s["module"]) for s in watchdog.slow] == [
+        ("parse", MODULE_DEVICE_LIST),
+        ("dispatch", None),
+    ]
+    assert f"{MODEL} blocked the event loop for 120.0 ms in parse (module {MODULE_DEVICE_LIST})" in caplog.text
+
+
+def test_watch_without_watchdog_is_a_noop():
+    class Owner:
+        pass
+
+    with watch(Owner(), "attributes"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_poll_sections_are_timed(hass, caplog):
+    entry = MockConfigEntry(domain=DOMAIN, data={"host": "192.168.1.1"}, options={})
+    entry.add_to_hass(hass)
+    watchdog = LoopWatchdog(MODEL, enabled=True)
+    coordinator = CudyCoordinator(
+        hass, entry, CudyApi(FakeClient(MODEL), MODEL, watchdog=watchdog), model=MODEL, watchdog=watchdog
+    )
+
+    def slow_listener() -> None:
+        with watch(coordinator, "attributes", MODULE_SYSTEM):
+            time.sleep(0.06)
+
+    unsub = coordinator.async_add_listener(slow_listener)
+    try:
+        with caplog.at_level(logging.WARNING):
+            await coordinator.async_refresh()
+    finally:
+        unsub()
+
+    histograms = watchdog.as_dict()["histograms"]
+    assert histograms["parse"]["count"] >= 1
+    assert histograms["dispatch"]["count"] == 1
+    assert histograms["attributes"]["count"] == 1
+    assert {s["kind"] for s in watchdog.slow} >= {"attributes", "dispatch"}
+    assert f"in attributes (module {MODULE_SYSTEM})" in caplog.text
+
+    coordinator.async_apply_options({})
+    assert not watchdog.enabled